@@ -0,0 +1,57 @@
+import time
+from collections import deque
+
+
+class AnimationClock:
+    """Drive animation time from a monotonic clock instead of timer ticks.
+
+    ``tick()`` returns the wall-clock time since ``start()``, so playback
+    runs at real speed however long each frame takes to draw. When drawing
+    lags, the frames that should have been shown in between are skipped
+    (counted in ``skipped``); ticks arriving sooner than half a frame after
+    the previous one are coalesced and return None.
+    """
+
+    def __init__(self, fps=60, window=30):
+        self.target_fps = fps
+        self.frame_interval = 1 / fps
+        self._frame_stamps = deque(maxlen=window)
+        self._start = None
+        self.frames = 0
+        self.skipped = 0
+        self.coalesced = 0
+
+    def start(self):
+        """Restart animation time at zero and clear the statistics"""
+        self._start = time.perf_counter()
+        self._frame_stamps.clear()
+        self.frames = self.skipped = self.coalesced = 0
+
+    def tick(self):
+        """Animation time for the frame to draw now, or None to skip this tick"""
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now
+
+        if self._frame_stamps:
+            elapsed_frames = (now - self._frame_stamps[-1]) / self.frame_interval
+            if elapsed_frames < 0.5:
+                self.coalesced += 1
+                return None
+            self.skipped += max(int(round(elapsed_frames)) - 1, 0)
+
+        self._frame_stamps.append(now)
+        self.frames += 1
+        return now - self._start
+
+    @property
+    def achieved_fps(self):
+        """Frame rate over the last ``window`` drawn frames"""
+        if len(self._frame_stamps) < 2:
+            return 0.0
+        span = self._frame_stamps[-1] - self._frame_stamps[0]
+        return (len(self._frame_stamps) - 1) / span if span > 0 else 0.0
+
+    def status(self):
+        return (f"{self.achieved_fps:.0f} / {self.target_fps} fps, "
+                f"{self.skipped} frames skipped")
@@ -0,0 +1,57 @@
+class BlitManager:
+    """Redraw only the animated artists of a canvas over a cached background.
+
+    The static parts of the figure (axes, ticks, grids, legends) are rendered
+    once by a full ``canvas.draw()``; the resulting pixels are cached on every
+    ``draw_event`` and each frame restores them and draws just the artists
+    registered here.
+    """
+
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self._background = None
+        self._artists = []
+
+        for artist in animated_artists:
+            self.add_artist(artist)
+
+        # Re-cache the background whenever the canvas does a full draw
+        # (first show, resize, limit changes)
+        self._draw_cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """Cache the freshly drawn background and paint the animated artists"""
+        if event is not None and event.canvas != self.canvas:
+            raise RuntimeError("BlitManager received a draw event from another canvas")
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def add_artist(self, artist):
+        """Register an artist to be redrawn on every frame"""
+        if artist.figure != self.canvas.figure:
+            raise RuntimeError("Animated artist does not belong to this canvas")
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def _draw_animated(self):
+        figure = self.canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Blit one frame, falling back to a full draw if nothing is cached"""
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def invalidate(self):
+        """Force a full redraw, e.g. after axis limits have changed"""
+        self._background = None
+        self.canvas.draw()
+
+    def disconnect(self):
+        """Stop listening to the canvas draw events"""
+        self.canvas.mpl_disconnect(self._draw_cid)
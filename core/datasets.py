@@ -0,0 +1,199 @@
+import hashlib
+import io
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+# Numeric (x, y) datasets too large to hold as Python objects.
+#
+# Files are memory-mapped, so the operating system pages rows in as they
+# are read and the data never has to fit in memory at once:
+#
+# - .npy files directly (2-D, one column per variable),
+# - raw little-endian float files (.f64, .bin, .dat as float64, .f32 as
+#   float32) as rows of ``columns`` values,
+# - CSV and other delimited text, parsed once block by block into a
+#   float64 .npy cache in the temp directory (keyed by the file's absolute
+#   path, size and modification time) and mapped from there. Caches take
+#   rows × columns × 8 bytes and are not removed automatically.
+#
+# Everything downstream reads a Dataset through ``chunks()``: fixed-size
+# float64 blocks of x and y with incomplete rows dropped.
+
+CHUNK_ROWS = 1_000_000
+RAW_DTYPES = {'.f64': np.float64, '.bin': np.float64, '.dat': np.float64, '.f32': np.float32}
+TEXT_EXTENSIONS = ('.csv', '.tsv', '.txt')
+FILE_FILTER = "Data files (*.csv *.tsv *.txt *.npy *.f64 *.f32 *.bin *.dat);;All files (*)"
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'createUI-datasets')
+
+_BLOCK_BYTES = 32 * 2 ** 20
+
+
+class Dataset:
+    """Two columns of a (possibly memory-mapped) 2-D array, read in chunks"""
+
+    def __init__(self, array, name='', x_column=0, y_column=1):
+        if not isinstance(array, np.ndarray):
+            array = np.asarray(array, dtype=float)
+        if array.ndim != 2 or array.shape[1] < 2:
+            raise ValueError(f"Expected rows of at least 2 columns, got shape {array.shape}")
+        self.array = array
+        self.name = name
+        self.x = array[:, x_column]
+        self.y = array[:, y_column]
+        self.cache = None  # The .npy file a text file was converted to
+        self._bounds = None
+
+    @classmethod
+    def from_points(cls, x, y, name='points'):
+        return cls(np.column_stack([np.asarray(x, dtype=float), np.asarray(y, dtype=float)]), name)
+
+    def __len__(self):
+        return len(self.array)
+
+    def chunks(self, size=CHUNK_ROWS):
+        """Yield (x, y) float64 blocks of up to ``size`` rows, non-finite rows dropped"""
+        for start in range(0, len(self.array), size):
+            x = np.asarray(self.x[start:start + size], dtype=float)
+            y = np.asarray(self.y[start:start + size], dtype=float)
+            finite = np.isfinite(x) & np.isfinite(y)
+            if not finite.all():
+                x, y = x[finite], y[finite]
+            if len(x):
+                yield x, y
+
+    def bounds(self):
+        """(count, x_min, x_max, y_min, y_max) over the finite rows (cached)"""
+        if self._bounds is None:
+            count, lows, highs = 0, np.full(2, np.inf), np.full(2, -np.inf)
+            for x, y in self.chunks():
+                count += len(x)
+                lows = np.minimum(lows, (x.min(), y.min()))
+                highs = np.maximum(highs, (x.max(), y.max()))
+            self._bounds = (count, lows[0], highs[0], lows[1], highs[1])
+        return self._bounds
+
+
+def _cache_path(path):
+    """Cache file of a text file, unique to its absolute path, size and mtime (ns)"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    digest = hashlib.sha256(path.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    name = f"{os.path.basename(path)}-{digest}-{stat.st_size}-{stat.st_mtime_ns}.npy"
+    return os.path.join(CACHE_DIR, name)
+
+
+def _sniff(line):
+    """Delimiter (None for whitespace) and column count of a data line"""
+    text = line.decode('utf-8', 'replace').strip()
+    for delimiter in (',', ';', '\t'):
+        if delimiter in text:
+            return delimiter, len(text.split(delimiter))
+    return None, len(text.split())
+
+
+def _is_numeric(line, delimiter):
+    try:
+        np.loadtxt(io.BytesIO(line), delimiter=delimiter, ndmin=2)
+        return True
+    except ValueError:
+        return False
+
+
+def _parse_block(block, delimiter, columns):
+    """Rows of a block of text lines; empty or invalid fields become NaN"""
+    try:
+        return np.loadtxt(io.BytesIO(block), delimiter=delimiter, ndmin=2, usecols=range(columns))
+    except ValueError:
+        # The slow path, only for blocks with gaps
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            values = np.genfromtxt(io.BytesIO(block), delimiter=delimiter, usecols=range(columns),
+                                   invalid_raise=False)
+        return values.reshape(-1, columns)
+
+
+def convert_text(path, target, progress=None):
+    """Parse a delimited text file into a float64 .npy file at ``target``
+
+    A first line that is not numeric is taken as a header; empty fields
+    are stored as NaN (and skipped by Dataset.chunks). The file is
+    read through a memory map in blocks of whole lines; ``progress`` is
+    called with the fraction done and may return False to cancel, in which
+    case nothing is written and False is returned.
+    """
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    head = bytes(raw[:65536])
+    lines = head.splitlines(keepends=True)
+    if not lines:
+        raise ValueError("The file is empty")
+    delimiter, columns = _sniff(lines[1] if len(lines) > 1 else lines[0])
+    start = 0 if _is_numeric(lines[0], delimiter) else len(lines[0])
+
+    # Row count from the line breaks, for the size of the output
+    rows = 0
+    for offset in range(start, len(raw), _BLOCK_BYTES):
+        rows += int(np.count_nonzero(raw[offset:offset + _BLOCK_BYTES] == ord('\n')))
+    if len(raw) and raw[-1] != ord('\n'):
+        rows += 1
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    partial = target + '.part'
+    out = np.lib.format.open_memmap(partial, mode='w+', dtype=np.float64, shape=(rows, columns))
+    row, offset = 0, start
+    try:
+        while offset < len(raw):
+            end = min(offset + _BLOCK_BYTES, len(raw))
+            if end < len(raw):
+                # Extend to the end of the last complete line in the block
+                end = offset + int(np.flatnonzero(raw[offset:end] == ord('\n'))[-1]) + 1
+            values = _parse_block(bytes(raw[offset:end]), delimiter, columns)
+            out[row:row + len(values)] = values
+            row += len(values)
+            offset = end
+            if progress is not None and progress(offset / len(raw)) is False:
+                del out
+                os.remove(partial)
+                return False
+        out[row:] = np.nan  # Blank lines were counted as rows
+        out.flush()
+        del out
+        os.replace(partial, target)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return True
+
+
+def load_dataset(path, columns=2, progress=None):
+    """Memory-mapped Dataset of the first two columns of a data file
+
+    ``columns`` is the number of values per row of raw float files. Text
+    files are converted to a cached .npy file first (see convert_text);
+    returns None if ``progress`` cancels that.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    name = os.path.basename(path)
+    if extension == '.npy':
+        array = np.load(path, mmap_mode='r')
+        if array.ndim == 2 and array.shape[0] == 2 and array.shape[1] > 2:
+            array = array.T  # One row per variable
+    elif extension in RAW_DTYPES:
+        array = np.memmap(path, dtype=np.dtype(RAW_DTYPES[extension]).newbyteorder('<'), mode='r')
+        if array.size % columns:
+            raise ValueError(f"{name} holds {array.size} values, not rows of {columns}")
+        array = array.reshape(-1, columns)
+    elif extension in TEXT_EXTENSIONS:
+        cache = _cache_path(path)
+        if not os.path.exists(cache) and not convert_text(path, cache, progress):
+            return None
+        array = np.load(cache, mmap_mode='r')
+    else:
+        raise ValueError(f"Unknown data file type: {extension or name}")
+    dataset = Dataset(array, name)
+    if extension in TEXT_EXTENSIONS:
+        dataset.cache = cache
+    return dataset
@@ -0,0 +1,200 @@
+import numpy as np
+
+# Display decimation for long sampled series.
+#
+# A line with far more points than the axes has pixels draws slowly and
+# shows nothing extra. Series are reduced to about two points per pixel
+# column of the target axes, over the visible x-range only:
+#
+# - min/max envelope: the smallest and largest sample of each bucket, in
+#   their original order, so the line covers exactly the same vertical
+#   extent per pixel column as the full one (spikes and noise bands stay).
+# - LTTB (largest triangle three buckets): one sample per bucket chosen to
+#   preserve the visual shape; smoother for slowly varying data.
+#
+# LineDecimator keeps a Line2D decimated as the axes are zoomed, panned or
+# resized.
+#
+# Scatter data has no order to bucket along, so scatter_cells keeps one
+# point per occupied cell of a grid about the size of the axes in pixels:
+# the picture (including isolated outliers) is the same as drawing every
+# point, for any number of points.
+
+
+def visible_range(x, x_range=None):
+    """Index slice of the sorted ``x`` covering ``x_range`` (plus one sample either side)"""
+    if x_range is None:
+        return slice(0, len(x))
+    lo, hi = np.searchsorted(x, x_range)
+    return slice(max(lo - 1, 0), min(hi + 1, len(x)))
+
+
+def minmax_envelope(x, y, n_buckets=2000, x_range=None):
+    """Min/max decimation of ``y`` over sorted ``x`` to about 2·n_buckets points
+
+    Only the part inside ``x_range`` is decimated when given. Series that are
+    already short enough are returned unchanged (as views).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    view = visible_range(x, x_range)
+    x, y = x[view], y[view]
+    n = len(y)
+    if n <= 2 * n_buckets:
+        return x, y
+
+    # Equal buckets over the leading part; the (shorter) remainder is one more
+    size = -(-n // n_buckets)
+    whole = size * (n // size)
+    blocks = y[:whole].reshape(-1, size)
+    offsets = np.arange(0, whole, size)
+    lows = offsets + blocks.argmin(axis=1)
+    highs = offsets + blocks.argmax(axis=1)
+    if whole < n:
+        tail = y[whole:]
+        lows = np.append(lows, whole + tail.argmin())
+        highs = np.append(highs, whole + tail.argmax())
+
+    # Keep each bucket's two samples in time order
+    first, second = np.minimum(lows, highs), np.maximum(lows, highs)
+    index = np.column_stack([first, second]).ravel()
+    return x[index], y[index]
+
+
+def lttb(x, y, n_out=2000, x_range=None):
+    """Largest-triangle-three-buckets downsampling to ``n_out`` points
+
+    The first and last samples are kept; every bucket in between keeps the
+    sample forming the largest triangle with the previously kept sample
+    and the mean of the next bucket.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    view = visible_range(x, x_range)
+    x, y = x[view], y[view]
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf, yf = x.astype(float), y.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Mean of every bucket, then the "next bucket" point for each bucket
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(xf[1:n - 1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(yf[1:n - 1], edges[:-1] - 1) / counts
+    next_x = np.append(mean_x[1:], xf[-1])
+    next_y = np.append(mean_y[1:], yf[-1])
+
+    index = np.empty(n_out, dtype=np.int64)
+    index[0], index[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((xf[a] - next_x[i]) * (yf[lo:hi] - yf[a])
+                      - (xf[a] - xf[lo:hi]) * (next_y[i] - yf[a]))
+        a = lo + int(area.argmax())
+        index[i + 1] = a
+    return x[index], y[index]
+
+
+DECIMATION_METHODS = ('minmax', 'lttb')
+
+
+def decimate(x, y, n_points=2000, method='minmax', x_range=None):
+    """Reduce a series to about ``n_points`` over ``x_range`` with either method"""
+    if method == 'minmax':
+        return minmax_envelope(x, y, max(n_points // 2, 1), x_range)
+    if method == 'lttb':
+        return lttb(x, y, n_points, x_range)
+    raise ValueError(f"Unknown decimation method: {method}")
+
+
+def band_envelope(x, lower, upper, n_buckets=2000, x_range=None):
+    """Decimated band between two series for fill_between
+
+    Each bucket contributes its first and last x with the bucket's lowest
+    ``lower`` and highest ``upper``, so the filled band never shrinks.
+    """
+    x, lower, upper = np.asarray(x), np.asarray(lower), np.asarray(upper)
+    view = visible_range(x, x_range)
+    x, lower, upper = x[view], lower[view], upper[view]
+    n = len(x)
+    if n <= 2 * n_buckets:
+        return x, lower, upper
+    starts = np.arange(0, n, -(-n // n_buckets))
+    ends = np.append(starts[1:], n) - 1
+    low = np.minimum.reduceat(lower, starts)
+    high = np.maximum.reduceat(upper, starts)
+    edges = np.column_stack([starts, ends]).ravel()
+    return x[edges], np.repeat(low, 2), np.repeat(high, 2)
+
+
+def scatter_cells(chunks, x_range, y_range, shape=(800, 600)):
+    """The first point falling in each occupied cell of a grid over the ranges
+
+    ``chunks`` is an iterable of (x, y) array pairs, so the points never
+    have to be in memory together; points outside the ranges are dropped.
+    Returns (x, y) with at most shape[0]·shape[1] points.
+    """
+    columns, rows = shape
+    (x0, x1), (y0, y1) = x_range, y_range
+    x_scale = columns / (x1 - x0) if x1 > x0 else 0.0
+    y_scale = rows / (y1 - y0) if y1 > y0 else 0.0
+    occupied = np.zeros(columns * rows, dtype=bool)
+    kept_x, kept_y = [], []
+    for x, y in chunks:
+        i = ((x - x0) * x_scale).astype(np.int64)
+        j = ((y - y0) * y_scale).astype(np.int64)
+        # The top and right edges belong to the last cell
+        i[x == x1], j[y == y1] = columns - 1, rows - 1
+        inside = (i >= 0) & (i < columns) & (j >= 0) & (j < rows)
+        cells = i[inside] * rows + j[inside]
+        cells, first = np.unique(cells, return_index=True)
+        new = ~occupied[cells]
+        occupied[cells[new]] = True
+        kept_x.append(x[inside][first[new]])
+        kept_y.append(y[inside][first[new]])
+    if not kept_x:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(kept_x), np.concatenate(kept_y)
+
+
+def points_for(ax, points_per_pixel=2):
+    """Point budget for a series drawn across ``ax``"""
+    return max(int(ax.bbox.width * points_per_pixel), 100)
+
+
+class LineDecimator:
+    """Keep ``line`` showing a decimated view of a long (sorted-x) series
+
+    The full data lives here; the line gets about ``points_per_pixel``
+    points per pixel of the axes width for the visible x-range, recomputed
+    whenever the x-limits change (zoom, pan, autoscale) or the canvas is
+    resized.
+    """
+
+    def __init__(self, line, x=(), y=(), method='minmax', points_per_pixel=2):
+        if method not in DECIMATION_METHODS:
+            raise ValueError(f"Unknown decimation method: {method}")
+        self.line = line
+        self.ax = line.axes
+        self.method = method
+        self.points_per_pixel = points_per_pixel
+        self.x, self.y = np.asarray(x), np.asarray(y)
+        self._xlim_cid = self.ax.callbacks.connect('xlim_changed', self.refresh)
+        self._resize_cid = self.ax.figure.canvas.mpl_connect('resize_event', self.refresh)
+        self.refresh()
+
+    def set_data(self, x, y):
+        """Replace the full series and redraw the decimated view"""
+        self.x, self.y = np.asarray(x), np.asarray(y)
+        self.refresh()
+
+    def refresh(self, *_):
+        if not len(self.x):
+            self.line.set_data([], [])
+            return
+        self.line.set_data(*decimate(self.x, self.y, points_for(self.ax, self.points_per_pixel),
+                                     self.method, self.ax.get_xlim()))
+
+    def disconnect(self):
+        self.ax.callbacks.disconnect(self._xlim_cid)
+        self.ax.figure.canvas.mpl_disconnect(self._resize_cid)
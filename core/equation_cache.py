@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QLabel, QSizePolicy
+
+# Rendered equations for formula displays.
+#
+# Laying out mathtext is one of the slowest things matplotlib does, and a
+# formula display shows the same few strings again and again (a slider
+# moving back and forth). Equations are rasterized once with Agg into a
+# tightly cropped pixmap and kept in an LRU cache keyed by the exact text
+# and style; showing a cached equation is just a QLabel pixmap swap.
+
+
+_stages = {}
+
+
+def _stage(dpi):
+    """Reusable transparent Agg figure with one centred text artist per dpi"""
+    if dpi not in _stages:
+        figure = Figure(figsize=(8, 3), dpi=dpi)
+        figure.patch.set_alpha(0)
+        canvas = FigureCanvasAgg(figure)
+        artist = figure.text(0.5, 0.5, '', horizontalalignment='center',
+                             verticalalignment='center', multialignment='center')
+        _stages[dpi] = (figure, canvas, artist)
+    return _stages[dpi]
+
+
+def render_equation(text, fontsize=12, color='black', dpi=100):
+    """Rasterize (math)text, centred line by line, to a cropped RGBA array
+
+    The text is drawn once on a reused figure (so matplotlib's layout
+    caches stay warm) and cropped to its extent; the figure only grows
+    when a text does not fit.
+    """
+    figure, canvas, artist = _stage(dpi)
+    artist.set(text=text, fontsize=fontsize, color=color)
+    canvas.draw()
+    extent = artist.get_window_extent()
+    pad = 2 * int(np.ceil(dpi / 100))
+    width, height = canvas.get_width_height()
+    if extent.width + 2 * pad > width or extent.height + 2 * pad > height:
+        figure.set_size_inches(max(width, extent.width * 1.5) / dpi,
+                               max(height, extent.height * 1.5) / dpi)
+        return render_equation(text, fontsize, color, dpi)
+
+    # Buffer rows run top to bottom, display y bottom to top
+    rgba = np.asarray(canvas.buffer_rgba())
+    left, right = int(extent.x0) - pad, int(np.ceil(extent.x1)) + pad
+    top, bottom = height - int(np.ceil(extent.y1)) - pad, height - int(extent.y0) + pad
+    return rgba[max(top, 0):bottom, max(left, 0):right].copy()
+
+
+class EquationCache:
+    """Least-recently-used cache of rendered equations as QPixmaps
+
+    Keyed by (text, fontsize, color, scale), where ``scale`` is the device
+    pixel ratio of the screen showing it.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._pixmaps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def pixmap(self, text, fontsize=12, color='black', scale=1.0):
+        key = (text, fontsize, color, scale)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        rgba = render_equation(text, fontsize, color, dpi=100 * scale)
+        height, width = rgba.shape[:2]
+        image = QImage(rgba.data, width, height, rgba.strides[0], QImage.Format.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(image)  # Copies the pixels
+        pixmap.setDevicePixelRatio(scale)
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.maxsize:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self._pixmaps.clear()
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+
+# Shared by every formula display
+equation_cache = EquationCache()
+
+
+class EquationLabel(QLabel):
+    """Centred label showing a rendered equation from an EquationCache
+
+    The label has a fixed height and ignores the width of its pixmap when
+    laid out, so a new equation never triggers a relayout of the
+    surrounding window.
+    """
+
+    def __init__(self, fontsize=12, color='black', height=150, cache=None, parent=None):
+        super().__init__(parent)
+        self.fontsize = fontsize
+        self.color = color
+        self.cache = cache if cache is not None else equation_cache
+        self.equation = None
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+        self.setFixedHeight(height)
+
+    def set_equation(self, text):
+        """Show ``text`` (mathtext), rendering it only if it is not cached"""
+        if text == self.equation:
+            return
+        self.equation = text
+        self.setPixmap(self.cache.pixmap(text, self.fontsize, self.color,
+                                         self.devicePixelRatioF()))
@@ -0,0 +1,360 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# Safe math expressions in x, compiled to vectorized NumPy callables.
+#
+# Text is tokenized and parsed by a small recursive-descent parser into a
+# tree of tuples; nothing the user types reaches Python's eval. The tree
+# is then turned into
+#
+# - Python source over whitelisted NumPy functions, compiled once, so
+#   calling the expression costs only the array math, and
+# - LaTeX for display.
+#
+# Accepted notation follows what people write by hand: implicit
+# multiplication (2x, 3sin(x), 2(x + 1)), ^ or ** for powers, superscript
+# digits (x², x⁻¹), √x, |x|, π, and e^x. Numbers may use scientific
+# notation, so 1e-3x is 0.001·x (write 1e^(-3)x or 1·e^-3 x for the
+# constant). Two numbers in a row (2 3, 2.5.3) are rejected rather than
+# multiplied. Compiled expressions are cached by their normalized text.
+#
+# Tree nodes: ('num', value), ('x',), ('const', name), ('neg', a),
+# ('add' | 'sub' | 'div' | 'pow', a, b), ('mul', a, b, implicit),
+# ('call', name, a).
+
+
+class ExpressionError(ValueError):
+    """Raised for text that is not a valid expression"""
+
+
+# name: (NumPy function, LaTeX command)
+FUNCTIONS = {
+    'sin': ('np.sin', r'\sin'),
+    'cos': ('np.cos', r'\cos'),
+    'tan': ('np.tan', r'\tan'),
+    'asin': ('np.arcsin', r'\arcsin'),
+    'acos': ('np.arccos', r'\arccos'),
+    'atan': ('np.arctan', r'\arctan'),
+    'sinh': ('np.sinh', r'\sinh'),
+    'cosh': ('np.cosh', r'\cosh'),
+    'tanh': ('np.tanh', r'\tanh'),
+    'exp': ('np.exp', None),
+    'ln': ('np.log', r'\ln'),
+    'log': ('np.log10', r'\log_{10}'),
+    'sqrt': ('np.sqrt', None),
+    'abs': ('np.abs', None),
+}
+FUNCTIONS.update(arcsin=FUNCTIONS['asin'], arccos=FUNCTIONS['acos'], arctan=FUNCTIONS['atan'])
+CONSTANTS = {'pi': ('np.pi', r'\pi'), 'e': ('np.e', 'e')}
+
+# Parser levels entered while nesting (a bracket, function call, sign or
+# exponent each adds about two), well inside Python's recursion limit
+MAX_DEPTH = 200
+
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻', '0123456789-')
+_REPLACEMENTS = str.maketrans({'−': '-', '×': '*', '·': '*', '÷': '/', 'π': ' pi '})
+
+# Longest names first, so 'sinh' wins over 'sin' and 'exp' over 'e'
+_NAMES = sorted([*FUNCTIONS, *CONSTANTS, 'x'], key=len, reverse=True)
+_TOKEN = re.compile(r'\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|({})|(\*\*|[-+*/^()|√])|([⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+))'
+                    .format('|'.join(_NAMES)))
+
+
+def normalize(text):
+    """Canonical spelling of an expression: unicode operators mapped, spaces collapsed"""
+    return re.sub(r'\s+', ' ', str(text).translate(_REPLACEMENTS)).strip()
+
+
+def tokenize(text):
+    """List of (kind, value) tokens; kind is 'num', 'name', 'op' or 'sup'"""
+    tokens, position = [], 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ExpressionError(f"Unexpected '{text[position:].strip()[:10]}' in expression")
+        number, name, op, sup = match.groups()
+        if number is not None:
+            if not np.isfinite(float(number)):
+                raise ExpressionError(f"Number '{number}' is too large")
+            tokens.append(('num', float(number)))
+        elif name is not None:
+            tokens.append(('name', name))
+        elif op is not None:
+            tokens.append(('op', '^' if op == '**' else op))
+        else:
+            exponent = sup.translate(_SUPERSCRIPTS)
+            if not re.fullmatch(r'-?\d+', exponent):
+                raise ExpressionError(f"Invalid superscript exponent '{sup}'")
+            tokens.append(('sup', float(exponent)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the tokens, one method per precedence level"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+        self.abs_depth = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        token = self.peek()
+        if token[0] is None or (kind and token[0] != kind) or (value and token[1] != value):
+            expected = value or kind or 'more input'
+            found = 'end of expression' if token[0] is None else f"'{token[1]}'"
+            raise ExpressionError(f"Expected {expected} but found {found}")
+        self.index += 1
+        return token
+
+    def nest(self):
+        """Count one more level of nesting; the caller decrements it on the way out"""
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ExpressionError("Expression is nested too deeply")
+
+    def parse(self):
+        if not self.tokens:
+            raise ExpressionError("Empty expression")
+        node = self.sum()
+        if self.index < len(self.tokens):
+            raise ExpressionError(f"Unexpected '{self.tokens[self.index][1]}'")
+        return node
+
+    def sum(self):
+        node = self.product()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            node = ('add' if op == '+' else 'sub', node, self.product())
+        return node
+
+    def starts_factor(self):
+        kind, value = self.peek()
+        if kind in ('num', 'name'):
+            return True
+        # A bar only opens a new |...| when it cannot close the current one
+        return kind == 'op' and (value in ('(', '√') or (value == '|' and not self.abs_depth))
+
+    def product(self):
+        node = self.unary()
+        while True:
+            if self.peek() in (('op', '*'), ('op', '/')):
+                op = self.take()[1]
+                right = self.unary()
+                node = ('mul', node, right, False) if op == '*' else ('div', node, right)
+            elif self.starts_factor():
+                previous, (kind, value) = self.tokens[self.index - 1], self.peek()
+                if kind == 'num' and previous[0] == 'num':
+                    raise ExpressionError(f"Missing operator between {previous[1]:g} and {value:g}")
+                node = ('mul', node, self.power(), True)
+            else:
+                return node
+
+    def unary(self):
+        self.nest()
+        try:
+            if self.peek() == ('op', '-'):
+                self.take()
+                return ('neg', self.unary())
+            if self.peek() == ('op', '+'):
+                self.take()
+                return self.unary()
+            return self.power()
+        finally:
+            self.depth -= 1
+
+    def power(self):
+        base = self.postfix()
+        if self.peek() == ('op', '^'):
+            self.take()
+            return ('pow', base, self.unary())  # Right associative, 2^-x allowed
+        return base
+
+    def postfix(self):
+        node = self.atom()
+        while self.peek()[0] == 'sup':
+            exponent = self.take()[1]
+            node = ('pow', node, ('num', exponent) if exponent >= 0 else ('neg', ('num', -exponent)))
+        return node
+
+    def atom(self):
+        self.nest()
+        try:
+            return self.atom_body()
+        finally:
+            self.depth -= 1
+
+    def atom_body(self):
+        kind, value = self.take()
+        if kind == 'num':
+            return ('num', value)
+        if kind == 'name':
+            if value == 'x':
+                return ('x',)
+            if value in CONSTANTS:
+                return ('const', value)
+            self.take('op', '(')
+            argument = self.sum()
+            self.take('op', ')')
+            return ('call', value, argument)
+        if value == '(':
+            node = self.sum()
+            self.take('op', ')')
+            return node
+        if value == '|':
+            self.abs_depth += 1
+            node = self.sum()
+            self.take('op', '|')
+            self.abs_depth -= 1
+            return ('call', 'abs', node)
+        if value == '√':
+            return ('call', 'sqrt', self.postfix())
+        raise ExpressionError(f"Unexpected '{value}'")
+
+
+def parse(text):
+    """Parse expression text into a tree"""
+    return _Parser(tokenize(normalize(text))).parse()
+
+
+def to_source(node, numbers):
+    """Fully parenthesized Python source of a tree over ``np`` and ``x``
+
+    Numbers become names ``n0``, ``n1``, ... bound to NumPy scalars in
+    ``numbers``, so constant parts follow NumPy rules too (1/0 is inf, not
+    a ZeroDivisionError).
+    """
+    kind = node[0]
+    if kind == 'num':
+        numbers.append(np.float64(node[1]))
+        return f"n{len(numbers) - 1}"
+    if kind == 'x':
+        return 'x'
+    if kind == 'const':
+        return CONSTANTS[node[1]][0]
+    if kind == 'neg':
+        return f"(-{to_source(node[1], numbers)})"
+    if kind == 'call':
+        return f"{FUNCTIONS[node[1]][0]}({to_source(node[2], numbers)})"
+    if kind == 'pow' and node[1] == ('const', 'e'):
+        return f"np.exp({to_source(node[2], numbers)})"
+    op = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/', 'pow': '**'}[kind]
+    return f"({to_source(node[1], numbers)} {op} {to_source(node[2], numbers)})"
+
+
+# LaTeX precedence: an operand below the required level gets parentheses
+_SUM, _NEG, _PRODUCT, _FRACTION, _POWER, _ATOM = range(6)
+
+
+def _precedence(node):
+    kind = node[0]
+    if kind in ('add', 'sub'):
+        return _SUM
+    if kind == 'neg':
+        return _NEG
+    if kind == 'mul' or (kind == 'num' and r'\times' in _format_number(node[1])):
+        return _PRODUCT
+    if kind == 'div':
+        return _FRACTION
+    if kind == 'pow' or (kind == 'call' and node[1] == 'exp'):
+        return _POWER
+    return _ATOM
+
+
+def _wrapped(node, level):
+    latex = to_latex(node)
+    return rf"\left({latex}\right)" if _precedence(node) < level else latex
+
+
+def _format_number(value):
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    mantissa, _, exponent = repr(value).partition('e')
+    # Scientific notation as 2.5 × 10⁻⁹, not an 'e' that reads as the constant
+    return rf"{mantissa} \times 10^{{{int(exponent)}}}" if exponent else mantissa
+
+
+def to_latex(node):
+    """LaTeX (mathtext-compatible) rendering of a tree"""
+    kind = node[0]
+    if kind == 'num':
+        return _format_number(node[1])
+    if kind == 'x':
+        return 'x'
+    if kind == 'const':
+        return CONSTANTS[node[1]][1]
+    if kind == 'neg':
+        return '-' + _wrapped(node[1], _PRODUCT)
+    if kind == 'add':
+        return f"{_wrapped(node[1], _SUM)} + {_wrapped(node[2], _PRODUCT)}"
+    if kind == 'sub':
+        return f"{_wrapped(node[1], _SUM)} - {_wrapped(node[2], _PRODUCT)}"
+    if kind == 'mul':
+        left, right = _wrapped(node[1], _PRODUCT), _wrapped(node[2], _FRACTION)
+        # Juxtapose as typed (2x), but never two numbers side by side
+        if node[3] and node[2][0] != 'num':
+            return f"{left} {right}"
+        return rf"{left} \cdot {right}"
+    if kind == 'div':
+        return rf"\frac{{{to_latex(node[1])}}}{{{to_latex(node[2])}}}"
+    if kind == 'pow':
+        return f"{_wrapped(node[1], _ATOM)}^{{{to_latex(node[2])}}}"
+    name, argument = node[1], node[2]
+    if name == 'sqrt':
+        return rf"\sqrt{{{to_latex(argument)}}}"
+    if name == 'abs':
+        return rf"\left|{to_latex(argument)}\right|"
+    if name == 'exp':
+        return f"e^{{{to_latex(argument)}}}"
+    return rf"{FUNCTIONS[name][1]}\left({to_latex(argument)}\right)"
+
+
+class Expression:
+    """A parsed expression in x: call it with an array, read ``latex``
+
+    Calling always returns a float array of the shape of ``x``, also for
+    expressions that do not depend on x. Values outside the domain of a
+    function (ln of a negative number, 1/0) follow NumPy: NaN or ±inf.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.tree = _Parser(tokenize(text)).parse()
+        numbers = []
+        try:
+            # Long chains (x + x + … or ---x within MAX_DEPTH) still make deep
+            # trees, and Python's compiler limits nesting further
+            self.source = to_source(self.tree, numbers)
+            self.latex = to_latex(self.tree)
+            self._code = compile(self.source, '<expression>', 'eval')
+        except (RecursionError, MemoryError, SyntaxError) as e:
+            raise ExpressionError("Expression is too long or nested too deeply") from e
+        self._namespace = {'np': np, '__builtins__': {}}
+        self._namespace.update((f"n{i}", value) for i, value in enumerate(numbers))
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        value = eval(self._code, self._namespace, {'x': x})
+        if np.shape(value) != x.shape:
+            value = np.broadcast_to(value, x.shape).astype(float)
+        return value
+
+    def __repr__(self):
+        return f"Expression({self.text!r})"
+
+
+@lru_cache(maxsize=128)
+def _compile(normalized):
+    return Expression(normalized)
+
+
+def compile_expression(text):
+    """Compiled Expression for ``text``, cached by its normalized spelling"""
+    return _compile(normalize(text))
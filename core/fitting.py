@@ -0,0 +1,599 @@
+import numpy as np
+from scipy import stats as distributions
+
+# Least-squares curve fitting over data read in chunks.
+#
+# No fit needs all rows at once. Models that are linear in their
+# parameters (polynomials, a·ln(x) + b) are solved in one pass: the
+# augmented design [X | y] of each chunk is stacked under the current
+# triangular factor R and re-factorized, so R (a few numbers) summarizes
+# every row seen so far as stably as a QR of the full matrix would.
+# Models that are not (a·e^(bx), a·x^b) are solved by Gauss-Newton, one
+# such pass over the chunks per iteration, started from the closed-form fit
+# of their logarithm (ln|y| = ln|a| + b·x or b·ln x), which is close enough
+# that a few iterations usually suffice.
+#
+# ``chunks`` is anything that returns a fresh iterator of (x, y) array
+# pairs each time it is called, such as Dataset.chunks.
+
+
+class StreamingLeastSquares:
+    """Least-squares solution of X·p ≈ y from row blocks of X and y
+
+    Keeps the R factor of the QR decomposition of [X | y]; its last
+    diagonal entry is the residual norm of the solution. Also tracks the
+    count, mean and spread of y (merged per block) for R².
+    """
+
+    def __init__(self, n_params):
+        self.n_params = n_params
+        self.R = np.zeros((0, n_params + 1))
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+    def add(self, design, y):
+        design, y = np.atleast_2d(design), np.atleast_1d(y)
+        if not len(y):
+            return
+        block = np.column_stack([design, y])
+        if np.isfinite(block).all() and np.isfinite(self.R).all():
+            self.R = np.linalg.qr(np.vstack([self.R, block]), mode='r')
+        else:
+            # solve() reports it; LAPACK is slow on NaN and would hold the GIL for it
+            self.R = np.full((self.n_params + 1,) * 2, np.nan)
+
+        # Chan et al.: merge the block's mean and spread into the totals
+        n, mean = len(y), y.mean()
+        delta = mean - self.mean
+        total = self.count + n
+        self.m2 += ((y - mean) ** 2).sum() + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+
+    def solve(self):
+        """Parameters and residual sum of squares"""
+        p = self.n_params
+        if self.count < p:
+            raise ValueError(f"Need at least {p} points for this fit")
+        if not np.isfinite(self.R).all():
+            raise ValueError("The fit is undefined for some points (e.g. ln(x) for x ≤ 0)")
+        R = self.R[:p, :p]
+        if np.any(np.abs(np.diag(R)) <= 1e-12 * np.abs(R).max()):
+            raise ValueError("The points do not determine this fit (rank deficient)")
+        params = np.linalg.solve(np.triu(R), self.R[:p, p])
+        sse = self.R[p, p] ** 2 if len(self.R) > p else 0.0
+        return params, sse
+
+
+def _log_linear_guess(chunks, log_x):
+    """(a, b) of y = a·e^(b·t), t = ln x if ``log_x`` else x, from ln|y| ~ t
+
+    One pass, fitting the points on each side of y = 0 separately; the
+    sign of a is that of the larger side. Raises ValueError when there are
+    too few usable points.
+    """
+    solvers = {1: StreamingLeastSquares(2), -1: StreamingLeastSquares(2)}
+    with np.errstate(all='ignore'):
+        for x, y in chunks():
+            t = np.log(x) if log_x else x
+            for sign, solver in solvers.items():
+                keep = (sign * y > 0) & np.isfinite(t)
+                solver.add(np.column_stack([t[keep], np.ones(keep.sum())]), np.log(sign * y[keep]))
+    sign = max(solvers, key=lambda sign: solvers[sign].count)
+    (b, log_a), _ = solvers[sign].solve()
+    return np.array([sign * np.exp(log_a), b])
+
+
+class PolynomialModel:
+    """y = c₀xⁿ + … + cₙ, coefficients highest power first (as np.polyfit)
+
+    Fitted on x mapped to [-1, 1] over the data's range, which keeps the
+    design well conditioned for large or offset x.
+    """
+
+    linear = True
+
+    def __init__(self, degree):
+        self.degree = degree
+        self.n_params = degree + 1
+
+    def design(self, x, domain):
+        low, high = domain
+        scale = (high - low) / 2 or 1.0
+        return np.vander((x - (low + high) / 2) / scale, self.n_params)
+
+    def from_design(self, params, domain):
+        """Coefficients in x from those fitted on the mapped x"""
+        low, high = domain
+        if high <= low:
+            return np.concatenate([np.zeros(self.degree), [np.polyval(params, 0.0)]])
+        series = np.polynomial.Polynomial(params[::-1], domain=[low, high], window=[-1, 1])
+        coefficients = series.convert().coef
+        return np.pad(coefficients, (0, self.n_params - len(coefficients)))[::-1]
+
+    def predict(self, x, params):
+        return np.polyval(params, x)
+
+    def equation(self, params):
+        powers = ['x³', 'x²', 'x', ''][-self.n_params:]
+        return "y = " + " + ".join(f"{c:.4f}{power}" for c, power in zip(params, powers))
+
+
+class LogarithmicModel:
+    """y = a·ln(x) + b, for x > 0"""
+
+    linear = True
+    n_params = 2
+
+    def design(self, x, domain):
+        return np.column_stack([np.log(x), np.ones_like(x)])
+
+    def from_design(self, params, domain):
+        return params
+
+    def predict(self, x, params):
+        return params[0] * np.log(x) + params[1]
+
+    def equation(self, params):
+        return f"y = {params[0]:.4f}·ln(x) + {params[1]:.4f}"
+
+
+class ExponentialModel:
+    """y = a·e^(bx)"""
+
+    linear = False
+    n_params = 2
+
+    def guess(self, chunks):
+        return _log_linear_guess(chunks, log_x=False)
+
+    def predict(self, x, params):
+        return params[0] * np.exp(params[1] * x)
+
+    def jacobian(self, x, params):
+        growth = np.exp(params[1] * x)
+        return np.stack([growth, params[0] * x * growth], axis=-1)
+
+    def equation(self, params):
+        return f"y = {params[0]:.4f}·e^({params[1]:.4f}x)"
+
+
+class PowerLawModel:
+    """y = a·x^b, for x > 0"""
+
+    linear = False
+    n_params = 2
+
+    def guess(self, chunks):
+        return _log_linear_guess(chunks, log_x=True)
+
+    def predict(self, x, params):
+        return params[0] * np.power(x, params[1])
+
+    def jacobian(self, x, params):
+        power = np.power(x, params[1])
+        return np.stack([power, params[0] * power * np.log(x)], axis=-1)
+
+    def equation(self, params):
+        return f"y = {params[0]:.4f}·x^{params[1]:.4f}"
+
+
+FIT_MODELS = {
+    'Linear': PolynomialModel(1),
+    'Quadratic': PolynomialModel(2),
+    'Cubic': PolynomialModel(3),
+    'Exponential': ExponentialModel(),
+    'Power Law': PowerLawModel(),
+    'Logarithmic': LogarithmicModel(),
+}
+
+
+class PolynomialAccumulator:
+    """Running least-squares sums for polynomial fits up to ``max_degree``
+
+    Points are added and removed one at a time in O(1): the sums of tᵏ
+    (k ≤ 2·max_degree), tᵏ·y and y², with t = (x - center) / scale, are
+    all that the normal equations of every degree up to ``max_degree``
+    need, so a fit, its R² and its RMSE cost no pass over the points.
+    Choose ``center`` and ``scale`` so that t stays around [-1, 1] (the
+    sums of t⁶ for a cubic lose precision otherwise).
+    """
+
+    def __init__(self, max_degree=3, center=0.0, scale=1.0):
+        self.max_degree = max_degree
+        self.center = center
+        self.scale = scale or 1.0
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.t_sums = np.zeros(2 * self.max_degree + 1)  # Σ tᵏ
+        self.ty_sums = np.zeros(self.max_degree + 1)  # Σ tᵏ·y
+        self.yy_sum = 0.0
+
+    def add(self, x, y, weight=1.0):
+        """Add points (scalars or arrays); a weight of -1 removes them"""
+        t = (np.atleast_1d(np.asarray(x, dtype=float)) - self.center) / self.scale
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        powers = t[:, None] ** np.arange(2 * self.max_degree + 1)
+        self.t_sums += weight * powers.sum(axis=0)
+        self.ty_sums += weight * (powers[:, :self.max_degree + 1] * y[:, None]).sum(axis=0)
+        self.yy_sum += weight * (y @ y)
+        self.count += int(round(weight * len(y)))
+        if self.count == 0:
+            self.clear()  # Drop the rounding left over from removals
+
+    def remove(self, x, y):
+        self.add(x, y, -1.0)
+
+    def covers(self, low, high):
+        """Whether points spanning [low, high] keep t well conditioned
+
+        t must stay within [-2, 2], and a range much narrower than
+        ``scale`` squeezes t towards 0 and loses the higher powers.
+        """
+        reach = 2 * self.scale
+        return (self.center - reach <= low and high <= self.center + reach
+                and not 0 < high - low < self.scale / 2)
+
+    def rescale(self, x, y):
+        """Recentre the sums on the range of ``x`` and add the points again (O(n))"""
+        x = np.asarray(x, dtype=float)
+        self.clear()
+        if len(x):
+            low, high = x.min(), x.max()
+            self.center = (low + high) / 2
+            self.scale = (high - low) / 2 or self.scale
+            self.add(x, y)
+
+    def solve(self, degree):
+        """Coefficients (highest power first, in x) and residual sum of squares"""
+        if not 1 <= degree <= self.max_degree:
+            raise ValueError(f"Degree must be between 1 and {self.max_degree}")
+        if self.count < degree + 1:
+            raise ValueError(f"Need at least {degree + 1} points for this fit")
+        # Normal equations in t, highest power first
+        k = np.arange(degree, -1, -1)
+        normal = self.t_sums[k[:, None] + k]
+        rhs = self.ty_sums[k]
+        if not np.linalg.cond(normal) < 1e12:
+            raise ValueError("The points do not determine this fit (rank deficient)")
+        params = np.linalg.solve(normal, rhs)
+        sse = max(self.yy_sum - params @ rhs, 0.0)
+        series = np.polynomial.Polynomial(params[::-1], domain=[self.center - self.scale,
+                                                               self.center + self.scale])
+        coefficients = series.convert().coef
+        return np.pad(coefficients, (0, degree + 1 - len(coefficients)))[::-1], sse
+
+    def metrics(self, degree):
+        """Coefficients with the R² and RMSE of the degree ``degree`` fit"""
+        params, sse = self.solve(degree)
+        total = self.yy_sum - self.ty_sums[0] ** 2 / self.count  # Σ(y - ȳ)²
+        r_squared = 1 - sse / total if total > 1e-12 * self.yy_sum else np.nan
+        return params, dict(count=self.count, r_squared=r_squared, rmse=np.sqrt(sse / self.count))
+
+
+def fit_linear(model, chunks, domain=(-1.0, 1.0), cancelled=None):
+    """One pass: parameters of a model that is linear in them
+
+    ``cancelled`` is checked before every chunk; once it returns True the
+    fit stops and None is returned.
+    """
+    solver = StreamingLeastSquares(model.n_params)
+    with np.errstate(all='ignore'):
+        for x, y in chunks():
+            if cancelled is not None and cancelled():
+                return None
+            solver.add(model.design(x, domain), y)
+    params, _ = solver.solve()
+    return model.from_design(params, domain)
+
+
+def fit_nonlinear(model, chunks, p0=None, max_iterations=100, rtol=1e-10, stats=None,
+                  progress=None, cancelled=None):
+    """Gauss-Newton from ``p0``, one pass per iteration
+
+    Without ``p0`` the fit starts from ``model.guess(chunks)`` (all ones if
+    that fails). A step that does not lower the residual sum of squares is
+    halved and retried. ``progress`` is called after every pass with the
+    iteration and its residual sum of squares and may return False to
+    cancel, in which case None is returned; so is ``cancelled``, checked
+    before every chunk, when it returns True. Pass a dict as ``stats`` to
+    receive the iterations used and whether the steps became smaller than
+    ``rtol``.
+    """
+    if p0 is None:
+        try:
+            p0 = model.guess(chunks)
+        except ValueError:
+            p0 = np.ones(model.n_params)
+    params = np.asarray(p0, dtype=float)
+    best, best_sse, step = params, np.inf, None
+    converged = False
+    for iteration in range(1, max_iterations + 1):
+        solver, sse = StreamingLeastSquares(model.n_params), 0.0
+        with np.errstate(all='ignore'):
+            for x, y in chunks():
+                if cancelled is not None and cancelled():
+                    return None
+                residual = y - model.predict(x, params)
+                sse += residual @ residual
+                solver.add(model.jacobian(x, params), residual)
+        if progress is not None and progress(iteration, sse) is False:
+            return None
+
+        if not sse < best_sse:
+            if step is None:
+                raise ValueError("The model cannot be evaluated at the starting parameters")
+            step = step / 2  # Overshot: back off towards the best point
+            params = best + step
+            if np.all(np.abs(step) <= rtol * (np.abs(best) + rtol)):
+                converged = True
+                break
+            continue
+
+        best, best_sse = params, sse
+        step, _ = solver.solve()
+        params = best + step
+        if np.all(np.abs(step) <= rtol * (np.abs(best) + rtol)):
+            best, converged = params, True
+            break
+
+    if stats is not None:
+        stats.update(iterations=iteration, converged=converged)
+    return best
+
+
+def fit(name, chunks, domain=(-1.0, 1.0), p0=None, stats=None, progress=None, cancelled=None):
+    """Parameters of the named model fitted to the chunked data
+
+    ``domain`` is the (min, max) of x, used to condition polynomial fits;
+    ``p0``, ``stats`` and ``progress`` go to fit_nonlinear, ``cancelled`` to
+    either fit (None is returned if the fit is cancelled).
+    """
+    if name not in FIT_MODELS:
+        raise ValueError(f"Unknown fit type: {name}")
+    model = FIT_MODELS[name]
+    if model.linear:
+        return fit_linear(model, chunks, domain, cancelled)
+    return fit_nonlinear(model, chunks, p0, stats=stats, progress=progress, cancelled=cancelled)
+
+
+def fit_metrics(model, params, chunks):
+    """R², RMSE and MAE of a fit, plus the point count and residual range"""
+    count, sse, sae, mean, m2 = 0, 0.0, 0.0, 0.0, 0.0
+    low, high = np.inf, -np.inf
+    with np.errstate(all='ignore'):
+        for x, y in chunks():
+            residual = y - model.predict(x, params)
+            n = len(y)
+            sse += residual @ residual
+            sae += np.abs(residual).sum()
+            low, high = min(low, residual.min()), max(high, residual.max())
+            block_mean = y.mean()
+            delta = block_mean - mean
+            m2 += ((y - block_mean) ** 2).sum() + delta ** 2 * count * n / (count + n)
+            mean += delta * n / (count + n)
+            count += n
+    return dict(count=count, sse=sse, r_squared=1 - sse / m2 if m2 > 0 else np.nan,
+                rmse=np.sqrt(sse / count), mae=sae / count, residual_range=(low, high))
+
+
+# Model comparison
+#
+# Every model is scored on the same data by R², by the information criteria
+# AIC = n·ln(SSE/n) + 2k and BIC = n·ln(SSE/n) + k·ln(n) (k parameters,
+# Gaussian errors; lower is better, and extra parameters must pay for
+# themselves), and by the RMSE of k-fold cross-validation, where each fold
+# is predicted by a fit to the other folds. Folds interleave the rows of
+# every chunk, so they need no shuffling and no extra memory.
+
+# criterion: True when higher is better
+FIT_CRITERIA = {'r_squared': True, 'aic': False, 'bic': False, 'cv_rmse': False}
+
+
+def _fold(chunks, fold, folds, test):
+    """Chunks of the rows in fold ``fold`` (``test``) or in all the others"""
+    def select():
+        for x, y in chunks():
+            inside = np.arange(len(x)) % folds == fold
+            keep = inside if test else ~inside
+            if keep.any():
+                yield x[keep], y[keep]
+    return select
+
+
+def cross_validate(name, chunks, domain, folds=5, p0=None):
+    """Root mean square prediction error of k-fold cross-validation
+
+    Nonlinear fits of the folds start from ``p0`` (the fit to all rows).
+    """
+    model = FIT_MODELS[name]
+    sse, count = 0.0, 0
+    with np.errstate(all='ignore'):
+        for fold in range(folds):
+            params = fit(name, _fold(chunks, fold, folds, False), domain, p0)
+            for x, y in _fold(chunks, fold, folds, True)():
+                residual = y - model.predict(x, params)
+                sse += residual @ residual
+                count += len(y)
+    return np.sqrt(sse / count)
+
+
+def evaluate_fit(name, chunks, domain, folds=5):
+    """Fit one model and score it for comparison
+
+    Returns a dict with the name, params, equation, the fit_metrics and the
+    scores of FIT_CRITERIA, or with the name and an 'error' message when the
+    model cannot be fitted to this data. Safe to run in worker threads.
+    """
+    model = FIT_MODELS[name]
+    try:
+        params = fit(name, chunks, domain)
+        metrics = fit_metrics(model, params, chunks)
+        n, k = metrics['count'], model.n_params
+        if not np.isfinite(metrics['sse']):
+            raise ValueError("The fit is undefined for some points")
+        # An exact fit has no residual: its criteria are -inf, ranking first
+        with np.errstate(divide='ignore'):
+            log_likelihood = n * np.log(metrics['sse'] / n)
+        folds = min(folds, n)
+        cv_rmse = cross_validate(name, chunks, domain, folds, params) if n // folds * (folds - 1) >= k else np.nan
+    except (ValueError, np.linalg.LinAlgError) as e:
+        return dict(name=name, error=str(e))
+    return dict(name=name, params=params, equation=model.equation(params), **metrics,
+                aic=log_likelihood + 2 * k, bic=log_likelihood + k * np.log(n), cv_rmse=cv_rmse)
+
+
+def rank_fits(results, criterion):
+    """Names of the fitted results, best first by ``criterion`` (NaN last)"""
+    if criterion not in FIT_CRITERIA:
+        raise ValueError(f"Unknown fit criterion: {criterion}")
+    fitted = [result for result in results if 'error' not in result]
+    scores = np.array([result[criterion] for result in fitted], dtype=float)
+    if FIT_CRITERIA[criterion]:
+        scores = -scores
+    order = np.argsort(np.where(np.isnan(scores), np.inf, scores), kind='stable')
+    return [fitted[i]['name'] for i in order]
+
+
+# Uncertainty bands
+#
+# A confidence band bounds where the fitted curve itself could lie, a
+# prediction band where a new point would fall (the curve's uncertainty
+# plus the scatter about it). Both come as (lower, upper) arrays at the
+# requested x, from either
+#
+# - the covariance of the parameters, s²·(GᵀG)⁻¹, linearized about the fit
+#   (G: the gradient of the prediction in the parameters at every point,
+#   s² = SSE / (n - k)); one pass over the chunks, for any number of rows;
+# - the pairs bootstrap: the fit is repeated on resamples of the points and
+#   the bands are percentiles of the refitted curves. A resample is a row of
+#   counts (how often each point was drawn), so a batch of replicates is a
+#   weighted fit solved for all of them at once: one matrix product and a
+#   stacked solve of the normal equations for linear models, and batched
+#   Gauss-Newton steps started from the full fit for the others. Needs the
+#   points in memory, so it is limited to BOOTSTRAP_MAX_ROWS.
+
+BOOTSTRAP_MAX_ROWS = 20_000
+_BOOTSTRAP_BATCH = 2 ** 22  # Replicates × rows per batch
+
+
+def _gradient(model, x, params, domain):
+    """Derivatives of the prediction in the fitted parameters, one row per x"""
+    return model.design(x, domain) if model.linear else model.jacobian(x, params)
+
+
+def analytic_bands(model, params, chunks, x, domain=(-1.0, 1.0), level=0.95):
+    """Confidence and prediction bands of a fit at ``x`` from its covariance
+
+    Half-widths are Student's t quantile at ``level`` times the standard
+    error of the curve (and, for prediction, of a new point).
+    """
+    k = model.n_params
+    solver, sse = StreamingLeastSquares(k), 0.0
+    with np.errstate(all='ignore'):
+        for x_chunk, y_chunk in chunks():
+            residual = y_chunk - model.predict(x_chunk, params)
+            sse += residual @ residual
+            solver.add(_gradient(model, x_chunk, params, domain), residual)
+        solver.solve()  # Raises for undefined or underdetermined fits
+        dof = solver.count - k
+        if dof < 1:
+            raise ValueError(f"Need more than {k} points for uncertainty bands")
+        # gᵀ(GᵀG)⁻¹g = |R⁻ᵀg|² with GᵀG = RᵀR
+        scaled = np.linalg.solve(np.triu(solver.R[:k, :k]).T, _gradient(model, x, params, domain).T)
+        variance = (scaled ** 2).sum(axis=0) * sse / dof
+        t = distributions.t.ppf((1 + level) / 2, dof)
+        y = model.predict(x, params)
+        confidence, prediction = t * np.sqrt(variance), t * np.sqrt(variance + sse / dof)
+    return (np.array([y - confidence, y + confidence]),
+            np.array([y - prediction, y + prediction]))
+
+
+def _bootstrap_linear(model, x_data, y_data, weights, x, domain):
+    design = model.design(x_data, domain)
+    k = design.shape[1]
+    outer = (design[:, :, None] * design[:, None, :]).reshape(len(design), k * k)
+    normal = (weights @ outer).reshape(-1, k, k)
+    moments = weights @ (design * y_data[:, None])
+    try:
+        coefficients = np.linalg.solve(normal, moments[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        # A resample of few distinct points may not determine the fit
+        coefficients = (np.linalg.pinv(normal) @ moments[:, :, None])[:, :, 0]
+    return coefficients @ model.design(x, domain).T
+
+
+def _bootstrap_nonlinear(model, params, x_data, y_data, weights, x, iterations=20, rtol=1e-8):
+    batch = np.tile(params, (len(weights), 1))
+    for _ in range(iterations):
+        columns = batch.T[:, :, None]  # Each parameter as a (replicates, 1) column
+        residual = y_data - model.predict(x_data, columns)
+        jacobian = model.jacobian(x_data, columns)
+        weighted = jacobian * weights[:, :, None]
+        normal = weighted.transpose(0, 2, 1) @ jacobian
+        moments = weighted.transpose(0, 2, 1) @ residual[:, :, None]
+        step = (np.linalg.pinv(normal) @ moments)[:, :, 0]
+        batch = batch + step
+        if np.nanmax(np.abs(step) / (np.abs(batch) + rtol)) <= rtol:
+            break
+    return model.predict(x, batch.T[:, :, None])
+
+
+def bootstrap_bands(model, params, chunks, x, domain=(-1.0, 1.0), level=0.95, replicates=1000,
+                    seed=None):
+    """Percentile bootstrap confidence and prediction bands of a fit at ``x``
+
+    The prediction band adds a residual of the fit, drawn at random, to
+    every replicate's curve. Replicates that fail to converge
+    (non-finite curves) are left out. Raises ValueError for more than
+    BOOTSTRAP_MAX_ROWS points.
+    """
+    pieces, count = [], 0
+    for x_chunk, y_chunk in chunks():
+        count += len(x_chunk)
+        if count > BOOTSTRAP_MAX_ROWS:
+            raise ValueError(f"Bootstrap bands are limited to {BOOTSTRAP_MAX_ROWS:,} points")
+        pieces.append((x_chunk, y_chunk))
+    if count <= model.n_params:
+        raise ValueError(f"Need more than {model.n_params} points for uncertainty bands")
+    x_data, y_data = (np.concatenate(column) for column in zip(*pieces))
+
+    rng = np.random.default_rng(seed)
+    curves = []
+    batch = max(1, _BOOTSTRAP_BATCH // (count * (1 if model.linear else model.n_params)))
+    with np.errstate(all='ignore'):
+        for start in range(0, replicates, batch):
+            size = min(batch, replicates - start)
+            # Counts of each point in each resample
+            draws = rng.integers(0, count, (size, count)) + count * np.arange(size)[:, None]
+            weights = np.bincount(draws.ravel(), minlength=size * count).reshape(size, count)
+            weights = weights.astype(float)
+            if model.linear:
+                curves.append(_bootstrap_linear(model, x_data, y_data, weights, x, domain))
+            else:
+                curves.append(_bootstrap_nonlinear(model, params, x_data, y_data, weights, x))
+        curves = np.concatenate(curves)
+        curves = curves[np.isfinite(curves).all(axis=1)]
+        if not len(curves):
+            raise ValueError("No bootstrap replicate of this fit converged")
+        # Residuals understate the scatter by the k parameters fitted to them
+        residuals = y_data - model.predict(x_data, params)
+        residuals *= np.sqrt(count / (count - model.n_params))
+        # One residual per replicate, so the band is smooth in x
+        scattered = curves + residuals[rng.integers(0, count, (len(curves), 1))]
+        tails = 50 * (1 - level), 50 * (1 + level)
+        return np.percentile(curves, tails, axis=0), np.percentile(scattered, tails, axis=0)
+
+
+# name: function(model, params, chunks, x, domain, level)
+BAND_METHODS = {'analytic': analytic_bands, 'bootstrap': bootstrap_bands}
+
+
+def uncertainty_bands(method, model, params, chunks, x, domain=(-1.0, 1.0), level=0.95):
+    """(confidence, prediction) bands by the named method, each (lower, upper) at ``x``"""
+    if method not in BAND_METHODS:
+        raise ValueError(f"Unknown band method: {method}")
+    return BAND_METHODS[method](model, params, chunks, x, domain, level)
@@ -0,0 +1,168 @@
+import numpy as np
+
+# Shared ODE integrators for the time-stepped simulation models.
+#
+# Every solver integrates dy/dt = rhs(t, y) where ``y`` has shape (..., n):
+# the last axis is the state vector and any leading axes are independent
+# copies of the system (e.g. a batch of parameter configurations). ``rhs``
+# must return an array of the same shape, so one call advances the whole
+# batch. Results are sampled on the caller's time grid and have shape
+# (len(t), ..., n).
+#
+# ``constrain`` is an optional function applied to the state after every
+# accepted step, used for hard limits such as saturated actuators or
+# mechanical end stops.
+
+
+def _euler_step(rhs, t, y, h):
+    return y + h * rhs(t, y)
+
+
+def _midpoint_step(rhs, t, y, h):
+    k1 = rhs(t, y)
+    return y + h * rhs(t + h/2, y + h/2 * k1)
+
+
+def _rk4_step(rhs, t, y, h):
+    k1 = rhs(t, y)
+    k2 = rhs(t + h/2, y + h/2 * k1)
+    k3 = rhs(t + h/2, y + h/2 * k2)
+    k4 = rhs(t + h, y + h * k3)
+    return y + h/6 * (k1 + 2*k2 + 2*k3 + k4)
+
+
+FIXED_STEP_METHODS = {
+    'euler': _euler_step,
+    'midpoint': _midpoint_step,
+    'rk4': _rk4_step,
+}
+
+
+def solve_fixed(rhs, t, y0, method='rk4', constrain=None):
+    """Integrate with one fixed step between consecutive points of ``t``"""
+    if method not in FIXED_STEP_METHODS:
+        raise ValueError(f"Unknown fixed-step method: {method}")
+    step = FIXED_STEP_METHODS[method]
+
+    t = np.asarray(t, dtype=float)
+    y = np.array(y0, dtype=float)
+    out = np.empty((len(t),) + y.shape)
+    out[0] = y
+
+    for i in range(1, len(t)):
+        y = step(rhs, t[i-1], y, t[i] - t[i-1])
+        if constrain is not None:
+            y = constrain(y)
+        out[i] = y
+    return out
+
+
+# Dormand-Prince 5(4) tableau
+_DP_C = (0, 1/5, 3/10, 4/5, 8/9, 1)
+_DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+)
+_DP_B = (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84)
+# Difference between the 5th and embedded 4th order weights (7 stages, FSAL)
+_DP_E = (71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40)
+
+
+def _error_norm(err, y, y_new, rtol, atol):
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+    # RMS over the state vector, worst case over any batch dimensions
+    return np.sqrt(np.mean((err / scale)**2, axis=-1)).max()
+
+
+def solve_rk45(rhs, t, y0, rtol=1e-6, atol=1e-9, max_step=np.inf,
+               constrain=None, stats=None):
+    """Adaptive Dormand-Prince RK45 sampled on ``t`` by Hermite interpolation
+
+    The step size is chosen from the embedded error estimate, independent of
+    the output grid. Pass a dict as ``stats`` to receive the number of
+    accepted/rejected steps and right-hand-side evaluations.
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.array(y0, dtype=float)
+    out = np.empty((len(t),) + y.shape)
+    out[0] = y
+
+    t_cur, t_end = t[0], t[-1]
+    f = rhs(t_cur, y)
+    evaluations = 1
+    accepted = rejected = 0
+
+    # Initial step from the size of the state and its derivative
+    y_size = np.sqrt(np.mean((y / (atol + rtol * np.abs(y)))**2))
+    f_size = np.sqrt(np.mean((f / (atol + rtol * np.abs(y)))**2))
+    h = 0.01 * y_size / f_size if y_size > 1e-5 and f_size > 1e-5 else 1e-6
+    h = min(h, max_step, t_end - t_cur)
+    min_step = 1e-12 * max(abs(t_end - t[0]), 1.0)
+
+    next_out = 1
+    while next_out < len(t):
+        h = min(h, max_step, t_end - t_cur)
+        if h < min_step:
+            raise RuntimeError(f"RK45 step size underflow at t = {t_cur:.6g}")
+
+        k = [f]
+        for c, a in zip(_DP_C[1:], _DP_A[1:]):
+            y_stage = y + h * sum(a_j * k_j for a_j, k_j in zip(a, k))
+            k.append(rhs(t_cur + c * h, y_stage))
+        y_new = y + h * sum(b * k_i for b, k_i in zip(_DP_B, k) if b)
+        f_new = rhs(t_cur + h, y_new)
+        k.append(f_new)
+        evaluations += 6
+
+        err = h * sum(e * k_i for e, k_i in zip(_DP_E, k) if e)
+        err_norm = _error_norm(err, y, y_new, rtol, atol)
+
+        if err_norm <= 1:
+            accepted += 1
+            t_new = t_cur + h
+            if constrain is not None:
+                y_new = constrain(y_new)
+
+            # Emit every output point inside this step
+            while next_out < len(t) and t[next_out] <= t_new + min_step:
+                theta = (t[next_out] - t_cur) / h
+                out[next_out] = _hermite(y, y_new, f, f_new, h, theta)
+                if constrain is not None:
+                    out[next_out] = constrain(out[next_out])
+                next_out += 1
+
+            t_cur, y = t_new, y_new
+            if constrain is not None:
+                f_new = rhs(t_cur, y)
+                evaluations += 1
+            f = f_new
+            factor = 5.0 if err_norm == 0 else min(5.0, 0.9 * err_norm**-0.2)
+        else:
+            rejected += 1
+            factor = max(0.2, 0.9 * err_norm**-0.2)
+        h *= factor
+
+    if stats is not None:
+        stats.update(accepted=accepted, rejected=rejected, evaluations=evaluations)
+    return out
+
+
+def _hermite(y0, y1, f0, f1, h, theta):
+    """Cubic Hermite interpolation across one step"""
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    return ((2*theta3 - 3*theta2 + 1) * y0
+            + (theta3 - 2*theta2 + theta) * h * f0
+            + (-2*theta3 + 3*theta2) * y1
+            + (theta3 - theta2) * h * f1)
+
+
+def solve(rhs, t, y0, method='rk4', constrain=None, **options):
+    """Dispatch to ``solve_fixed`` or, for ``method='rk45'``, ``solve_rk45``"""
+    if method == 'rk45':
+        return solve_rk45(rhs, t, y0, constrain=constrain, **options)
+    return solve_fixed(rhs, t, y0, method=method, constrain=constrain)
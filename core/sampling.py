@@ -0,0 +1,175 @@
+import numpy as np
+
+# Adaptive sampling of functions of x for plotting and integration.
+#
+# A uniform grid dense enough for the steepest part of a curve wastes
+# samples everywhere else and still aliases near asymptotes. Instead a
+# coarse grid is refined where the curve is not straight: every interval
+# whose midpoint lies off the chord (by more than a fraction of the curve's
+# vertical range) is halved, in passes that evaluate all new midpoints in
+# one call. Values are compared clipped to a window around that range, so
+# the far-off parts of an asymptote count as straight and are not refined
+# for nothing. Intervals still bending when they reach ``min_width`` hold a
+# discontinuity (a jump, a pole, or the edge of the function's domain).
+#
+# Each discontinuity is classified by how fast |f| grows towards it:
+# |f| ~ |x - c|^-order. Below order 1 the area next to it is finite (jumps
+# have order 0, ln|x| about 0, 1/√x one half); from order 1 on (1/x, tan x,
+# 1/x²) the integral diverges.
+
+DIVERGENT_ORDER = 0.95  # Measured orders of 1/x land just below 1
+
+
+def adaptive_sample(f, a, b, n_initial=65, max_points=2000, tol=2e-3, min_width=None, stats=None):
+    """Samples of ``f`` on [a, b], refined where linear interpolation is poor
+
+    ``f`` maps an array of x to an array of values, or to a (k, n) array of
+    k curves sampled on the same grid (refined where any of them needs it).
+    Refinement stops when every midpoint lies within ``tol`` times the
+    curve's vertical range of its chord, or at ``max_points``. Pass a dict
+    as ``stats`` to receive the number of evaluations and the x positions
+    of unresolved intervals ('breaks': discontinuities, see breakpoints).
+    Returns (x, y).
+    """
+    if min_width is None:
+        min_width = (b - a) * 1e-10
+    x = np.linspace(a, b, n_initial)
+    first = f(x)
+    y = np.atleast_2d(first).astype(float)
+    # Vertical range from the central 90% of the values, so a pole does not
+    # make the rest of the curve look flat
+    low, high = np.zeros((2, len(y), 1))
+    for row, values in enumerate(y):
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            low[row], high[row] = np.percentile(finite, [5, 95])
+    span = np.maximum(high - low, 1e-9 * np.maximum(abs(low), abs(high)))
+    low, high = low - 2 * span, high + 2 * span
+
+    evaluations = n_initial
+    lo = np.arange(n_initial - 1)  # Intervals (x[i], x[i + 1]) still to test
+    breaks = []
+    while lo.size and len(x) < max_points:
+        lo, waiting = lo[:max_points - len(x)], lo[max_points - len(x):]
+        mid = (x[lo] + x[lo + 1]) / 2
+        y_mid = np.atleast_2d(f(mid)).astype(float)
+        evaluations += len(mid)
+        chord = (np.clip(y[:, lo], low, high) + np.clip(y[:, lo + 1], low, high)) / 2
+        with np.errstate(invalid='ignore'):
+            off = np.abs(np.clip(y_mid, low, high) - chord) > tol * span
+        # An interval with values on only one side of a domain edge bends too
+        edge = np.isfinite(y[:, lo]) != np.isfinite(y[:, lo + 1])
+        bends = (off | edge).any(axis=0)
+
+        narrow = bends & (x[lo + 1] - x[lo] < 2 * min_width)
+        breaks.extend(mid[narrow])
+        split = bends & ~narrow
+        # Insert the accepted midpoints; each split interval becomes two
+        position = np.searchsorted(x, mid[split])
+        x = np.insert(x, position, mid[split])
+        y = np.insert(y, position, y_mid[:, split], axis=1)
+        new = position + np.arange(split.sum())  # Index of each inserted midpoint
+        waiting = waiting + np.searchsorted(position, waiting, side='right')
+        lo = np.sort(np.concatenate([new - 1, new, waiting]))
+
+    if stats is not None:
+        stats.update(evaluations=evaluations, breaks=np.array(breaks),
+                     converged=not lo.size)
+    return x, (y[0] if np.ndim(first) == 1 else y)
+
+
+def singularity_order(f, c, a, b):
+    """Growth exponent p of |f(x)| ~ |x - c|^-p as x approaches c within [a, b]
+
+    Measured from |f| at 10⁻⁶ and 10⁻⁷ of the interval length from ``c``,
+    on whichever side grows fastest. Jumps give about 0, poles their order,
+    and NaN when f is not finite on either side.
+    """
+    d = (b - a) * np.array([1e-6, 1e-7])
+    orders = []
+    for side in (-1, 1):
+        x = c + side * d
+        if x.min() < a or x.max() > b:
+            continue
+        with np.errstate(all='ignore'):
+            near = np.abs(np.asarray(f(x), dtype=float))
+            orders.append(np.log10(near[1] / near[0]) if near[0] > 0 else np.nan)
+    orders = [order for order in orders if np.isfinite(order)]
+    return max(orders) if orders else np.nan
+
+
+def breakpoints(f, x, y, breaks, a, b):
+    """Discontinuities of sampled ``f``: sorted positions and their orders
+
+    ``breaks`` are unresolved positions from adaptive_sample; non-finite
+    samples between finite ones count too. Positions within 10⁻⁸ of the
+    interval length of each other merge, and those next to a or b snap to
+    it. Orders are measured on ``f`` (see singularity_order).
+    """
+    y = np.atleast_2d(y)
+    # A non-finite sample between finite ones is an isolated point such as a pole
+    finite = np.isfinite(y).all(axis=0)
+    isolated = ~finite & np.r_[True, finite[:-1]] & np.r_[finite[1:], True]
+    positions = np.sort(np.concatenate([np.asarray(breaks, dtype=float), x[isolated]]))
+    if not positions.size:
+        return positions, positions
+
+    gap = (b - a) * 1e-8
+    groups = np.split(positions, np.flatnonzero(np.diff(positions) > gap) + 1)
+    # Rounded to the merge precision, so a pole at 0 reads 0 and not -1e-27
+    positions = np.round(np.array([group.mean() for group in groups]) / gap) * gap + 0.0
+    positions[positions - a < gap] = a
+    positions[b - positions < gap] = b
+    positions = np.unique(positions)
+    orders = np.array([singularity_order(f, c, a, b) for c in positions])
+    return positions, orders
+
+
+def undefined_parts(x, y, positions):
+    """(start, end) intervals where the sampled curves are NaN: outside their domain
+
+    Only runs of two or more NaN samples count (a single one is a point,
+    such as 0/0, see breakpoints). Each end next to finite samples is the
+    break position between them (the domain edge found by adaptive_sample),
+    or their midpoint if there is none.
+    """
+    nan = np.isnan(np.atleast_2d(y)).any(axis=0)
+    changes = np.flatnonzero(np.diff(np.r_[False, nan, False].astype(int)))
+    parts = []
+    for start, end in zip(changes[::2], changes[1::2] - 1):
+        if end == start:
+            continue
+        ends = []
+        for left, right, outer in ((start - 1, start, start == 0),
+                                   (end, end + 1, end == len(x) - 1)):
+            if outer:
+                ends.append(x[left + 1] if left < 0 else x[left])
+                continue
+            inside = positions[(positions >= x[left]) & (positions <= x[right])]
+            ends.append(inside[0] if inside.size else (x[left] + x[right]) / 2)
+        parts.append(tuple(ends))
+    return parts
+
+
+def break_lines(x, y, positions):
+    """Insert a NaN at each position so lines are not drawn across it"""
+    inside = positions[(positions > x[0]) & (positions < x[-1])]
+    index = np.searchsorted(x, inside)
+    return (np.insert(x, index, inside),
+            np.insert(np.asarray(y, dtype=float), index, np.nan, axis=-1))
+
+
+def excluding(f, points):
+    """``f`` with the value 0 at exactly ``points``
+
+    Lets fixed-grid rules step over an integrable singularity sitting on a
+    node (ln x at 0), which would otherwise turn the sum into inf or NaN.
+    """
+    points = np.asarray(points, dtype=float)
+    if not points.size:
+        return f
+
+    def wrapped(x):
+        y = f(x)
+        return np.where(np.isin(x, points), 0.0, y)
+    return wrapped
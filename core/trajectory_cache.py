@@ -0,0 +1,43 @@
+class TrajectoryCache:
+    """Keep the most recent simulated trajectory of each model.
+
+    Entries are keyed by model name and the exact parameter values the
+    simulation was run with. Asking for a model with different parameters
+    recomputes and replaces its entry, so at most one trajectory per model
+    is held in memory.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(params):
+        return tuple(sorted(params.items()))
+
+    def get(self, model_name, params, simulate):
+        """Return ``simulate(**params)``, computing it only on a cache miss"""
+        key = self.make_key(params)
+        entry = self._entries.get(model_name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = simulate(**params)
+        self._entries[model_name] = (key, result)
+        return result
+
+    def invalidate(self, model_name=None):
+        """Drop one model's trajectory, or all of them"""
+        if model_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(model_name, None)
+
+    def __contains__(self, model_name):
+        return model_name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
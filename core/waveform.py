@@ -0,0 +1,214 @@
+import numpy as np
+
+# Key points of waveforms: level crossings, peaks and troughs.
+#
+# For a sinusoid A·sin(f·x - φ) + c they are solved in closed form, so the
+# cost is one value per feature and independent of any sampling. Arbitrary
+# sampled signals fall back to sign changes, refined by linear
+# interpolation for crossings and a parabola through three samples for
+# extrema.
+
+
+def sinusoid_key_points(amp, freq, phase, offset, start, stop):
+    """Exact key points of amp·sin(freq·x - phase) + offset on [start, stop]
+
+    ``phase`` is in radians. Returns a dict with 'zero_crossings' (midline
+    crossings), 'peaks' and 'troughs', each an (x, y) pair of arrays. A flat
+    wave (zero amplitude or frequency) has no key points.
+    """
+    empty = (np.empty(0), np.empty(0))
+    if amp == 0 or freq == 0:
+        return dict(zero_crossings=empty, peaks=empty, troughs=empty)
+
+    # Solve freq·x - phase = first + k·step for the integers k inside the range
+    theta = np.sort([freq * start - phase, freq * stop - phase])
+    eps = 1e-9
+
+    def solve(first, step):
+        k = np.arange(np.ceil((theta[0] - first) / step - eps),
+                      np.floor((theta[1] - first) / step + eps) + 1)
+        return np.sort((first + k * step + phase) / freq)
+
+    crossings = solve(0.0, np.pi)
+    highs, lows = solve(np.pi / 2, 2 * np.pi), solve(-np.pi / 2, 2 * np.pi)
+    if amp < 0:
+        highs, lows = lows, highs
+    peak, trough = float(offset + abs(amp)), float(offset - abs(amp))
+    return dict(
+        zero_crossings=(crossings, np.full(len(crossings), float(offset))),
+        peaks=(highs, np.full(len(highs), peak)),
+        troughs=(lows, np.full(len(lows), trough)),
+    )
+
+
+def level_crossings(x, y, level=0.0):
+    """x positions where the sampled signal ``y`` crosses ``level``
+
+    Each sign change between neighbouring samples is located by linear
+    interpolation; a sample exactly on the level counts once.
+    """
+    x, d = np.asarray(x, dtype=float), np.asarray(y, dtype=float) - level
+    i = np.flatnonzero(np.signbit(d[:-1]) != np.signbit(d[1:]))
+    fraction = d[i] / (d[i] - d[i + 1])
+    return x[i] + fraction * (x[i + 1] - x[i])
+
+
+def local_extrema(x, y):
+    """Interpolated peaks and troughs of a sampled signal on a uniform grid
+
+    Extrema are found where the slope changes sign and refined with the
+    vertex of the parabola through the three samples around them. Returns
+    ((peak_x, peak_y), (trough_x, trough_y)).
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    slope = np.diff(y)
+
+    def refine(i):
+        y0, y1, y2 = y[i - 1], y[i], y[i + 1]
+        curvature = y0 - 2 * y1 + y2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shift = np.where(curvature != 0, 0.5 * (y0 - y2) / curvature, 0.0)
+        return x[i] + shift * (x[i + 1] - x[i]), y1 - 0.25 * (y0 - y2) * shift
+
+    peaks = np.flatnonzero((slope[:-1] > 0) & (slope[1:] <= 0)) + 1
+    troughs = np.flatnonzero((slope[:-1] < 0) & (slope[1:] >= 0)) + 1
+    return refine(peaks), refine(troughs)
+
+
+def key_points(x, y, level=0.0):
+    """Sampled-signal fallback with the same result layout as sinusoid_key_points"""
+    crossings = level_crossings(x, y, level)
+    peaks, troughs = local_extrema(x, y)
+    return dict(
+        zero_crossings=(crossings, np.full(len(crossings), float(level))),
+        peaks=peaks,
+        troughs=troughs,
+    )
+
+
+# Signal synthesis
+#
+# A signal is a set of tones amp·sin(2π·freq·t + phase), given as three
+# equal-length arrays, plus anything added in the time domain (FM carriers,
+# noise). Over a buffer of n samples at ``sample_rate`` a tone whose
+# frequency is a whole number of cycles per buffer sits exactly on an FFT
+# bin, so any number of such tones is synthesized with one inverse FFT.
+# Other tones are summed by broadcasting samples against tones in blocks.
+
+HARMONIC_SHAPES = ('Sine', 'Square', 'Sawtooth', 'Triangle')
+
+
+def harmonic_tones(fundamental, count, shape='Square', amplitude=1.0):
+    """Fourier series of a periodic wave truncated to ``count`` tones"""
+    if shape not in HARMONIC_SHAPES:
+        raise ValueError(f"Unknown waveform shape: {shape}")
+    if shape == 'Sine':
+        count = 1
+    k = np.arange(1, count + 1, dtype=float)
+    if shape in ('Square', 'Triangle'):
+        k = 2 * k - 1  # Odd harmonics only
+
+    if shape == 'Square':
+        amps = 4 / np.pi / k
+    elif shape == 'Sawtooth':
+        amps = 2 / np.pi / k * (-1) ** (k + 1)
+    elif shape == 'Triangle':
+        amps = 8 / np.pi**2 / k**2 * (-1) ** ((k - 1) / 2)
+    else:
+        amps = np.ones(1)
+    return amplitude * amps, fundamental * k, np.zeros(len(k))
+
+
+def am_tones(amplitude, carrier, modulation, depth):
+    """amplitude·(1 + depth·sin(2π·fm·t))·sin(2π·fc·t) as carrier plus two sidebands"""
+    side = amplitude * depth / 2
+    return (np.array([amplitude, side, side]),
+            np.array([carrier, carrier - modulation, carrier + modulation], dtype=float),
+            np.array([0.0, np.pi / 2, -np.pi / 2]))
+
+
+def fm_signal(t, amplitude, carrier, modulation, index):
+    """amplitude·sin(2π·fc·t + index·sin(2π·fm·t)), evaluated directly"""
+    return amplitude * np.sin(2 * np.pi * carrier * t + index * np.sin(2 * np.pi * modulation * t))
+
+
+def _tones_by_fft(n, sample_rate, amps, freqs, phases):
+    """Sum of bin-aligned tones through one inverse real FFT"""
+    bins = np.rint(freqs * n / sample_rate).astype(np.int64) % n
+    amps, phases = amps.astype(float), phases.astype(float)
+
+    # Bins above Nyquist alias: sin(2π(n-k)m/n + φ) = -sin(2πkm/n - φ)
+    upper = bins > n // 2
+    bins = np.where(upper, n - bins, bins)
+    amps = np.where(upper, -amps, amps)
+    phases = np.where(upper, -phases, phases)
+
+    spectrum = np.zeros(n // 2 + 1, complex)
+    # a·sin(2πkm/n + φ) has rfft coefficient (n·a/2)·e^{i(φ - π/2)}
+    coefficients = n * amps / 2 * np.exp(1j * (phases - np.pi / 2))
+    # DC (and Nyquist for even n) are constant (alternating) real terms
+    edge = (bins == 0) | ((n % 2 == 0) & (bins == n // 2))
+    coefficients[edge] = n * amps[edge] * np.sin(phases[edge])
+    np.add.at(spectrum, bins, coefficients)
+    return np.fft.irfft(spectrum, n)
+
+
+def synthesize(n, sample_rate, amps, freqs, phases, block=4_000_000):
+    """Sum of tones sampled at t = m / sample_rate for m = 0 .. n-1
+
+    Tones with a whole number of cycles per buffer take the inverse FFT
+    path; the rest are broadcast against blocks of samples so at most
+    ``block`` sines are held in memory at once.
+    """
+    amps, freqs, phases = (np.atleast_1d(np.asarray(a, dtype=float)) for a in (amps, freqs, phases))
+    cycles = freqs * n / sample_rate
+    aligned = np.abs(cycles - np.rint(cycles)) < 1e-9
+
+    y = np.zeros(n)
+    if aligned.any():
+        y += _tones_by_fft(n, sample_rate, amps[aligned], freqs[aligned], phases[aligned])
+    if not aligned.all():
+        amps, freqs, phases = amps[~aligned], freqs[~aligned], phases[~aligned]
+        step = max(block // len(amps), 1)
+        for start in range(0, n, step):
+            t = np.arange(start, min(start + step, n))[:, None] / sample_rate
+            y[start:start + step] += np.sin(2 * np.pi * freqs * t + phases) @ amps
+    return y
+
+
+# Spectrum analysis
+
+WINDOWS = {
+    'Hann': np.hanning,
+    'Hamming': np.hamming,
+    'Blackman': np.blackman,
+    'Rectangular': np.ones,
+}
+
+_window_cache = {}
+
+
+def window(name, n):
+    """Cached window of length ``n``"""
+    key = (name, n)
+    if key not in _window_cache:
+        if len(_window_cache) > 8:
+            _window_cache.clear()
+        _window_cache[key] = WINDOWS[name](n)
+    return _window_cache[key]
+
+
+def spectrum(y, sample_rate, window_name='Hann'):
+    """One-sided amplitude and phase spectrum of ``y`` with a window
+
+    Amplitudes are scaled by the window's coherent gain, so a bin-aligned
+    tone of amplitude a reads a. Returns (freqs, amplitude, phase).
+    """
+    n = len(y)
+    w = window(window_name, n)
+    coefficients = np.fft.rfft(y * w)
+    amplitude = np.abs(coefficients) * (2 / w.sum())
+    amplitude[0] /= 2
+    if n % 2 == 0:
+        amplitude[-1] /= 2
+    return np.fft.rfftfreq(n, 1 / sample_rate), amplitude, np.angle(coefficients)
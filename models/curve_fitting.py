@@ -1,14 +1,126 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QPushButton, QFrame, QComboBox)
-from PyQt6.QtCore import Qt
+                            QLabel, QPushButton, QFrame, QComboBox, QFileDialog,
+                            QProgressDialog, QApplication, QCheckBox)
+from PyQt6.QtCore import Qt, pyqtSignal
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from scipy import stats
-from scipy.optimize import curve_fit
+from core.datasets import CACHE_DIR, FILE_FILTER, Dataset, load_dataset
+from core.decimation import scatter_cells
+from core.fitting import (FIT_MODELS, PolynomialAccumulator, PolynomialModel, evaluate_fit, fit,
+                          fit_metrics, rank_fits, uncertainty_bands)
+
+# Curve colours of 'Compare All'
+COMPARE_COLORS = {
+    'Linear': '#d62728',
+    'Quadratic': '#ff7f0e',
+    'Cubic': '#9467bd',
+    'Exponential': '#2ca02c',
+    'Power Law': '#8c564b',
+    'Logarithmic': '#e377c2',
+}
+# Columns of the comparison table: (fit_criteria key, heading)
+COMPARE_COLUMNS = [('r_squared', 'R²'), ('aic', 'AIC'), ('bic', 'BIC'), ('cv_rmse', 'CV RMSE')]
+# Uncertainty choices: band method of core.fitting.uncertainty_bands
+BAND_CHOICES = {
+    "No Bands": None,
+    "95% Bands (Analytic)": 'analytic',
+    "95% Bands (Bootstrap)": 'bootstrap',
+}
+
+# Fits of loaded files run in worker threads (the chunk math runs in NumPy
+# and LAPACK without the GIL) and also compute the residual points to draw,
+# decimated to the residual plot's pixels, so the GUI thread only draws.
+
+def residual_points(model, params, data, domain, residual_range, shape=None, chunks=None):
+    """(x, residual) of a fit to ``data``, decimated to ``shape`` cells if given
+
+    ``chunks`` replaces ``data.chunks`` (see until_cancelled).
+    """
+    chunks = chunks or data.chunks
+    with np.errstate(all='ignore'):
+        residuals = [(x, y - model.predict(x, params)) for x, y in chunks()]
+        if shape is None:
+            return tuple(np.concatenate(column) for column in zip(*residuals))
+        return scatter_cells(residuals, domain, residual_range, shape)
+
+
+def curve_x(data):
+    """x of a fitted curve: samples across the data's x-range"""
+    count, x_min, x_max, y_min, y_max = data.bounds()
+    return np.linspace(x_min, x_max, 500)
+
+
+def fit_bands(method, model, params, data, domain, chunks=None):
+    """{'bands': (confidence, prediction)} at curve_x and the method, or {'bands_error': message}"""
+    try:
+        return dict(bands=uncertainty_bands(method, model, params, chunks or data.chunks,
+                                            curve_x(data), domain), band_method=method)
+    except (ValueError, np.linalg.LinAlgError) as e:
+        return dict(bands_error=str(e))
+
+
+def until_cancelled(chunks, cancelled):
+    """``chunks`` that stop early once ``cancelled()`` returns True"""
+    def wrapped():
+        for chunk in chunks():
+            if cancelled():
+                return
+            yield chunk
+    return wrapped
+
+
+def background_fit(name, data, domain, shape=None, progress=None, bands=None, cancelled=None):
+    """fit and fit_metrics plus the residual points and uncertainty ``bands`` (a method)
+
+    Returns 'cancelled' if ``progress`` stops the fit or ``cancelled()``
+    returns True, which is checked before every chunk of every pass.
+    """
+    model = FIT_MODELS[name]
+    stopped = dict(name=name, cancelled=True)
+    if cancelled is None:
+        cancelled = lambda: False
+    chunks = until_cancelled(data.chunks, cancelled)
+    try:
+        params = fit(name, chunks, domain, progress=progress, cancelled=cancelled)
+        if params is None or cancelled():
+            return stopped
+        metrics = fit_metrics(model, params, chunks)
+        if cancelled():
+            return stopped
+        result = dict(name=name, params=params, **metrics, residuals=residual_points(
+            model, params, data, domain, metrics['residual_range'], shape, chunks))
+        if bands is not None and not cancelled():
+            result.update(fit_bands(bands, model, params, data, domain, chunks))
+    except (ValueError, np.linalg.LinAlgError):
+        # A pass cut short by a cancel may leave too few rows for the fit
+        if cancelled():
+            return stopped
+        raise
+    return stopped if cancelled() else result
+
+
+def compare_fit(name, data, domain, shape=None):
+    """evaluate_fit plus the residual points"""
+    result = evaluate_fit(name, data.chunks, domain)
+    if 'error' not in result:
+        result['residuals'] = residual_points(FIT_MODELS[name], result['params'], data, domain,
+                                              result['residual_range'], shape)
+    return result
+
 
 class CurveFitting(QMainWindow):
+    # Sent from worker threads, with the generation the work was started in:
+    # a result of one model of 'Compare All' (a compare_fit dict), the
+    # iterations of a background fit and its result (a background_fit dict)
+    fit_compared = pyqtSignal(int, object)
+    fit_progress = pyqtSignal(int, int, float)
+    fit_finished = pyqtSignal(int, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Curve Fitting Explorer 📈")
@@ -17,6 +129,27 @@ class CurveFitting(QMainWindow):
         # Initialize data points
         self.x_points = []
         self.y_points = []
+        # A loaded data file (memory-mapped) replaces the clicked points
+        self.dataset = None
+        # Running sums of the clicked points for the polynomial fits. Clicks
+        # start in the default [0, 1] view, so that is the sums' first range;
+        # track_points recentres them when the points outgrow it
+        self.accumulator = PolynomialAccumulator(center=0.5, scale=0.5)
+
+        # Fits of loaded files and 'Compare All' run in worker threads.
+        # Results carry the generation they were started in; a data change
+        # or a new fit starts a new one, so late results of old work are dropped
+        self.pool = None
+        self.futures = []
+        self.generation = 0
+        self.comparison = {}
+        self.compare_data = None
+        self.fit_request = None  # (fit type, data) of the background fit
+        self.fit_cancel = threading.Event()
+        self.fit_dialog = None
+        self.fit_compared.connect(self.show_comparison)
+        self.fit_progress.connect(self.show_fit_progress)
+        self.fit_finished.connect(self.show_background_fit)
 
         # Create main widget and layout
         main_widget = QWidget()
@@ -51,8 +184,11 @@ class CurveFitting(QMainWindow):
         self.fit_button = QPushButton("Fit Curve 📊")
         self.reset_button = QPushButton("Reset 🔄")
         self.undo_button = QPushButton("Undo ↩")
+        self.load_button = QPushButton("Load Data 📂")
+        self.compare_button = QPushButton("Compare All ⚖")
         
-        for button in [self.fit_button, self.reset_button, self.undo_button]:
+        for button in [self.fit_button, self.reset_button, self.undo_button, self.load_button,
+                       self.compare_button]:
             button.setStyleSheet("""
                 QPushButton {
                     padding: 8px 15px;
@@ -70,12 +206,32 @@ class CurveFitting(QMainWindow):
         self.fit_button.clicked.connect(self.fit_curve)
         self.reset_button.clicked.connect(self.reset_plot)
         self.undo_button.clicked.connect(self.undo_last_point)
+        self.load_button.clicked.connect(self.load_data)
+        self.compare_button.clicked.connect(self.compare_all)
+
+        # Confidence and prediction bands around the fitted curve
+        band_label = QLabel("Uncertainty:")
+        self.band_combo = QComboBox()
+        self.band_combo.addItems(BAND_CHOICES)
+        self.band_combo.setStyleSheet(self.fit_combo.styleSheet())
+        self.band_combo.currentTextChanged.connect(self.bands_changed)
+
+        # Refit after every click, undo and fit type change
+        self.auto_fit_check = QCheckBox("Auto-fit as I click")
+        self.auto_fit_check.toggled.connect(self.auto_fit_changed)
+        self.fit_combo.currentTextChanged.connect(
+            lambda text: self.auto_fit_changed(self.auto_fit_check.isChecked()))
 
         control_panel.addWidget(fit_label)
         control_panel.addWidget(self.fit_combo)
         control_panel.addWidget(self.fit_button)
+        control_panel.addWidget(self.compare_button)
         control_panel.addWidget(self.undo_button)
         control_panel.addWidget(self.reset_button)
+        control_panel.addWidget(self.load_button)
+        control_panel.addWidget(self.auto_fit_check)
+        control_panel.addWidget(band_label)
+        control_panel.addWidget(self.band_combo)
         control_panel.addStretch()
 
         layout.addLayout(control_panel)
@@ -100,6 +256,7 @@ class CurveFitting(QMainWindow):
         layout.addWidget(self.info_display)
         
         # Initialize the plot
+        self.setup_plot()
         self.update_plot()
         
         # Initial message
@@ -110,9 +267,14 @@ class CurveFitting(QMainWindow):
 
     def on_click(self, event):
         """Handle mouse clicks on the plot"""
+        if self.dataset is not None:
+            self.info_display.setText("Points cannot be added to a loaded data file. "
+                                      "Click 'Reset' to go back to clicking points.")
+            return
         if event.inaxes is not None:
             self.x_points.append(event.xdata)
             self.y_points.append(event.ydata)
+            self.track_points(event.xdata, event.ydata)
             self.update_plot()
             
             # Update point count
@@ -120,19 +282,29 @@ class CurveFitting(QMainWindow):
                 f"Points added: {len(self.x_points)}\n"
                 "Click 'Fit Curve' when ready to analyze!"
             )
+            if self.auto_fit_check.isChecked():
+                self.fit_curve()
 
-    def update_plot(self):
-        """Update the plot with current points"""
-        self.figure.clear()
-        
-        # Create two subplots
+    def setup_plot(self):
+        """Create the axes and their artists once; updates only change their data"""
         self.ax_main = self.figure.add_subplot(211)  # Main plot
-        self.ax_residual = self.figure.add_subplot(212)  # Residual plot
+        self.ax_residual = self.figure.add_subplot(212, sharex=self.ax_main)  # Residual plot
         
-        # Plot points on main plot
-        if self.x_points:
-            self.ax_main.scatter(self.x_points, self.y_points, 
-                               color='blue', alpha=0.6, label='Data Points')
+        # Points are drawn as line markers rather than a scatter collection,
+        # so relim() autoscales the axes to them
+        self.data_line, = self.ax_main.plot([], [], 'o', color='blue', alpha=0.6,
+                                            label='Data Points')
+        self.fit_line, = self.ax_main.plot([], [], 'r-', label='Fitted Curve')
+        self.residual_line, = self.ax_residual.plot([], [], 'o', color='green', alpha=0.6)
+        # Bands: the confidence band is shaded (a fill, replaced per fit), the
+        # prediction band dotted (one line for both edges, split by a NaN).
+        # Below, both are shown around zero, relative to the fitted curve
+        self.confidence_fills = []
+        self.prediction_line, = self.ax_main.plot([], [], ':', color='red',
+                                                  label='95% Prediction Band')
+        self.residual_prediction_line, = self.ax_residual.plot([], [], ':', color='red')
+        self.compare_lines = {name: self.ax_main.plot([], [], '-', color=color, label=name)[0]
+                              for name, color in COMPARE_COLORS.items()}
             
         # Set labels and grid
         self.ax_main.set_xlabel('X')
@@ -147,118 +319,386 @@ class CurveFitting(QMainWindow):
         self.ax_residual.axhline(y=0, color='r', linestyle='-', alpha=0.3)
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.mpl_connect('resize_event', lambda event: self.figure.tight_layout())
 
-    def fit_curve(self):
-        """Perform curve fitting based on selected type"""
+    def update_plot(self):
+        """Update the plot with current points"""
+        self.stop_fits()
+        if self.dataset is not None:
+            count, x_min, x_max, y_min, y_max = self.dataset.bounds()
+            self.show_points(self.data_line, self.dataset.chunks(), (x_min, x_max),
+                             (y_min, y_max))
+        else:
+            self.show_points(self.data_line, [(self.x_points, self.y_points)])
+        self.fit_line.set_data([], [])
+        self.residual_line.set_data([], [])
+        self.show_bands(None)
+        self.ax_main.set_title('Interactive Curve Fitting')
+        self.show_legend(self.dataset is not None)
+        self.refresh_axes()
+        if self.dataset is None and not self.x_points:
+            # Nothing to autoscale to: back to the empty plot's view
+            self.ax_main.set_xlim(0, 1, auto=None)
+            self.ax_main.set_ylim(0, 1, auto=None)
+
+    def data_to_fit(self):
+        """The loaded Dataset or the clicked points as one; None (and a message) if too few"""
+        if self.dataset is not None:
+            return self.dataset
         if len(self.x_points) < 2:
             self.info_display.setText("Need at least 2 points for fitting!")
-            return
+            return None
+        return Dataset.from_points(self.x_points, self.y_points)
 
-        x = np.array(self.x_points)
-        y = np.array(self.y_points)
+    def fit_curve(self):
+        """Perform curve fitting based on selected type"""
+        data = self.data_to_fit()
+        if data is None:
+            return
+        self.stop_fits()
         
         fit_type = self.fit_combo.currentText()
+        name = fit_type.split(' (')[0]
+        model = FIT_MODELS[name]
         
         try:
-            # Perform fitting based on selected type
-            if "Linear" in fit_type:
-                slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-                y_fit = slope * x + intercept
-                equation = f"y = {slope:.4f}x + {intercept:.4f}"
-                r_squared = r_value**2
-                
-            elif "Quadratic" in fit_type:
-                coeffs = np.polyfit(x, y, 2)
-                y_fit = np.polyval(coeffs, x)
-                equation = f"y = {coeffs[0]:.4f}x² + {coeffs[1]:.4f}x + {coeffs[2]:.4f}"
-                r_squared = 1 - np.sum((y - y_fit)**2) / np.sum((y - np.mean(y))**2)
-                
-            elif "Cubic" in fit_type:
-                coeffs = np.polyfit(x, y, 3)
-                y_fit = np.polyval(coeffs, x)
-                equation = f"y = {coeffs[0]:.4f}x³ + {coeffs[1]:.4f}x² + {coeffs[2]:.4f}x + {coeffs[3]:.4f}"
-                r_squared = 1 - np.sum((y - y_fit)**2) / np.sum((y - np.mean(y))**2)
-                
-            elif "Exponential" in fit_type:
-                def exp_func(x, a, b):
-                    return a * np.exp(b * x)
-                popt, _ = curve_fit(exp_func, x, y)
-                y_fit = exp_func(x, *popt)
-                equation = f"y = {popt[0]:.4f}·e^({popt[1]:.4f}x)"
-                r_squared = 1 - np.sum((y - y_fit)**2) / np.sum((y - np.mean(y))**2)
-                
-            elif "Power Law" in fit_type:
-                def power_func(x, a, b):
-                    return a * np.power(x, b)
-                popt, _ = curve_fit(power_func, x, y)
-                y_fit = power_func(x, *popt)
-                equation = f"y = {popt[0]:.4f}·x^{popt[1]:.4f}"
-                r_squared = 1 - np.sum((y - y_fit)**2) / np.sum((y - np.mean(y))**2)
-                
-            else:  # Logarithmic
-                def log_func(x, a, b):
-                    return a * np.log(x) + b
-                popt, _ = curve_fit(log_func, x, y)
-                y_fit = log_func(x, *popt)
-                equation = f"y = {popt[0]:.4f}·ln(x) + {popt[1]:.4f}"
-                r_squared = 1 - np.sum((y - y_fit)**2) / np.sum((y - np.mean(y))**2)
-
-            # Calculate residuals
-            residuals = y - y_fit
-            
-            # Update plots
-            self.figure.clear()
-            
-            # Main plot
-            self.ax_main = self.figure.add_subplot(211)
-            self.ax_main.scatter(x, y, color='blue', alpha=0.6, label='Data Points')
-            
-            # Sort x and y_fit for smooth curve
-            sort_idx = np.argsort(x)
-            x_sorted = x[sort_idx]
-            y_fit_sorted = y_fit[sort_idx]
-            
-            self.ax_main.plot(x_sorted, y_fit_sorted, 'r-', label='Fitted Curve')
-            self.ax_main.set_xlabel('X')
-            self.ax_main.set_ylabel('Y')
-            self.ax_main.grid(True, linestyle='--', alpha=0.7)
-            self.ax_main.legend()
-            self.ax_main.set_title(f'Curve Fitting: {fit_type}')
-            
-            # Residual plot
-            self.ax_residual = self.figure.add_subplot(212)
-            self.ax_residual.scatter(x, residuals, color='green', alpha=0.6)
-            self.ax_residual.axhline(y=0, color='r', linestyle='-', alpha=0.3)
-            self.ax_residual.set_xlabel('X')
-            self.ax_residual.set_ylabel('Residuals')
-            self.ax_residual.grid(True, linestyle='--', alpha=0.7)
-            
-            self.figure.tight_layout()
-            self.canvas.draw()
-            
-            # Update information display
-            rmse = np.sqrt(np.mean(residuals**2))
-            mae = np.mean(np.abs(residuals))
-            
-            info_text = f"""
-            <b>Fitting Results:</b><br>
-            • Equation: {equation}<br>
-            • R² Score: {r_squared:.4f}<br>
-            • Root Mean Square Error: {rmse:.4f}<br>
-            • Mean Absolute Error: {mae:.4f}<br>
-            • Number of Points: {len(x)}<br>
-            • Fit Type: {fit_type}
-            """
-            self.info_display.setText(info_text)
+            if self.dataset is None and isinstance(model, PolynomialModel):
+                # Clicked points: straight from the running sums
+                params, metrics = self.accumulator.metrics(model.degree)
+                residuals = np.asarray(self.y_points) - model.predict(np.asarray(self.x_points),
+                                                                       params)
+                metrics['mae'] = np.abs(residuals).mean()
+                method = BAND_CHOICES[self.band_combo.currentText()]
+                if method is not None:
+                    count, x_min, x_max, y_min, y_max = data.bounds()
+                    metrics.update(fit_bands(method, model, params, data, (x_min, x_max)))
+                self.show_fit(fit_type, data, params, metrics, (self.x_points, residuals))
+            else:
+                # Fit in chunks in a worker: loaded files are never read
+                # into memory whole, and the window stays responsive
+                self.start_fit(fit_type, data)
             
         except Exception as e:
             self.info_display.setText(f"Fitting error: {str(e)}")
 
+    def start_fit(self, fit_type, data):
+        """Run a fit in the worker pool, with a progress dialog that can cancel it"""
+        name = fit_type.split(' (')[0]
+        count, x_min, x_max, y_min, y_max = data.bounds()  # Once, before the thread shares it
+        bbox = self.ax_residual.bbox
+        shape = None if self.dataset is None else (int(bbox.width), int(bbox.height))
+        generation, cancel = self.generation, self.fit_cancel
+        self.fit_request = (fit_type, data)
+
+        self.fit_dialog = QProgressDialog(f"Fitting {name}…", "Cancel", 0, 0, self)
+        self.fit_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.fit_dialog.setMinimumDuration(500)
+        self.fit_dialog.canceled.connect(cancel.set)
+        self.fit_dialog.setValue(0)  # Starts the timer that shows it
+
+        def progress(iteration, sse):
+            self.fit_progress.emit(generation, iteration, sse)
+            return not cancel.is_set()
+
+        future = self.worker_pool().submit(background_fit, name, data, (x_min, x_max), shape,
+                                           progress, BAND_CHOICES[self.band_combo.currentText()],
+                                           cancel.is_set)
+        future.add_done_callback(lambda future: self.report_result(
+            self.fit_finished, generation, name, future))
+        self.futures.append(future)
+
+    def show_fit_progress(self, generation, iteration, sse):
+        if generation == self.generation and self.fit_dialog is not None:
+            name = self.fit_request[0].split(' (')[0]
+            self.fit_dialog.setLabelText(f"Fitting {name}… iteration {iteration}, "
+                                         f"residual sum of squares {sse:.6g}")
+
+    def show_background_fit(self, generation, result):
+        """Show the result of start_fit, unless the data or fit changed since"""
+        if generation != self.generation:
+            return
+        self.close_fit_dialog()
+        fit_type, data = self.fit_request
+        if 'error' in result:
+            self.info_display.setText(f"Fitting error: {result['error']}")
+        elif result.get('cancelled'):
+            self.info_display.setText("Fit cancelled.")
+        else:
+            self.show_fit(fit_type, data, result['params'], result, result['residuals'])
+
+    def show_fit(self, fit_type, data, params, metrics, residuals):
+        """Draw a fitted curve and its residual points and list its metrics"""
+        model = FIT_MODELS[fit_type.split(' (')[0]]
+        count, x_min, x_max, y_min, y_max = data.bounds()
+        equation = model.equation(params)
+        
+        # The fitted curve, sampled across the data's x-range
+        x_curve = curve_x(data)
+        with np.errstate(all='ignore'):
+            y_curve = model.predict(x_curve, params)
+        self.fit_line.set_data(x_curve, y_curve)
+        self.show_bands(x_curve, y_curve, metrics.get('bands'))
+        self.ax_main.set_title(f'Curve Fitting: {fit_type}')
+        self.show_legend(True)
+        
+        # Residual plot
+        self.show_points(self.residual_line, [residuals], (x_min, x_max),
+                         metrics.get('residual_range'))
+        self.refresh_axes()
+        
+        # Update information display
+        if 'bands' in metrics:
+            bands_text = ("• Uncertainty: 95% confidence (shaded) and prediction (dotted) "
+                          f"bands, {metrics['band_method']}<br>")
+        elif 'bands_error' in metrics:
+            bands_text = f"• Uncertainty bands unavailable: {metrics['bands_error']}<br>"
+        else:
+            bands_text = ""
+        info_text = f"""
+        <b>Fitting Results:</b><br>
+        • Equation: {equation}<br>
+        • R² Score: {metrics['r_squared']:.4f}<br>
+        • Root Mean Square Error: {metrics['rmse']:.4f}<br>
+        • Mean Absolute Error: {metrics['mae']:.4f}<br>
+        • Number of Points: {metrics['count']:,}<br>
+        {bands_text}• Fit Type: {fit_type}
+        """
+        self.info_display.setText(info_text)
+
+    def show_bands(self, x, y=None, bands=None):
+        """Draw (confidence, prediction) bands of the curve y(x); show_bands(None) hides them"""
+        for fill in self.confidence_fills:
+            fill.remove()
+        self.confidence_fills = []
+        if bands is None:
+            self.prediction_line.set_data([], [])
+            self.residual_prediction_line.set_data([], [])
+            return
+        confidence, prediction = bands
+        for ax, line, center in ((self.ax_main, self.prediction_line, 0),
+                                 (self.ax_residual, self.residual_prediction_line, y)):
+            self.confidence_fills.append(ax.fill_between(
+                x, *(confidence - center), color='red', alpha=0.15, linewidth=0,
+                label='95% Confidence Band'))
+            lower, upper = prediction - center
+            line.set_data(np.r_[x, np.nan, x], np.r_[lower, np.nan, upper])
+
+    def compare_all(self):
+        """Fit every model at once in worker threads and rank them as results arrive"""
+        data = self.data_to_fit()
+        if data is None:
+            return
+        self.stop_fits()
+        self.fit_line.set_data([], [])
+        self.residual_line.set_data([], [])
+        self.show_bands(None)
+        count, x_min, x_max, y_min, y_max = data.bounds()  # Once, before the threads share it
+
+        generation = self.generation
+        self.compare_data = data
+        # Residuals are computed (and decimated) by the workers as well
+        bbox = self.ax_residual.bbox
+        shape = None if self.dataset is None else (int(bbox.width), int(bbox.height))
+        for name in FIT_MODELS:
+            future = self.worker_pool().submit(compare_fit, name, data, (x_min, x_max), shape)
+            future.add_done_callback(lambda future, name=name: self.report_result(
+                self.fit_compared, generation, name, future))
+            self.futures.append(future)
+        self.ax_main.set_title('Comparing all fits…')
+        self.show_legend(True)
+        self.refresh_axes()
+        self.show_comparison_table()
+
+    def worker_pool(self):
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=min(len(FIT_MODELS), os.cpu_count() or 1))
+        return self.pool
+
+    def report_result(self, signal, generation, name, future):
+        """Done callback of a worker fit (runs in its thread): send the result dict"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = dict(name=name, error=str(error)) if error is not None else future.result()
+        signal.emit(generation, result)
+
+    def show_comparison(self, generation, result):
+        """Add one model's comparison result: its curve, the ranking and the best residuals"""
+        if generation != self.generation:
+            return
+        self.comparison[result['name']] = result
+        count, x_min, x_max, y_min, y_max = self.compare_data.bounds()
+        model = FIT_MODELS[result['name']]
+        if 'error' not in result:
+            x_curve = np.linspace(x_min, x_max, 500)
+            with np.errstate(all='ignore'):
+                self.compare_lines[result['name']].set_data(x_curve, model.predict(x_curve,
+                                                                                   result['params']))
+
+        # Residuals of the best model so far, by AIC
+        ranking = rank_fits(self.comparison.values(), 'aic')
+        if ranking and ranking[0] == result['name']:
+            self.show_points(self.residual_line, [result['residuals']], (x_min, x_max),
+                             result['residual_range'])
+            self.ax_residual.set_ylabel(f"Residuals ({result['name']})")
+        done = len(self.comparison) == len(FIT_MODELS)
+        if done:
+            self.ax_main.set_title(f"Best fit by AIC: {ranking[0]}" if ranking
+                                   else 'No model could be fitted')
+        self.show_legend(True)
+        self.refresh_axes()
+        self.show_comparison_table()
+
+    def show_comparison_table(self):
+        """Comparison results in the info display, each score with its rank"""
+        results = list(self.comparison.values())
+        ranks = {key: {name: rank for rank, name in enumerate(rank_fits(results, key), 1)}
+                 for key, heading in COMPARE_COLUMNS}
+        order = rank_fits(results, 'aic')
+        headings = "".join(f"<th>{heading}</th>" for key, heading in COMPARE_COLUMNS)
+        rows = []
+        for name in order:
+            result = self.comparison[name]
+            cells = "".join(f"<td>{result[key]:.4g} (#{ranks[key][name]})</td>"
+                            for key, heading in COMPARE_COLUMNS)
+            rows.append(f"<tr><td style='color:{COMPARE_COLORS[name]}'><b>{name}</b></td>"
+                        f"{cells}<td>{result['equation']}</td></tr>")
+        for name, result in self.comparison.items():
+            if 'error' in result:
+                rows.append(f"<tr><td><b>{name}</b></td>"
+                            f"<td colspan='5'>Not fitted: {result['error']}</td></tr>")
+        waiting = len(FIT_MODELS) - len(self.comparison)
+        status = f" ({waiting} still fitting…)" if waiting else ""
+        count = self.compare_data.bounds()[0]
+        self.info_display.setText(
+            f"<b>Model Comparison</b>{status} — {count:,} points, "
+            "ranked best first (higher R², lower AIC, BIC and cross-validated RMSE):"
+            "<table cellspacing='0' cellpadding='3'>"
+            f"<tr><th align='left'>Model</th>{headings}<th align='left'>Equation</th></tr>"
+            f"{''.join(rows)}</table>"
+        )
+
+    def stop_fits(self):
+        """Drop running worker fits (cancelling a background fit) and hide comparison curves"""
+        self.generation += 1
+        for future in self.futures:
+            future.cancel()
+        self.futures = []
+        self.fit_cancel.set()
+        self.fit_cancel = threading.Event()
+        self.close_fit_dialog()
+        self.comparison = {}
+        for line in self.compare_lines.values():
+            line.set_data([], [])
+        self.ax_residual.set_ylabel('Residuals')
+
+    def close_fit_dialog(self):
+        if self.fit_dialog is not None:
+            self.fit_dialog.canceled.disconnect()
+            self.fit_dialog.close()
+            self.fit_dialog.deleteLater()
+            self.fit_dialog = None
+
+    def show_points(self, line, chunks, x_range=None, y_range=None):
+        """Show (x, y) chunks on a points line, decimated to pixels for loaded files"""
+        if self.dataset is None:
+            x, y = (np.concatenate(column) for column in zip(*chunks))
+            line.set_marker('o')
+            line.set_markersize(6)
+            line.set_data(x, y)
+            line.set_label('Data Points')
+            return
+        ax = line.axes
+        with np.errstate(all='ignore'):
+            x, y = scatter_cells(chunks, x_range, y_range, (int(ax.bbox.width), int(ax.bbox.height)))
+        line.set_marker('.')
+        line.set_markersize(2)
+        line.set_data(x, y)
+        line.set_label(f"Data Points ({len(self.dataset):,} rows, {len(x):,} drawn)")
+
+    def show_legend(self, visible):
+        legend = self.ax_main.get_legend()
+        if legend is not None:
+            legend.remove()
+        if visible:
+            lines = [self.data_line, self.fit_line, self.prediction_line,
+                     *self.compare_lines.values()]
+            self.ax_main.legend(handles=[line for line in lines if len(line.get_xdata())]
+                                + self.confidence_fills[:1])
+
+    def refresh_axes(self):
+        for ax in (self.ax_main, self.ax_residual):
+            ax.relim()
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def bands_changed(self, text):
+        """Refit the shown fit with the chosen bands"""
+        if len(self.fit_line.get_xdata()):
+            self.fit_curve()
+
+    def auto_fit_changed(self, checked):
+        if checked and (self.dataset is not None or len(self.x_points) >= 2):
+            self.fit_curve()
+
+    def load_data(self):
+        """Open a CSV or binary data file, memory-mapped, in place of the clicked points"""
+        path, _ = QFileDialog.getOpenFileName(self, "Load Data", "", FILE_FILTER)
+        if not path:
+            return
+        progress = QProgressDialog(
+            "Reading data file…\nText files are converted once to a binary copy (up to rows × "
+            f"columns × 8 bytes) in {CACHE_DIR}, which is kept.", "Cancel", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def report(fraction):
+            progress.setValue(int(fraction * 100))
+            QApplication.processEvents()
+            return not progress.wasCanceled()
+
+        try:
+            dataset = load_dataset(path, progress=report)
+            if dataset is not None and not dataset.bounds()[0]:
+                raise ValueError("no rows with two numbers")
+        except Exception as e:
+            self.info_display.setText(f"Could not load {path}: {str(e)}")
+            return
+        finally:
+            progress.close()
+        if dataset is None:
+            return
+        self.set_dataset(dataset)
+
+    def set_dataset(self, dataset):
+        """Show a loaded Dataset; fits then run over its chunks"""
+        self.dataset = dataset
+        self.update_plot()
+        cache_note = ""
+        if dataset.cache is not None:
+            cache_note = (f"<br>A binary copy ({os.path.getsize(dataset.cache) / 2 ** 20:,.1f} MB) "
+                          f"is kept in {CACHE_DIR} for fast reloading; delete it to free the space.")
+        self.info_display.setText(
+            f"Loaded {dataset.name}: {dataset.bounds()[0]:,} points. "
+            f"Click 'Fit Curve' to analyze!{cache_note}"
+        )
+
+    def track_points(self, x, y, weight=1.0):
+        """Add a clicked point to the sums, or remove it with a weight of -1
+
+        The sums are rebuilt around the clicked points' range when the
+        points leave the range they were centred on, or shrink well inside it.
+        """
+        self.accumulator.add(x, y, weight)
+        if self.x_points and not self.accumulator.covers(min(self.x_points), max(self.x_points)):
+            self.accumulator.rescale(self.x_points, self.y_points)
+
     def reset_plot(self):
         """Clear all points and reset the plot"""
         self.x_points = []
         self.y_points = []
+        self.dataset = None
+        self.accumulator.clear()
         self.update_plot()
         self.info_display.setText(
             "Plot reset! Click anywhere to add new points."
@@ -267,9 +707,18 @@ class CurveFitting(QMainWindow):
     def undo_last_point(self):
         """Remove the last added point"""
         if self.x_points:
-            self.x_points.pop()
-            self.y_points.pop()
+            self.track_points(self.x_points.pop(), self.y_points.pop(), -1.0)
             self.update_plot()
             self.info_display.setText(
                 f"Last point removed. Remaining points: {len(self.x_points)}"
-            ) 
\ No newline at end of file
+            )
+            if self.auto_fit_check.isChecked() and len(self.x_points) >= 2:
+                self.fit_curve()
+
+    def closeEvent(self, event):
+        """Drop pending worker fits; running comparisons finish in the background"""
+        self.stop_fits()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        super().closeEvent(event)
@@ -0,0 +1,174 @@
+import argparse
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+
+from models.derivative_scenes import DERIVATIVE_SCENES
+
+# Offscreen export of the DerivativeVisualizer animations.
+#
+# Frames are rendered with the Agg backend on plain Figures, so no Qt window
+# (or display) is needed. Animation time is stepped deterministically as
+# frame / fps and every frame reseeds the scene's random generator, so an
+# export is reproducible frame for frame. The frame range is split into
+# contiguous chunks rendered by worker processes; each worker first replays
+# the earlier frames without drawing so that state carried between frames
+# (grown axis limits) matches a sequential run.
+#
+#     python -m models.derivative_export "Drone Control" -o frames/drone
+#     python -m models.derivative_export all -o videos --video
+
+
+def frame_times(duration=3.0, fps=60):
+    """Deterministic animation times of a clip: frame / fps"""
+    return np.arange(int(round(duration * fps))) / fps
+
+
+def _render_chunk(model_name, times, start, stop, figsize, dpi, directory=None):
+    """Render frames ``start:stop`` of one model (runs in a worker process)
+
+    Writes PNG files when ``directory`` is given, otherwise returns the
+    frames as raw RGB bytes.
+    """
+    figure = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    scene = DERIVATIVE_SCENES[model_name](figure)
+    scene.build()
+
+    # Replay earlier frames so limit changes match a sequential run
+    for index in range(start):
+        scene.rng = np.random.default_rng(index)
+        scene.update(times[index])
+
+    frames = []
+    for index in range(start, stop):
+        scene.rng = np.random.default_rng(index)
+        scene.update(times[index])
+        canvas.draw()
+        pixels = np.asarray(canvas.buffer_rgba())
+        if directory is not None:
+            imsave(os.path.join(directory, f'frame_{index:05d}.png'), pixels)
+        else:
+            frames.append(pixels[..., :3].tobytes())
+    return frames
+
+
+def _chunks(n_frames, workers):
+    bounds = np.linspace(0, n_frames, workers + 1).astype(int)
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _render(model_name, times, figsize, dpi, workers, directory=None):
+    """Yield rendered chunks in frame order"""
+    if model_name not in DERIVATIVE_SCENES:
+        raise ValueError(f"Unknown model: {model_name}")
+    workers = workers or os.cpu_count() or 1
+    # More chunks than workers keeps frames flowing to the encoder early
+    chunks = _chunks(len(times), 1 if workers == 1 else 4 * workers)
+    args = [(model_name, times, start, stop, figsize, dpi, directory) for start, stop in chunks]
+
+    if workers == 1:
+        for arg in args:
+            yield _render_chunk(*arg)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_render_chunk, *zip(*args))
+
+
+def export_frames(model_name, directory, duration=3.0, fps=60, figsize=(8, 8),
+                  dpi=100, workers=None):
+    """Render one model to ``directory/frame_00000.png`` ...; returns the frame count"""
+    os.makedirs(directory, exist_ok=True)
+    times = frame_times(duration, fps)
+    for _ in _render(model_name, times, figsize, dpi, workers, directory):
+        pass
+    return len(times)
+
+
+def export_video(model_name, path, duration=3.0, fps=60, figsize=(8, 8), dpi=100,
+                 workers=None, codec='libx264'):
+    """Render one model and pipe the frames into ffmpeg; returns the frame count"""
+    width, height = int(figsize[0] * dpi), int(figsize[1] * dpi)
+    times = frame_times(duration, fps)
+    command = [
+        matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+        '-r', str(fps), '-i', '-',
+        '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',  # yuv420p needs even sizes
+        '-vcodec', codec, '-pix_fmt', 'yuv420p', path,
+    ]
+    # ffmpeg's messages go to a file: a pipe nobody reads while frames are
+    # written could fill up and stall both processes
+    with tempfile.TemporaryFile() as log:
+        try:
+            encoder = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=log)
+        except FileNotFoundError:
+            raise RuntimeError("ffmpeg not found; install it or set "
+                               "matplotlib.rcParams['animation.ffmpeg_path']") from None
+
+        stopped = False
+        try:
+            for frames in _render(model_name, times, figsize, dpi, workers):
+                for frame in frames:
+                    encoder.stdin.write(frame)
+            encoder.stdin.close()
+        except BrokenPipeError:
+            stopped = True  # ffmpeg exited early; its status and messages say why
+        except BaseException:
+            encoder.kill()  # Rendering failed: that error is the one to report
+            raise
+        finally:
+            try:
+                encoder.stdin.close()
+            except OSError:  # Unflushed frames ffmpeg no longer reads
+                stopped = True
+            encoder.wait()
+
+        if encoder.returncode != 0 or stopped:
+            log.seek(0)
+            message = log.read().decode(errors='replace').strip()
+            raise RuntimeError(f"ffmpeg exited with status {encoder.returncode}"
+                               + (f": {message}" if message else ""))
+    return len(times)
+
+
+def _file_name(model_name):
+    return model_name.lower().replace(' ', '_').replace('-', '_')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export DerivativeVisualizer animations offscreen")
+    parser.add_argument('model', help="model name, or 'all'")
+    parser.add_argument('-o', '--output', default='derivative_export',
+                        help="output directory (one subdirectory or video per model)")
+    parser.add_argument('--video', action='store_true', help="encode MP4 with ffmpeg instead of PNGs")
+    parser.add_argument('--duration', type=float, default=3.0)
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    models = list(DERIVATIVE_SCENES) if args.model == 'all' else [args.model]
+    for model_name in models:
+        name = _file_name(model_name)
+        if args.video:
+            os.makedirs(args.output, exist_ok=True)
+            path = os.path.join(args.output, name + '.mp4')
+            n = export_video(model_name, path, args.duration, args.fps,
+                             dpi=args.dpi, workers=args.workers)
+        else:
+            path = os.path.join(args.output, name)
+            n = export_frames(model_name, path, args.duration, args.fps,
+                              dpi=args.dpi, workers=args.workers)
+        print(f"{model_name}: {n} frames -> {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,430 @@
+import numpy as np
+from core.ode import solve
+
+# Time-stepped models behind the DerivativeVisualizer scenes. Each function
+# depends only on its parameters (never on the animation time), so the
+# scenes run it once through a TrajectoryCache and index into the result.
+#
+# The reactor, drone, maglev and vibration models are written as vectorized
+# right-hand sides ``rhs(t, y)`` over state vectors with shape (..., n) and
+# integrated by core.ode; ``method`` selects a fixed-step scheme ('euler',
+# 'midpoint', 'rk4') or adaptive 'rk45'. Parameters may be scalars or arrays
+# broadcasting against the leading (batch) axes of the state.
+
+CHEMICAL_REACTOR_PARAMS = dict(
+    V=1000,       # Reactor volume (L)
+    Ea=50000,     # Activation energy (J/mol)
+    R=8.314,      # Gas constant (J/mol·K)
+    dH=-85000,    # Heat of reaction (J/mol)
+    k0=1e10,      # Pre-exponential factor
+    T_set=320,    # Setpoint temperature (K)
+    UA=2.0,       # Overall heat transfer coefficient * Area
+    Cp=4.18,      # Heat capacity (kJ/kg·K)
+    rho=1.0,      # Density (kg/L)
+    T0=300,       # Initial temperature (K)
+    C0=2.0,       # Initial concentration (mol/L)
+    t_end=3.0,
+    steps=300,
+    method='rk4',
+)
+
+VEHICLE_DYNAMICS_PARAMS = dict(
+    accel=3,          # Acceleration phase (m/s²)
+    brake=-4,         # Braking phase (m/s²)
+    omega=2 * np.pi,  # Suspension natural frequency
+    zeta=0.3,         # Suspension damping ratio
+    t_end=10.0,
+    steps=1000,
+)
+
+DRONE_CONTROL_PARAMS = dict(
+    Kp=4.0,  # Proportional gain
+    Ki=1.0,  # Integral gain
+    Kd=1.5,  # Derivative gain
+    z0=4.0,  # Initial altitude (m)
+    control_limit=20,
+    t_end=3.0,
+    steps=300,
+    method='rk4',
+)
+
+MAGLEV_TRAIN_PARAMS = dict(
+    m=1000,           # Train mass (kg)
+    g=9.81,           # Gravity (m/s²)
+    target_gap=0.05,  # Target levitation gap (m)
+    k=5e-6,           # Magnetic force constant
+    Kp=8000,
+    Ki=2000,
+    Kd=4000,
+    t_end=3.0,
+    steps=300,
+    method='rk4',
+)
+
+VIBRATION_PARAMS = dict(
+    m1=1.0, m2=1.0, m3=1.0,            # Masses (kg)
+    k1=150, k2=100, k3=100, k4=150,    # Spring constants (N/m)
+    c1=0.8, c2=0.8, c3=0.8,            # Damping coefficients (Ns/m)
+    F0=10,                             # Force amplitude (N)
+    forcing_freq=2 * np.pi,            # Forcing frequency (rad/s)
+    t_end=3.0,
+    steps=300,
+    method='rk4',
+)
+
+
+def chemical_reactor_rhs(V, Ea, R, dH, k0, T_set, UA, Cp, rho):
+    """State [T, C]: reactor temperature (K) and concentration (mol/L)"""
+    def rhs(t, y):
+        T, C = y[..., 0], y[..., 1]
+
+        # Control system for coolant temperature, with constraints
+        Tc = T_set - 20 + 40 * np.clip((T_set - T)/30, -1, 1)
+
+        # Reaction rate and heat balance (kW)
+        reaction_rate = k0 * np.exp(-Ea/(R * T)) * C
+        Q_gen = reaction_rate * dH * V / 1000
+        Q = UA * (T - Tc)
+
+        dT = (Q_gen - Q) / (V * rho * Cp)
+        return np.stack([dT, -reaction_rate], axis=-1)
+    return rhs
+
+
+def simulate_chemical_reactor(V, Ea, R, dH, k0, T_set, UA, Cp, rho, T0, C0,
+                              t_end, steps, method):
+    """Temperature-controlled exothermic reactor"""
+    t = np.linspace(0, t_end, steps)
+    rhs = chemical_reactor_rhs(V, Ea, R, dH, k0, T_set, UA, Cp, rho)
+    y = solve(rhs, t, [T0, C0], method=method)
+    T, C = y[:, 0], y[:, 1]
+
+    # Controller and heat-transfer signals along the trajectory
+    Tc = T_set - 20 + 40 * np.clip((T_set - T)/30, -1, 1)  # Coolant temperature (K)
+    Q = UA * (T - Tc)  # Heat removal rate (kW)
+    reaction_rate = k0 * np.exp(-Ea/(R * T[-1])) * C[-1]
+    Q_gen = reaction_rate * dH * V / 1000
+
+    return dict(t=t, T=T, C=C, Tc=Tc, Q=Q,
+                dT_dt=np.gradient(T, t), dC_dt=np.gradient(C, t),
+                reaction_rate=reaction_rate, Q_gen=Q_gen)
+
+
+def simulate_vehicle_dynamics(accel, brake, omega, zeta, t_end, steps):
+    """Accelerate-cruise-brake profile with a damped suspension on a bumpy road"""
+    t = np.linspace(0, t_end, steps)
+
+    # Vehicle position (s), velocity (v), and acceleration (a)
+    # Simulate acceleration, cruise, and braking
+    a = np.zeros_like(t)
+    a[(t >= 1) & (t < 3)] = accel  # Acceleration
+    a[(t >= 7) & (t < 9)] = brake  # Braking
+
+    v = np.zeros_like(t)
+    s = np.zeros_like(t)
+
+    # Integrate acceleration to get velocity and position
+    for i in range(1, len(t)):
+        v[i] = v[i-1] + a[i-1] * (t[i] - t[i-1])
+        s[i] = s[i-1] + v[i-1] * (t[i] - t[i-1])
+
+    # Road profile (bumpy road)
+    road = 0.1 * np.sin(2 * np.pi * t) + 0.05 * np.sin(5 * np.pi * t)
+
+    # Solve damped oscillator equation
+    suspension = np.zeros_like(t)
+    for i in range(1, len(t)):
+        dt = t[i] - t[i-1]
+        # Second-order response to road input
+        suspension[i] = suspension[i-1] + dt * (
+            omega * (road[i-1] - suspension[i-1]) -
+            2 * zeta * omega * suspension[i-1]
+        )
+
+    return dict(t=t, a=a, v=v, s=s, road=road, suspension=suspension)
+
+
+def drone_setpoint(t):
+    """Target altitude (m) and its rate of change"""
+    setpoint = 5.0 + 1.0 * np.sin(2 * np.pi * t) + 0.5 * np.sin(4 * np.pi * t)
+    rate = 2 * np.pi * np.cos(2 * np.pi * t) + 2 * np.pi * np.cos(4 * np.pi * t)
+    return setpoint, rate
+
+
+def drone_control_signal(t, y, Kp, Ki, Kd, control_limit):
+    """Saturated PID thrust for state [altitude, velocity, ∫error dt]"""
+    setpoint, setpoint_rate = drone_setpoint(t)
+    error = setpoint - y[..., 0]
+    error_derivative = setpoint_rate - y[..., 1]
+    return np.clip(Kp * error + Ki * y[..., 2] + Kd * error_derivative,
+                   -control_limit, control_limit)
+
+
+def drone_control_rhs(Kp, Ki, Kd, control_limit):
+    """State [z, v, ∫e dt] of a drone under PID altitude control"""
+    def rhs(t, y):
+        control = drone_control_signal(t, y, Kp, Ki, Kd, control_limit)
+        error = drone_setpoint(t)[0] - y[..., 0]
+        acceleration = control - 9.81  # Gravity compensation
+        return np.stack([y[..., 1], acceleration, error], axis=-1)
+    return rhs
+
+
+def simulate_drone_control(Kp, Ki, Kd, z0, control_limit, t_end, steps, method):
+    """PID altitude control of a drone tracking a moving setpoint
+
+    Array-valued parameters are simulated together as a batch; the state
+    series then have shape (steps,) + batch shape.
+    """
+    t = np.linspace(0, t_end, steps)
+    rhs = drone_control_rhs(Kp, Ki, Kd, control_limit)
+    batch_shape = np.broadcast(Kp, Ki, Kd, z0, control_limit).shape
+    y0 = np.zeros(batch_shape + (3,))
+    y0[..., 0] = z0
+    y = solve(rhs, t, y0, method=method)
+
+    # Time as a column so it broadcasts against the batch axes
+    t_col = t.reshape(t.shape + (1,) * len(batch_shape))
+    setpoint = drone_setpoint(t)[0]
+    position = y[..., 0]
+    control_signal = drone_control_signal(t_col, y, Kp, Ki, Kd, control_limit)
+
+    return dict(t=t, setpoint=setpoint, position=position, velocity=y[..., 1],
+                error=drone_setpoint(t_col)[0] - position, error_integral=y[..., 2],
+                control_signal=control_signal)
+
+
+def maglev_disturbance(t):
+    """Track roughness and passenger movement seen by the levitation gap (m)"""
+    track_irregularity = 0.02 * np.sin(2 * np.pi * t)
+    passenger_movement = 0.01 * np.sin(5 * np.pi * t)
+    return track_irregularity, 0.2 * (track_irregularity + passenger_movement)
+
+
+def maglev_current(gap, velocity, error_integral, target_gap, Kp, Ki, Kd):
+    """PID electromagnet current (A), limited to 0-2000 A"""
+    error = target_gap - gap
+    return np.clip(Kp * error + Ki * error_integral - Kd * velocity, 0, 2000)
+
+
+def maglev_train_rhs(m, g, target_gap, k, Kp, Ki, Kd):
+    """State [gap, dgap/dt, ∫error dt] of the levitation controller"""
+    def rhs(t, y):
+        gap = y[..., 0] + maglev_disturbance(t)[1]
+        velocity = y[..., 1]
+        current = maglev_current(gap, velocity, y[..., 2], target_gap, Kp, Ki, Kd)
+
+        # Magnetic force, gravity and damping
+        force = k * current**2 / gap**2
+        acceleration = (force - m*g - 50 * velocity) / m
+        return np.stack([velocity, acceleration, target_gap - gap], axis=-1)
+    return rhs
+
+
+def maglev_constrain(y):
+    """Gap end stops, velocity limit and integrator anti-windup"""
+    return np.stack([np.clip(y[..., 0], 0.01, 0.1),
+                     np.clip(y[..., 1], -0.5, 0.5),
+                     np.clip(y[..., 2], -10, 10)], axis=-1)
+
+
+def simulate_maglev_train(m, g, target_gap, k, Kp, Ki, Kd, t_end, steps, method):
+    """PID levitation-gap control of an electromagnetic maglev
+
+    Array-valued parameters are simulated together as a batch; the state
+    series then have shape (steps,) + batch shape.
+    """
+    t = np.linspace(0, t_end, steps)
+    rhs = maglev_train_rhs(m, g, target_gap, k, Kp, Ki, Kd)
+    batch_shape = np.broadcast(m, g, target_gap, k, Kp, Ki, Kd).shape
+    y0 = np.zeros(batch_shape + (3,))
+    y0[..., 0] = target_gap
+    y = solve(rhs, t, y0, method=method, constrain=maglev_constrain)
+
+    track_irregularity = maglev_disturbance(t)[0]
+    disturbance = maglev_disturbance(t.reshape(t.shape + (1,) * len(batch_shape)))[1]
+    gap = y[..., 0] + disturbance
+    velocity = y[..., 1]
+    current = maglev_current(gap, velocity, y[..., 2], target_gap, Kp, Ki, Kd)
+    force = k * current**2 / gap**2
+
+    # Calculate magnetic field strength (more realistic)
+    B = 2e-4 * current * np.exp(-20 * gap)  # Exponential field decay
+
+    return dict(t=t, gap=gap, current=current, force=force, velocity=velocity,
+                track_irregularity=track_irregularity, B=B,
+                dB_dt=np.gradient(B, t, axis=0),
+                dI_dt=np.gradient(current, t, axis=0))
+
+
+def vibration_rhs(m1, m2, m3, k1, k2, k3, k4, c1, c2, c3, F0, forcing_freq):
+    """State [x1, x2, x3, v1, v2, v3] of the forced three-mass chain
+
+    The chain is linear, dy/dt = A y + f(t), so the spring and damper forces
+    of every mass (and every batch member) come from one matrix product.
+    """
+    k1, k2, k3, k4, c1, c2, c3 = np.broadcast_arrays(k1, k2, k3, k4, c1, c2, c3)
+    zero = np.zeros_like(k1, dtype=float)
+
+    # Stiffness and damping matrices of the chain (N/m, Ns/m)
+    K = np.stack([np.stack([k1 + k2, -k2, zero], -1),
+                  np.stack([-k2, k2 + k3, -k3], -1),
+                  np.stack([zero, -k3, k3 + k4], -1)], -2)
+    C = np.stack([np.stack([c1 + c2, -c2, zero], -1),
+                  np.stack([-c2, c2 + c3, -c3], -1),
+                  np.stack([zero, -c3, c3], -1)], -2)
+    inv_mass = 1 / np.stack(np.broadcast_arrays(m1, m2, m3), -1)[..., None]
+
+    A = np.zeros(np.broadcast_shapes(K.shape[:-2], inv_mass.shape[:-2]) + (6, 6))
+    A[..., :3, 3:] = np.eye(3)
+    A[..., 3:, :3] = -K * inv_mass
+    A[..., 3:, 3:] = -C * inv_mass
+    force_scale = F0 / np.asarray(m1, dtype=float)
+
+    def rhs(t, y):
+        dy = (A @ y[..., None])[..., 0]
+        dy[..., 3] += force_scale * np.sin(forcing_freq * t)  # External force on mass 1
+        return dy
+    return rhs
+
+
+def vibration_energy(y, m1, m2, m3, k1, k2, k3, k4):
+    """Kinetic and potential energy (J) of vibration states"""
+    x1, x2, x3, v1, v2, v3 = (y[..., i] for i in range(6))
+    KE = 0.5 * (m1*v1**2 + m2*v2**2 + m3*v3**2)
+    PE = 0.5 * (k1*x1**2 + k2*(x1-x2)**2 + k3*(x2-x3)**2 + k4*x3**2)
+    return KE, PE
+
+
+def simulate_vibration(m1, m2, m3, k1, k2, k3, k4, c1, c2, c3, F0, forcing_freq,
+                       t_end, steps, method):
+    """Three masses coupled by four springs and three dampers, forced on mass 1
+
+    Array-valued parameters are simulated together as a batch; the returned
+    series then have shape (steps,) + batch shape.
+    """
+    t = np.linspace(0, t_end, steps)
+    rhs = vibration_rhs(m1, m2, m3, k1, k2, k3, k4, c1, c2, c3, F0, forcing_freq)
+
+    # Initial conditions with slight offset, one copy per batch member
+    batch_shape = np.broadcast(m1, m2, m3, k1, k2, k3, k4, c1, c2, c3, F0,
+                               forcing_freq).shape
+    y0 = np.broadcast_to([0.1, 0.0, -0.1, 0.0, 0.0, 0.0], batch_shape + (6,))
+    y = solve(rhs, t, y0, method=method)
+
+    x1, x2, x3, v1, v2, v3 = (y[..., i] for i in range(6))
+    KE, PE = vibration_energy(y, m1, m2, m3, k1, k2, k3, k4)
+
+    return dict(t=t, x1=x1, x2=x2, x3=x3, v1=v1, v2=v2, v3=v3, KE=KE, PE=PE,
+                F_ext=F0 * np.sin(forcing_freq * t[-1]))
+
+
+# Closed-form models. These evaluate exact expressions over whole arrays of
+# time (and, for the beam, position), returning the state together with its
+# derivatives, so one call yields a full trajectory for trails and plots or
+# reference values for checking the numeric integrators.
+
+SPRING_MASS_PARAMS = dict(
+    A=2.0,      # Amplitude (m)
+    k=1.0,      # Spring constant (N/m)
+    m=1.0,      # Mass (kg)
+    speed=3.0,  # Animation speed-up of the natural frequency
+)
+
+ROBOT_ARM_PARAMS = dict(
+    L1=2.0,  # Link 1 length
+    L2=1.5,  # Link 2 length
+)
+
+BEAM_BENDING_PARAMS = dict(
+    L=10.0,      # Beam length (m)
+    E=200e9,     # Young's modulus (Pa)
+    I=1e-6,      # Moment of inertia (m⁴)
+    P0=1000.0,   # Mean centre load (N)
+    swing=0.5,   # Relative load variation
+    rate=5.0,    # Load variation rate (rad/s)
+)
+
+
+def spring_mass_motion(t, A, k, m, speed):
+    """Undamped oscillation x = A cos(ωt) with ω = speed·√(k/m)"""
+    t = np.asarray(t, dtype=float)
+    omega = speed * np.sqrt(k / m)
+    phase = omega * t
+    x = A * np.cos(phase)
+    v = -A * omega * np.sin(phase)
+    return dict(t=t, omega=omega, x=x, v=v, a=-omega**2 * x, jerk=-omega**2 * v)
+
+
+def robot_arm_motion(t, L1, L2):
+    """Two-link arm with θ₁ = t/2 and θ₂ = sin t: joints, end effector and derivatives"""
+    t = np.asarray(t, dtype=float)
+    theta1, omega1, alpha1 = 0.5 * t, 0.5, 0.0
+    theta2, omega2, alpha2 = np.sin(t), np.cos(t), -np.sin(t)
+
+    # Absolute angle of link 2 and its rates
+    phi, phi_dot, phi_ddot = theta1 + theta2, omega1 + omega2, alpha1 + alpha2
+
+    x1, y1 = L1 * np.cos(theta1), L1 * np.sin(theta1)
+    x, y = x1 + L2 * np.cos(phi), y1 + L2 * np.sin(phi)
+
+    dx = -L1 * omega1 * np.sin(theta1) - L2 * phi_dot * np.sin(phi)
+    dy = L1 * omega1 * np.cos(theta1) + L2 * phi_dot * np.cos(phi)
+
+    ddx = (-L1 * (alpha1 * np.sin(theta1) + omega1**2 * np.cos(theta1))
+           - L2 * (phi_ddot * np.sin(phi) + phi_dot**2 * np.cos(phi)))
+    ddy = (L1 * (alpha1 * np.cos(theta1) - omega1**2 * np.sin(theta1))
+           + L2 * (phi_ddot * np.cos(phi) - phi_dot**2 * np.sin(phi)))
+
+    return dict(t=t, theta1=theta1, theta2=theta2, x1=x1, y1=y1, x=x, y=y,
+                dx=dx, dy=dy, ddx=ddx, ddy=ddy, speed=np.hypot(dx, dy))
+
+
+def beam_load(t, P0, swing, rate):
+    """Centre load P(t) = P0 (1 + swing·sin(rate·t)) in N"""
+    return P0 * (1 + swing * np.sin(rate * np.asarray(t, dtype=float)))
+
+
+def beam_bending_response(t, x, L, E, I, P0, swing, rate):
+    """Simply supported beam under a centre load, for every (t, x) pair
+
+    Euler-Bernoulli solution with deflection y, slope y', moment M = EI y''
+    and shear V = dM/dx. Results have shape t.shape + x.shape.
+    """
+    P = beam_load(t, P0, swing, rate)[..., None]
+    x = np.asarray(x, dtype=float)
+
+    # Solve on the left half and mirror: s is the distance to the nearer support
+    left = x <= L/2
+    s = np.where(left, x, L - x)
+    side = np.where(left, 1.0, -1.0)  # d/dx flips sign on the right half
+
+    deflection = -P * s * (3*L**2 - 4*s**2) / (48*E*I)
+    slope = -side * P * (L**2 - 4*s**2) / (16*E*I)
+    moment = P * s / 2
+    shear = side * P / 2 * np.ones_like(s)
+
+    return dict(t=np.asarray(t, dtype=float), x=x, P=P[..., 0], deflection=deflection,
+                slope=slope, moment=moment, shear=shear)
+
+
+def spring_mass_rhs(omega):
+    """State [x, v] of the undamped oscillator, for checking integrators"""
+    def rhs(t, y):
+        return np.stack([y[..., 1], -omega**2 * y[..., 0]], axis=-1)
+    return rhs
+
+
+def validate_spring_mass(t, method='rk4', **params):
+    """Largest errors of a numeric spring-mass run against the closed form
+
+    Integrates with core.ode ``method`` on the grid ``t`` and returns the
+    maximum absolute error of position, velocity and acceleration.
+    """
+    params = dict(SPRING_MASS_PARAMS, **params)
+    exact = spring_mass_motion(t, **params)
+    y = solve(spring_mass_rhs(exact['omega']), t, [exact['x'][0], exact['v'][0]], method=method)
+    x, v = y[..., 0], y[..., 1]
+    return dict(x=np.abs(x - exact['x']).max(),
+                v=np.abs(v - exact['v']).max(),
+                a=np.abs(-exact['omega']**2 * x - exact['a']).max())
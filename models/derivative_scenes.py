@@ -0,0 +1,1337 @@
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from core.decimation import decimate, points_for
+from core.edge_filters import EDGE_OPERATORS, EdgePipeline
+from core.trajectory_cache import TrajectoryCache
+from models.derivative_physics import (
+    CHEMICAL_REACTOR_PARAMS, VEHICLE_DYNAMICS_PARAMS, DRONE_CONTROL_PARAMS,
+    MAGLEV_TRAIN_PARAMS, VIBRATION_PARAMS,
+    simulate_chemical_reactor, simulate_vehicle_dynamics, simulate_drone_control,
+    simulate_maglev_train, simulate_vibration,
+    SPRING_MASS_PARAMS, ROBOT_ARM_PARAMS, BEAM_BENDING_PARAMS,
+    spring_mass_motion, robot_arm_motion, beam_bending_response)
+
+# Shared by every scene so switching models keeps previously computed runs
+trajectory_cache = TrajectoryCache()
+
+# Model name -> scene class, in the order the visualizer lists them
+DERIVATIVE_SCENES = {}
+
+
+def register_scene(scene_class):
+    """Class decorator adding a scene to the DerivativeVisualizer models"""
+    if scene_class.name in DERIVATIVE_SCENES:
+        raise ValueError(f"Duplicate derivative model: {scene_class.name}")
+    DERIVATIVE_SCENES[scene_class.name] = scene_class
+    return scene_class
+
+
+class DerivativeScene:
+    """Base class for one DerivativeVisualizer model.
+
+    ``build()`` creates the axes and every artist once; ``update(t)`` only
+    mutates artist data for animation time ``t`` and returns the analysis
+    values. Artists that change between frames are registered through
+    ``animate()`` so the visualizer can blit them over a cached background.
+
+    The analysis panel is static rich text (title, section headings and
+    notes) plus one plain-text field per entry of ``analysis_sections``:
+    ``(heading, [(label, key, format), ...])``. ``update()`` returns a dict
+    of key -> value (a tuple fills several format fields).
+    """
+
+    name = ""
+    title = ""
+    explanation = ""
+    history_span = 3.0  # Seconds of history shown on time-series axes
+    default_params = {}
+    simulate = None  # Time-stepped models: function(**params) -> dict of arrays
+    controls = {}  # Parameter name -> (label, choices) offered in the UI
+    analysis_title = ""
+    analysis_sections = []
+    analysis_notes = ""  # Static HTML below the values
+
+    def __init__(self, figure):
+        self.figure = figure
+        self.animated = []
+        self.needs_full_redraw = False
+        self.params = dict(self.default_params)
+        self.rng = np.random.default_rng()  # Reseeded per frame for reproducible exports
+
+    def build(self):
+        raise NotImplementedError
+
+    def update(self, t):
+        raise NotImplementedError
+
+    def trajectory(self, **overrides):
+        """Cached simulation result for the current parameters"""
+        params = dict(self.params, **overrides)
+        return trajectory_cache.get(self.name, params, self.simulate)
+
+    @staticmethod
+    def frame_index(t, current_t):
+        """Sample index of ``current_t`` in a trajectory time grid ``t``"""
+        return min(int(current_t * (len(t) / t[-1])), len(t)-1)
+
+    def set_params(self, **params):
+        """Change model parameters; the next frame re-simulates once"""
+        self.params.update(params)
+
+    def animate(self, *artists):
+        """Mark artists as changing every frame"""
+        self.animated.extend(artists)
+        return artists[0] if len(artists) == 1 else artists
+
+    def set_series(self, line, x, y):
+        """Set a time-series line, decimated to the width of its axes"""
+        line.set_data(*decimate(x, y, points_for(line.axes)))
+
+    def setup_history_axes(self, ax, title):
+        """Style a time-series axes with a fixed time window"""
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_title(title)
+        ax.set_xlim(0, self.history_span)
+
+    def fit_ylim(self, ax, *series):
+        """Grow the y-limits to cover the data, flagging a full redraw"""
+        values = [np.asarray(s) for s in series if len(s)]
+        if not values:
+            return
+        data = np.concatenate(values)
+        data = data[np.isfinite(data)]
+        if not data.size:
+            return
+        low, high = ax.get_ylim()
+        data_low, data_high = data.min(), data.max()
+        if data_low >= low and data_high <= high:
+            return
+        # Pad generously so the limits settle after a few frames
+        span = max(data_high - data_low, abs(data_high), 1e-6)
+        ax.set_ylim(min(low, data_low - 0.25 * span),
+                    max(high, data_high + 0.25 * span))
+        self.needs_full_redraw = True
+
+
+@register_scene
+class RobotArmScene(DerivativeScene):
+    name = "Robot Arm Motion"
+    title = "Understanding Derivatives in Robotics"
+    explanation = """
+                <h3>Derivatives in Robot Motion</h3>
+                <p>Watch how derivatives describe the robot's motion:</p>
+                <ul>
+                    <li><b>Position (x, y)</b>: Where the robot arm is</li>
+                    <li><b>First Derivative (dx/dt, dy/dt)</b>: How fast it's moving</li>
+                    <li><b>Purple Arrow</b>: Direction and speed of motion</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>The derivative tells us the instantaneous rate of change</li>
+                    <li>Larger derivatives mean faster motion</li>
+                    <li>The direction of the derivative shows where the arm is heading</li>
+                    <li>This helps robots move smoothly and precisely</li>
+                </ul>
+            """
+    analysis_title = "Real-time Analysis:"
+    analysis_sections = [
+        ("Position:", [("x", 'x', "{:.2f}"), ("y", 'y', "{:.2f}")]),
+        ("Velocity (First Derivative):", [
+            ("dx/dt", 'dx', "{:.2f}"), ("dy/dt", 'dy', "{:.2f}"),
+            ("Speed", 'speed', "{:.2f}")]),
+    ]
+    analysis_notes = """Notice how the velocity vector (purple arrow)
+            shows the instantaneous direction and speed of motion."""
+
+    default_params = ROBOT_ARM_PARAMS
+    trail_span = 2.0  # Seconds of end-effector path shown
+
+    def build(self):
+        ax = self.figure.add_subplot(111)
+
+        # End-effector path over the last few seconds
+        self.trail, = ax.plot([], [], '-', color='#F44336', alpha=0.4, linewidth=1.5,
+                              label='Path')
+
+        # Robot links and joints
+        self.link1, = ax.plot([], [], '-', color='#2196F3', linewidth=4, label='Link 1')
+        self.link2, = ax.plot([], [], '-', color='#4CAF50', linewidth=4, label='Link 2')
+        ax.plot(0, 0, 'o', color='#FFC107', markersize=15, label='Base')
+        self.elbow, = ax.plot([], [], 'o', color='#FF9800', markersize=12, label='Elbow')
+        self.end, = ax.plot([], [], 'o', color='#F44336', markersize=12, label='End')
+
+        # Velocity vector
+        self.arrow = ax.arrow(0, 0, 0, 0,
+                              head_width=0.1, head_length=0.2, fc='#9C27B0', ec='#9C27B0',
+                              label='Velocity')
+        self.animate(self.trail, self.link1, self.link2, self.elbow, self.end, self.arrow)
+
+        ax.set_xlim(-4, 4)
+        ax.set_ylim(-4, 4)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_aspect('equal')
+        ax.legend(loc='upper right')
+        ax.set_title('Robot Arm Motion and Derivatives', pad=20)
+
+    def update(self, t):
+        # Closed-form motion over the trail window; the last sample is now
+        path = robot_arm_motion(np.linspace(max(t - self.trail_span, 0), t, 60), **self.params)
+        x1, y1 = path['x1'][-1], path['y1'][-1]
+        x2, y2 = path['x'][-1], path['y'][-1]
+        dx, dy = path['dx'][-1], path['dy'][-1]
+        velocity_magnitude = path['speed'][-1]
+
+        self.trail.set_data(path['x'], path['y'])
+        self.link1.set_data([0, x1], [0, y1])
+        self.link2.set_data([x1, x2], [y1, y2])
+        self.elbow.set_data([x1], [y1])
+        self.end.set_data([x2], [y2])
+        scale = 0.5
+        self.arrow.set_data(x=x2, y=y2, dx=dx * scale, dy=dy * scale)
+
+        return dict(x=x2, y=y2, dx=dx, dy=dy, speed=velocity_magnitude)
+
+
+@register_scene
+class SpringMassScene(DerivativeScene):
+    name = "Spring-Mass System"
+    title = "Understanding Derivatives in Oscillation"
+    explanation = """
+                <h3>Derivatives in Spring Motion</h3>
+                <p>Observe how derivatives describe oscillatory motion:</p>
+                <ul>
+                    <li><b>Position (x)</b>: Distance from equilibrium</li>
+                    <li><b>First Derivative (dx/dt)</b>: Velocity</li>
+                    <li><b>Second Derivative (d²x/dt²)</b>: Acceleration</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Position follows simple harmonic motion</li>
+                    <li>Velocity is maximum at equilibrium</li>
+                    <li>Acceleration is proportional to displacement</li>
+                    <li>Energy oscillates between potential and kinetic</li>
+                </ul>
+            """
+    analysis_title = "Real-time Analysis:"
+    analysis_sections = [
+        ("Position:", [("x", 'x', "{:.2f}")]),
+        ("Velocity (First Derivative):", [("dx/dt", 'v', "{:.2f}")]),
+        ("Acceleration (Second Derivative):", [("d²x/dt²", 'a', "{:.2f}")]),
+    ]
+    analysis_notes = """Notice how velocity is zero at maximum displacement
+            and maximum at equilibrium position."""
+
+    default_params = SPRING_MASS_PARAMS
+    wall_x = -3
+    equilibrium_x = 0
+    trail_span = 0.5  # Seconds of phase-space trail
+
+    def build(self):
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+        ax = self.figure.add_subplot(gs[0, :])
+
+        # Draw wall
+        ax.plot([self.wall_x, self.wall_x], [-1, 1], 'k-', linewidth=3)
+
+        # Spring (simplified zigzag), mass and velocity vector
+        self.spring_y = 0.2 * np.sin(np.linspace(0, 4*np.pi, 20))
+        self.spring, = ax.plot([], [], 'b-', linewidth=2)
+        self.mass = plt.Circle((self.equilibrium_x, 0), 0.3, color='#4CAF50', fill=True)
+        ax.add_artist(self.mass)
+        self.arrow = ax.arrow(0, 0, 0, 0,
+                              head_width=0.1, head_length=0.2, fc='#9C27B0', ec='#9C27B0')
+        self.animate(self.spring, self.mass, self.arrow)
+
+        # Set plot properties
+        ax.set_xlim(-4, 4)
+        ax.set_ylim(-2, 2)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.set_aspect('equal')
+        ax.set_title('Spring-Mass System Motion', pad=20)
+
+        # Add equilibrium line
+        ax.axvline(x=self.equilibrium_x, color='gray', linestyle='--', alpha=0.5)
+
+        # Phase portrait: the whole closed orbit, plus a trail and marker
+        A = self.params['A']
+        omega = spring_mass_motion(0.0, **self.params)['omega']
+        orbit = spring_mass_motion(np.linspace(0, 2*np.pi / omega, 200), **self.params)
+        ax_phase = self.figure.add_subplot(gs[1, 0])
+        ax_phase.plot(orbit['x'], orbit['v'], color='gray', alpha=0.3)
+        self.phase_trail, = ax_phase.plot([], [], '-', color='#9C27B0', linewidth=2)
+        self.phase_point, = ax_phase.plot([], [], 'o', color='#4CAF50', markersize=8)
+        ax_phase.set_xlim(-1.2 * A, 1.2 * A)
+        ax_phase.set_ylim(-1.2 * A * omega, 1.2 * A * omega)
+        ax_phase.grid(True, linestyle='--', alpha=0.7)
+        ax_phase.set_title('Phase Space')
+        ax_phase.set_xlabel('x (m)')
+        ax_phase.set_ylabel('dx/dt (m/s)')
+
+        # Position and its derivatives over time
+        ax_history = self.figure.add_subplot(gs[1, 1])
+        self.setup_history_axes(ax_history, 'Derivatives')
+        self.history_lines = [ax_history.plot([], [], color=color, label=label)[0]
+                              for color, label in (('#4CAF50', 'x'), ('#9C27B0', 'dx/dt'),
+                                                   ('#F44336', 'd²x/dt²'))]
+        ax_history.set_ylim(-1.1 * A * omega**2, 1.1 * A * omega**2)
+        ax_history.set_xlabel('Time (s)')
+        ax_history.legend(loc='upper right')
+        self.animate(self.phase_trail, self.phase_point, *self.history_lines)
+
+        self.figure.tight_layout()
+
+    def update(self, t):
+        # Closed-form position and derivatives up to now in one call
+        motion = spring_mass_motion(np.linspace(0, t, max(int(t * 100), 1) + 1), **self.params)
+        x, v, a = motion['x'][-1], motion['v'][-1], motion['a'][-1]
+
+        trail = motion['t'] >= t - self.trail_span
+        self.phase_trail.set_data(motion['x'][trail], motion['v'][trail])
+        self.phase_point.set_data([x], [v])
+        for line, key in zip(self.history_lines, ('x', 'v', 'a')):
+            self.set_series(line, motion['t'], motion[key])
+
+        mass_x = self.equilibrium_x + x
+        self.spring.set_data(np.linspace(self.wall_x, mass_x, 20), self.spring_y)
+        self.mass.set_center((mass_x, 0))
+
+        # Velocity vector
+        self.arrow.set_visible(abs(v) > 0.1)
+        self.arrow.set_data(x=mass_x, y=0, dx=v*0.2, dy=0)
+
+        return dict(x=x, v=v, a=a)
+
+
+@register_scene
+class BeamBendingScene(DerivativeScene):
+    name = "Beam Bending"
+    title = "Understanding Derivatives in Beam Bending"
+    explanation = """
+                <h3>Derivatives in Beam Bending</h3>
+                <p>Observe how derivatives relate to beam deformation:</p>
+                <ul>
+                    <li><b>y(x)</b>: Deflection curve</li>
+                    <li><b>dy/dx</b>: Slope (First Derivative)</li>
+                    <li><b>d²y/dx²</b>: Moment (Second Derivative)</li>
+                    <li><b>d³y/dx³</b>: Shear Force (Third Derivative)</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Each derivative reveals different aspects of beam behavior</li>
+                    <li>Maximum deflection occurs at the point of loading</li>
+                    <li>Slope shows the rate of deflection change</li>
+                    <li>Moment and shear are critical for beam design</li>
+                </ul>
+            """
+    analysis_title = "Real-time Analysis:"
+    analysis_sections = [
+        (None, [("Applied Load", 'P', "{:.2f} kN")]),
+        ("Maximum Values:", [
+            ("Deflection", 'deflection', "{:.2f} mm (at midspan)"),
+            ("Moment", 'moment', "{:.2f} kN⋅m (at midspan)")]),
+    ]
+    analysis_notes = """
+            <p>Key Points:</p>
+            <ul>
+                <li>The beam deflects downward under the load</li>
+                <li>Maximum deflection occurs at the center</li>
+                <li>Moment is maximum where the load is applied</li>
+                <li>The relationship between load, moment, and deflection
+                    is described by derivatives</li>
+            </ul>
+        """
+
+    default_params = BEAM_BENDING_PARAMS
+    scale = 10  # Display magnification of the deflection
+
+    def build(self):
+        # Beam, moment diagram, then slope and shear along the beam
+        gs = self.figure.add_gridspec(3, 1, height_ratios=[2, 1, 1])
+        L = self.params['L']
+        P_max = self.params['P0'] * (1 + self.params['swing'])
+        EI = self.params['E'] * self.params['I']
+        self.x = np.linspace(0, L, 101)
+
+        # Beam deflection plot
+        ax_beam = self.figure.add_subplot(gs[0])
+        ax_beam.plot([0, L], [0, 0], 'k--', alpha=0.3, label='Undeformed')
+        self.deformed, = ax_beam.plot([], [], 'b-', linewidth=3, label='Deformed')
+
+        # Plot supports
+        ax_beam.plot([0], [0], 'ks', markersize=15, label='Support')  # Left support
+        ax_beam.plot([L], [0], 'ks', markersize=15)  # Right support
+
+        # Plot load arrow
+        arrow_length = 2
+        ax_beam.arrow(L/2, arrow_length, 0, -1.5,
+                      head_width=0.2, head_length=0.5, fc='r', ec='r',
+                      linewidth=2, label='Load')
+
+        ax_beam.set_title('Beam Deflection', fontsize=12, pad=10)
+        ax_beam.grid(True, linestyle='--', alpha=0.7)
+        ax_beam.legend(loc='upper right')
+        ax_beam.set_xlim(-0.5, L + 0.5)
+        ax_beam.set_ylim(-3, 3)
+        ax_beam.set_xlabel('Length (m)')
+        ax_beam.set_ylabel(f'Deflection (m, ×{self.scale})')
+
+        # Moment diagram
+        ax_moment = self.figure.add_subplot(gs[1])
+        self.moment_line, = ax_moment.plot([], [], 'r-', linewidth=2)
+        self.moment_fill = ax_moment.fill_between(self.x, np.zeros_like(self.x),
+                                                  alpha=0.2, color='red')
+        ax_moment.set_title('Bending Moment Diagram', fontsize=12, pad=10)
+        ax_moment.grid(True, linestyle='--', alpha=0.7)
+        ax_moment.set_xlim(0, L)
+        ax_moment.set_ylim(0, 1.1 * P_max * L / 4 / 1000)
+        ax_moment.set_xlabel('Length (m)')
+        ax_moment.set_ylabel('Moment (kN⋅m)')
+
+        # Slope (left axis) and shear force (right axis)
+        ax_slope = self.figure.add_subplot(gs[2])
+        ax_shear = ax_slope.twinx()
+        self.slope_line, = ax_slope.plot([], [], color='#9C27B0', linewidth=2, label='Slope')
+        self.shear_line, = ax_shear.plot([], [], color='#FF9800', linewidth=2, label='Shear')
+        ax_slope.set_title('Slope and Shear Force', fontsize=12, pad=10)
+        ax_slope.grid(True, linestyle='--', alpha=0.7)
+        ax_slope.set_xlim(0, L)
+        ax_slope.set_ylim(-1.1 * P_max * L**2 / (16 * EI) * 1000,
+                          1.1 * P_max * L**2 / (16 * EI) * 1000)
+        ax_shear.set_ylim(-0.6 * P_max / 1000, 0.6 * P_max / 1000)
+        ax_slope.set_xlabel('Length (m)')
+        ax_slope.set_ylabel('Slope (mrad)')
+        ax_shear.set_ylabel('Shear (kN)')
+        ax_slope.legend(handles=[self.slope_line, self.shear_line], loc='upper right')
+        self.animate(self.deformed, self.moment_line, self.moment_fill,
+                     self.slope_line, self.shear_line)
+
+        self.figure.tight_layout()
+
+    def update(self, t):
+        x = self.x
+        response = beam_bending_response(t, x, **self.params)
+        P, deflection, moment = response['P'], response['deflection'], response['moment']
+
+        self.deformed.set_data(x, self.scale*deflection)
+        self.moment_line.set_data(x, moment/1000)
+        fill_top = np.column_stack([x, moment/1000])
+        fill_base = np.column_stack([x[::-1], np.zeros_like(x)])
+        self.moment_fill.set_verts([np.vstack([fill_top, fill_base])])
+        self.slope_line.set_data(x, response['slope']*1000)
+        self.shear_line.set_data(x, response['shear']/1000)
+
+        max_deflection = np.min(deflection)  # Using min since deflection is negative
+        max_moment = np.max(moment)
+
+        return dict(P=P/1000, deflection=-max_deflection*1000, moment=max_moment/1000)
+
+
+@register_scene
+class EdgeDetectionScene(DerivativeScene):
+    name = "Edge Detection"
+    title = "Understanding Derivatives in Edge Detection"
+    explanation = """
+                <h3>Derivatives in Edge Detection</h3>
+                <p>See how derivatives help detect edges:</p>
+                <ul>
+                    <li><b>Original Signal</b>: Light intensity values</li>
+                    <li><b>First Derivative</b>: Rate of intensity change</li>
+                    <li><b>Edge Detection</b>: High derivative locations</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Edges occur at sudden intensity changes</li>
+                    <li>Large derivatives indicate edge locations</li>
+                    <li>This principle extends to 2D for image processing</li>
+                    <li>Foundation of computer vision algorithms</li>
+                </ul>
+            """
+    analysis_title = "Understanding Derivatives in Edge Detection:"
+    analysis_sections = [
+        (None, [("Operator", 'operator', "{}"), ("Image", 'resolution', "{0}×{0}"),
+                ("Filter time", 'elapsed', "{:.1f} ms per frame")]),
+    ]
+    analysis_notes = """
+            <p>The process uses partial derivatives to find edges:</p>
+            <ol>
+                <li><b>Original Image [f(x,y)]:</b>
+                <br>- Black and white regions
+                <br>- Sharp intensity changes at boundaries</li>
+
+                <li><b>X Derivative [∂f/∂x]:</b>
+                <br>- Blue: Negative change (dark to light)
+                <br>- Red: Positive change (light to dark)
+                <br>- Detects vertical edges</li>
+
+                <li><b>Y Derivative [∂f/∂y]:</b>
+                <br>- Blue: Negative change (dark to light)
+                <br>- Red: Positive change (light to dark)
+                <br>- Detects horizontal edges</li>
+
+                <li><b>Edge Strength:</b>
+                <br>- Combines both derivatives
+                <br>- Brighter = Stronger edge
+                <br>- Formula: √[(∂f/∂x)² + (∂f/∂y)²]</li>
+            </ol>
+            <p>This is how derivatives help computers find object boundaries!</p>
+        """
+
+    default_params = dict(resolution=100, operator='Sobel')
+    controls = {
+        'operator': ("Operator", list(EDGE_OPERATORS)),
+        'resolution': ("Resolution", [100, 256, 512, 1024]),
+    }
+
+    def build(self):
+        # Create a 2x2 subplot grid
+        gs = self.figure.add_gridspec(2, 2)
+
+        self.images = []
+        self.panel_axes = []
+        for spec, cmap in zip((gs[0, 0], gs[0, 1], gs[1, 0], gs[1, 1]),
+                              ('gray', 'RdBu', 'RdBu', 'hot')):
+            ax = self.figure.add_subplot(spec)
+            # Fixed extent: any resolution fills the same panel
+            self.images.append(ax.imshow(np.zeros((2, 2)), cmap=cmap,
+                                         extent=(-5, 5, 5, -5)))
+            ax.axis('off')
+            self.panel_axes.append(ax)
+        self.animate(*self.images)
+        self.configure_pipeline()
+
+        self.figure.tight_layout()
+
+    def configure_pipeline(self):
+        """(Re)build the filter pipeline, colour limits and panel titles"""
+        self.pipeline = pipeline = EdgePipeline(self.params['resolution'], self.params['operator'])
+        vmax = pipeline.vmax
+        if pipeline.order == 1:
+            titles = ('X Derivative\n∂f/∂x', 'Y Derivative\n∂f/∂y',
+                      'Edge Strength\n√[(∂f/∂x)² + (∂f/∂y)²]')
+            edge_max = np.sqrt(2) * vmax
+        else:
+            titles = ('X Curvature\n∂²(G∗f)/∂x²', 'Y Curvature\n∂²(G∗f)/∂y²',
+                      'Edge Response\n|∇²(G∗f)|')
+            edge_max = 2 * vmax
+
+        limits = [(0, 1), (-vmax, vmax), (-vmax, vmax), (0, edge_max)]
+        for ax, image, title, (vmin, vmax) in zip(self.panel_axes, self.images,
+                                                  ('Original Image\nf(x,y)',) + titles, limits):
+            ax.set_title(title)
+            image.set_clim(vmin, vmax)
+
+        # Filters run at full resolution, but resampling four large images
+        # is what makes drawing slow: show block means at about panel size
+        panel_width = min(ax.bbox.width for ax in self.panel_axes)
+        self.display_step = step = max(1, int(np.ceil(pipeline.resolution / max(panel_width, 1))))
+        m = pipeline.resolution // step
+        self.display_buffers = [np.zeros((m, m), np.float32) for _ in self.images]
+        self._row_sums = np.zeros((m, m * step), np.float32)
+        for image in self.images:
+            image.set_interpolation('none' if step > 1 else 'auto')
+
+    def set_params(self, **params):
+        super().set_params(**params)
+        if 'resolution' in params or 'operator' in params:
+            self.configure_pipeline()
+            self.needs_full_redraw = True
+
+    def downsample(self, data, out):
+        """Block means of ``display_step`` × ``display_step`` pixels into ``out``"""
+        step = self.display_step
+        if step == 1:
+            return data
+        m = out.shape[0]
+        # Sum row blocks, then column blocks; adding slices is much faster
+        # than reshape().mean() over the short block axes
+        rows = data[:m*step, :m*step].reshape(m, step, m*step)
+        np.copyto(self._row_sums, rows[:, 0])
+        for i in range(1, step):
+            np.add(self._row_sums, rows[:, i], out=self._row_sums)
+        columns = self._row_sums.reshape(m, m, step)
+        np.copyto(out, columns[:, :, 0])
+        for j in range(1, step):
+            np.add(out, columns[:, :, j], out=out)
+        out *= 1 / step**2
+        return out
+
+    def update(self, t):
+        # Moving circle on the precomputed mesh, then the filter passes
+        start = time.perf_counter()
+        pipeline = self.pipeline
+        image = pipeline.render_circle(2 * np.cos(3 * t), 3)
+        dx, dy, edges = pipeline.run()
+        elapsed = time.perf_counter() - start
+
+        for artist, data, buffer in zip(self.images, (image, dx, dy, edges), self.display_buffers):
+            artist.set_data(self.downsample(data, buffer))
+
+        return dict(operator=pipeline.operator, resolution=pipeline.resolution,
+                    elapsed=elapsed*1000)
+
+
+@register_scene
+class ChemicalReactorScene(DerivativeScene):
+    name = "Chemical Reactor"
+    default_params = CHEMICAL_REACTOR_PARAMS
+    simulate = staticmethod(simulate_chemical_reactor)
+    title = "Understanding Derivatives in Chemical Reactor"
+    explanation = """
+                <h3>Derivatives in Chemical Reactor</h3>
+                <p>Watch how derivatives help control temperature:</p>
+                <ul>
+                    <li><b>Temperature (T):</b> Current temperature</li>
+                    <li><b>Concentration (C):</b> Current concentration</li>
+                    <li><b>Heat Removal (Q):</b> Rate of heat removal</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Temperature control</li>
+                    <li>Concentration control</li>
+                    <li>Heat removal</li>
+                    <li>Derivatives help prevent runaway reactions</li>
+                </ul>
+            """
+    analysis_title = "Chemical Reactor Analysis:"
+    analysis_sections = [
+        ("Current State:", [
+            ("Temperature", 'T', "{:.1f}°C"),
+            ("Concentration", 'C', "{:.3f} mol/L"),
+            ("Reaction Rate", 'rate', "{:.3e} mol/L·s")]),
+        ("Heat Transfer:", [
+            ("Heat Generated", 'Q_gen', "{:.1f} kW"),
+            ("Heat Removed", 'Q', "{:.1f} kW"),
+            ("Coolant Temp", 'Tc', "{:.1f}°C")]),
+        ("Derivatives in Action:", [
+            ("dT/dt", 'dT_dt', "{:.2f} K/s"),
+            ("dC/dt", 'dC_dt', "{:.3e} mol/L·s"),
+            ("Activation Energy", 'Ea', "{:.1f} kJ/mol")]),
+        ("Safety Indicators:", [
+            ("Temperature control", 'temperature_status', "{}"),
+            ("Reaction rate", 'rate_status', "{}"),
+            ("Cooling system", 'cooling_status', "{}")]),
+    ]
+
+    max_bubbles = 50
+
+    def build(self):
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+
+        # Plot reactor animation
+        ax1 = self.figure.add_subplot(gs[0, :])
+        ax1.set_aspect('equal')
+
+        # Draw reactor vessel
+        vessel = plt.Rectangle((3, 1), 4, 4, fc='lightgray', ec='black')
+        ax1.add_patch(vessel)
+
+        # Draw cooling jacket
+        jacket = plt.Rectangle((2.7, 0.7), 4.6, 4.6, fc='none', ec='blue', ls='--')
+        ax1.add_patch(jacket)
+
+        # Fluid level (temperature-based color) and reaction bubbles
+        self.fluid = plt.Rectangle((3, 1), 4, 0)
+        ax1.add_patch(self.fluid)
+        self.bubbles = ax1.scatter([], [], s=[], c='white', alpha=0.6)
+
+        # Draw cooling pipes
+        ax1.plot([2.5, 2.5], [0.5, 6], 'b-', linewidth=2)
+        ax1.plot([7.5, 7.5], [0.5, 6], 'b-', linewidth=2)
+
+        # Coolant flow indicators
+        self.coolant_arrows = []
+        for y in np.linspace(0.5, 6, 6):
+            for pipe_x in (2.5, 7.5):
+                self.coolant_arrows.append(ax1.arrow(
+                    pipe_x, y, 0, 0,
+                    head_width=0.1, head_length=0.1, fc='blue', ec='blue', alpha=0.6))
+
+        # Temperature indicators
+        self.temp_text = ax1.text(5, 5.5, '', ha='center')
+        self.coolant_text = ax1.text(2, 5.5, '', ha='center', color='blue')
+        self.conc_text = ax1.text(5, 0.5, '', ha='center')
+
+        ax1.set_xlim(0, 10)
+        ax1.set_ylim(0, 7)
+        ax1.axis('off')
+
+        # Plot temperature and concentration
+        self.ax2 = self.figure.add_subplot(gs[1, 0])
+        self.temp_line, = self.ax2.plot([], [], 'r-', label='Temp (°C)')
+        self.conc_line, = self.ax2.plot([], [], 'b-', label='Conc (M)')
+        self.coolant_line, = self.ax2.plot([], [], 'g--', label='Coolant (°C)')
+        self.ax2.legend(loc='upper right')
+        self.setup_history_axes(self.ax2, 'Reactor Conditions')
+
+        # Plot derivatives and heat
+        self.ax3 = self.figure.add_subplot(gs[1, 1])
+        self.dT_line, = self.ax3.plot([], [], 'r-', label='dT/dt (K/s)')
+        self.dC_line, = self.ax3.plot([], [], 'b-', label='dC/dt (M/s)')
+        self.Q_line, = self.ax3.plot([], [], 'g-', label='Q (kW)')
+        self.ax3.legend(loc='upper right')
+        self.setup_history_axes(self.ax3, 'Rates of Change')
+
+        self.animate(self.fluid, self.bubbles, *self.coolant_arrows,
+                     self.temp_text, self.coolant_text, self.conc_text,
+                     self.temp_line, self.conc_line, self.coolant_line,
+                     self.dT_line, self.dC_line, self.Q_line)
+
+        self.figure.tight_layout()
+
+    def update(self, t_anim):
+        sim = self.trajectory()
+        t, T, C, Tc, Q = sim['t'], sim['T'], sim['C'], sim['Tc'], sim['Q']
+        dT_dt, dC_dt = sim['dT_dt'], sim['dC_dt']
+        reaction_rate, Q_gen = sim['reaction_rate'], sim['Q_gen']
+        Ea, T_set = self.params['Ea'], self.params['T_set']
+
+        current_t = t_anim % 3
+        current_idx = self.frame_index(t, current_t)
+
+        # Fluid level with temperature-based color
+        T_normalized = (T[current_idx] - 300) / 50  # Normalize temperature
+        self.fluid.set_height(4 * C[current_idx]/2)
+        self.fluid.set_facecolor(plt.cm.RdYlBu_r(T_normalized))
+
+        # Bubbles for reaction visualization
+        n_bubbles = min(int(10 * reaction_rate), self.max_bubbles)
+        bubble_x = 3 + 4 * self.rng.random(n_bubbles)
+        bubble_y = 1 + 4 * C[current_idx]/2 * self.rng.random(n_bubbles)
+        self.bubbles.set_offsets(np.column_stack([bubble_x, bubble_y]))
+        self.bubbles.set_sizes((16 * self.rng.random(n_bubbles))**2)  # ~0.2 radius
+
+        # Coolant flow indicators
+        coolant_speed = abs(Q[current_idx]) / 10
+        for i, arrow in enumerate(self.coolant_arrows):
+            direction = 1 if i % 2 == 0 else -1
+            arrow.set_data(dy=direction * 0.3 * coolant_speed)
+
+        self.temp_text.set_text(f'T = {T[current_idx]:.1f} K')
+        self.coolant_text.set_text(f'Tc = {Tc[current_idx]:.1f} K')
+        self.conc_text.set_text(f'C = {C[current_idx]:.3f} mol/L')
+
+        # History plots
+        visible = current_idx > 1
+        n = current_idx if visible else 0
+        self.set_series(self.temp_line, t[:n], T[:n]-273.15)
+        self.set_series(self.conc_line, t[:n], C[:n])
+        self.set_series(self.coolant_line, t[:n], Tc[:n]-273.15)
+        self.set_series(self.dT_line, t[:n], dT_dt[:n])
+        self.set_series(self.dC_line, t[:n], dC_dt[:n])
+        self.set_series(self.Q_line, t[:n], Q[:n])
+        self.fit_ylim(self.ax2, T[:n]-273.15, C[:n], Tc[:n]-273.15)
+        self.fit_ylim(self.ax3, dT_dt[:n], dC_dt[:n], Q[:n])
+
+        i = current_idx
+        return dict(
+            T=T[i]-273.15, C=C[i], rate=reaction_rate,
+            Q_gen=Q_gen, Q=Q[i], Tc=Tc[i]-273.15,
+            dT_dt=dT_dt[i], dC_dt=dC_dt[i], Ea=Ea/1000,
+            temperature_status="✓ Stable" if abs(T[i]-T_set) < 10 else "⚠ Check",
+            rate_status="✓ Normal" if abs(reaction_rate) < 0.1 else "⚠ High",
+            cooling_status="✓ Effective" if abs(Q[i]) > abs(Q_gen*0.9) else "⚠ Warning",
+        )
+
+
+@register_scene
+class VehicleDynamicsScene(DerivativeScene):
+    name = "Vehicle Dynamics"
+    default_params = VEHICLE_DYNAMICS_PARAMS
+    simulate = staticmethod(simulate_vehicle_dynamics)
+    title = "Understanding Derivatives in Vehicle Dynamics"
+    explanation = """
+                <h3>Derivatives in Vehicle Dynamics</h3>
+                <p>Watch how derivatives describe vehicle motion and suspension response:</p>
+                <ul>
+                    <li><b>Position (s):</b> Where the vehicle is</li>
+                    <li><b>Velocity (v = ds/dt):</b> How fast it's moving</li>
+                    <li><b>Acceleration (a = d²s/dt²):</b> Rate of speed change</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li><b>Motion Derivatives:</b>
+                    <br>- Position (s): Where the vehicle is
+                    <br>- Velocity (v = ds/dt): How fast it's moving
+                    <br>- Acceleration (a = d²s/dt²): Rate of speed change</li>
+
+                    <li><b>Suspension System:</b>
+                    <br>- Responds to road irregularities
+                    <br>- Uses damped second-order dynamics
+                    <br>- Balances comfort and control</li>
+                </ul>
+            """
+    analysis_title = "Vehicle Dynamics and Derivatives:"
+    analysis_sections = [
+        ("Current Values:", [
+            ("Position (s)", 's', "{:.1f} m"),
+            ("Velocity (v = ds/dt)", 'v', "{:.1f} m/s"),
+            ("Acceleration (a = d²s/dt²)", 'a', "{:.1f} m/s²")]),
+    ]
+    analysis_notes = """
+            <p>Key Concepts:</p>
+            <ul>
+                <li><b>Motion Derivatives:</b>
+                <br>- Position (s): Where the vehicle is
+                <br>- Velocity (v = ds/dt): How fast it's moving
+                <br>- Acceleration (a = d²s/dt²): Rate of speed change</li>
+
+                <li><b>Suspension System:</b>
+                <br>- Responds to road irregularities
+                <br>- Uses damped second-order dynamics
+                <br>- Balances comfort and control</li>
+            </ul>
+        """
+
+    def build(self):
+        # Create subplots
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+
+        # Plot vehicle motion
+        ax1 = self.figure.add_subplot(gs[0, :])
+
+        # Road profile does not change between frames
+        t = np.linspace(0, 10, 1000)
+        road = 0.1 * np.sin(2 * np.pi * t) + 0.05 * np.sin(5 * np.pi * t)
+        road_x = np.linspace(0, 15, 100)
+        ax1.plot(road_x, 0.5 * road[:100], 'k-', alpha=0.3)
+
+        # Vehicle body, axle, wheels and velocity vector
+        self.body, = ax1.plot([], [], 'b-', linewidth=3)
+        self.axle, = ax1.plot([], [], 'k-', linewidth=2)
+        self.wheel1 = plt.Circle((0, 0), 0.2, color='k')
+        self.wheel2 = plt.Circle((0, 0), 0.2, color='k')
+        ax1.add_artist(self.wheel1)
+        ax1.add_artist(self.wheel2)
+        self.arrow = ax1.arrow(0, 0, 0, 0,
+                               head_width=0.1, head_length=0.2, fc='r', ec='r')
+
+        ax1.set_xlim(0, 15)
+        ax1.set_ylim(-0.5, 2.5)
+        ax1.set_title('Vehicle Motion and Suspension Response')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+
+        # Plot velocity and acceleration
+        self.ax2 = self.figure.add_subplot(gs[1, 0])
+        self.v_line, = self.ax2.plot([], [], 'g-', label='Velocity (v)')
+        self.a_line, = self.ax2.plot([], [], 'r-', label='Acceleration (a)')
+        self.setup_history_axes(self.ax2, 'Velocity and Acceleration\n(First and Second Derivatives)')
+        self.ax2.legend()
+
+        # Plot suspension response
+        self.ax3 = self.figure.add_subplot(gs[1, 1])
+        self.road_line, = self.ax3.plot([], [], 'k--', label='Road Profile', alpha=0.5)
+        self.suspension_line, = self.ax3.plot([], [], 'b-', label='Suspension')
+        self.setup_history_axes(self.ax3, 'Suspension Response\n(Second-Order Dynamics)')
+        self.ax3.legend()
+
+        self.animate(self.body, self.axle, self.wheel1, self.wheel2, self.arrow,
+                     self.v_line, self.a_line, self.road_line, self.suspension_line)
+
+        self.figure.tight_layout()
+
+    def update(self, t_anim):
+        sim = self.trajectory()
+        t, a, v, s = sim['t'], sim['a'], sim['v'], sim['s']
+        road, suspension = sim['road'], sim['suspension']
+
+        current_t = t_anim % 10
+        current_idx = int(current_t * 100)
+
+        # Vehicle (simplified)
+        car_x = s[current_idx]
+        car_y = 0.5 * suspension[current_idx] + 1
+        self.body.set_data([car_x-1, car_x+1], [car_y, car_y])
+        self.axle.set_data([car_x-0.8, car_x+0.8], [car_y-0.5, car_y-0.5])
+        self.wheel1.set_center((car_x-0.8, car_y-0.5))
+        self.wheel2.set_center((car_x+0.8, car_y-0.5))
+
+        # Velocity vector
+        self.arrow.set_visible(abs(v[current_idx]) > 0.1)
+        self.arrow.set_data(x=car_x, y=car_y, dx=0.5*v[current_idx], dy=0)
+
+        # History plots
+        n = current_idx
+        self.set_series(self.v_line, t[:n], v[:n])
+        self.set_series(self.a_line, t[:n], a[:n])
+        self.set_series(self.road_line, t[:n], road[:n])
+        self.set_series(self.suspension_line, t[:n], suspension[:n])
+        self.fit_ylim(self.ax2, v[:n], a[:n])
+        self.fit_ylim(self.ax3, road[:n], suspension[:n])
+
+        return dict(s=s[current_idx], v=v[current_idx], a=a[current_idx])
+
+
+@register_scene
+class DroneControlScene(DerivativeScene):
+    name = "Drone Control"
+    default_params = DRONE_CONTROL_PARAMS
+    simulate = staticmethod(simulate_drone_control)
+    title = "Understanding Derivatives in Drone Control"
+    explanation = """
+                <h3>Derivatives in Drone Control</h3>
+                <p>Watch how derivatives help maintain stable flight:</p>
+                <ul>
+                    <li><b>PID Control:</b>
+                    <br>- Proportional (P): Responds to current error
+                    <br>- Integral (I): Accumulates past errors
+                    <br>- Derivative (D): Anticipates future error</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>PID control helps drones maintain a stable altitude</li>
+                    <li>Derivatives help predict future behavior</li>
+                    <li>This is crucial for autonomous flight</li>
+                </ul>
+            """
+    analysis_title = "PID Control in Drone Altitude:"
+    analysis_sections = [
+        ("Current Values:", [
+            ("Target", 'setpoint', "{:.1f} m"),
+            ("Altitude", 'position', "{:.1f} m"),
+            ("Error", 'error', "{:.2f} m")]),
+        ("PID Components:", [
+            ("Proportional (P)", 'P', "{:.2f}"),
+            ("Integral (I)", 'I', "{:.2f}"),
+            ("Derivative (D)", 'D', "{:.2f}"),
+            ("Total Control", 'control', "{:.2f}")]),
+    ]
+
+    drone_size = 0.5
+    drone_x = 5
+
+    def build(self):
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+        drone_size = self.drone_size
+
+        # Target altitude with trail
+        ax1 = self.figure.add_subplot(gs[0, :])
+        self.trail, = ax1.plot([], [], 'g--', alpha=0.5)
+        self.target = ax1.axhline(y=0, color='g', linestyle='--',
+                                  label='Target', alpha=0.8)
+
+        # Drone body with thrust indication, rotors and thrust indicators
+        self.body = plt.Rectangle((self.drone_x-drone_size, 0),
+                                  drone_size*2, drone_size/2, alpha=0.8)
+        ax1.add_patch(self.body)
+        self.left_rotor, = ax1.plot([], [], 'k-', linewidth=1)
+        self.right_rotor, = ax1.plot([], [], 'k-', linewidth=1)
+        self.thrust_bar, = ax1.plot([], [], 'r-')
+        self.thrust_jet, = ax1.plot([], [], 'r-')
+
+        ax1.set_xlim(0, 10)
+        ax1.set_ylim(0, 8)
+        ax1.set_title('Drone Altitude Control')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+
+        # Plot error and control components
+        self.ax2 = self.figure.add_subplot(gs[1, 0])
+        self.error_line, = self.ax2.plot([], [], 'r-', label='Error', alpha=0.7)
+        self.integral_line, = self.ax2.plot([], [], 'g-', label='∫e dt', alpha=0.7)
+        self.derivative_line, = self.ax2.plot([], [], 'b-', label='de/dt', alpha=0.7)
+        self.ax2.legend(loc='upper right')
+        self.setup_history_axes(self.ax2, 'PID Components')
+
+        # Plot control signal and position
+        self.ax3 = self.figure.add_subplot(gs[1, 1])
+        self.control_line, = self.ax3.plot([], [], 'r-', label='Control')
+        self.altitude_line, = self.ax3.plot([], [], 'b-', label='Altitude')
+        self.setpoint_line, = self.ax3.plot([], [], 'g--', label='Target')
+        self.ax3.legend(loc='upper right')
+        self.setup_history_axes(self.ax3, 'System Response')
+
+        self.animate(self.trail, self.target, self.body,
+                     self.left_rotor, self.right_rotor, self.thrust_bar, self.thrust_jet,
+                     self.error_line, self.integral_line, self.derivative_line,
+                     self.control_line, self.altitude_line, self.setpoint_line)
+
+        self.figure.tight_layout()
+
+    def update(self, t_anim):
+        sim = self.trajectory()
+        t, setpoint, position = sim['t'], sim['setpoint'], sim['position']
+        error, error_integral = sim['error'], sim['error_integral']
+        control_signal = sim['control_signal']
+        Kp, Ki, Kd = self.params['Kp'], self.params['Ki'], self.params['Kd']
+
+        current_t = min(t_anim, 3.0)  # Limit time to 3 seconds
+        current_idx = self.frame_index(t, current_t)
+
+        # Target altitude with trail
+        self.set_series(self.trail, t[:current_idx], setpoint[:current_idx])
+        self.target.set_ydata([setpoint[current_idx-1]] * 2)
+
+        # Drone body with thrust indication
+        drone_size = self.drone_size
+        drone_x = self.drone_x
+        drone_y = position[current_idx-1]
+        thrust = control_signal[current_idx-1]
+        self.body.set_y(drone_y-drone_size/4)
+        self.body.set_color(plt.cm.RdYlBu(thrust/20 + 0.5))  # Color based on thrust
+
+        # Rotor animation
+        rotor_speed = thrust * 0.3
+        rotor_size = drone_size * 0.8
+        angles = np.linspace(0, 2*np.pi, 20)
+        rotor_x = rotor_size * np.cos(angles + rotor_speed * current_t)
+        rotor_y = rotor_size * np.sin(angles + rotor_speed * current_t)
+        self.left_rotor.set_data(drone_x-drone_size + rotor_x, drone_y + rotor_y)
+        self.right_rotor.set_data(drone_x+drone_size + rotor_x, drone_y + rotor_y)
+
+        # Thrust indicators
+        thrusting = thrust > 0
+        self.thrust_bar.set_visible(thrusting)
+        self.thrust_jet.set_visible(thrusting)
+        if thrusting:
+            thrust_height = 0.5 * thrust/20
+            self.thrust_bar.set_data([drone_x-drone_size, drone_x+drone_size],
+                                     [drone_y-drone_size, drone_y-drone_size])
+            self.thrust_jet.set_data([drone_x, drone_x],
+                                     [drone_y-drone_size, drone_y-drone_size-thrust_height])
+            self.thrust_bar.set_linewidth(2*thrust/20)
+            self.thrust_jet.set_linewidth(2*thrust/20)
+
+        # History plots
+        n = current_idx if current_idx > 1 else 0
+        derivative = (np.gradient(error[:n], t[:n]) if n > 2 else np.array([]))
+        self.set_series(self.error_line, t[:n], error[:n])
+        self.set_series(self.integral_line, t[:n], error_integral[:n])
+        self.set_series(self.derivative_line, t[:len(derivative)], derivative)
+        self.set_series(self.control_line, t[:n], control_signal[:n])
+        self.set_series(self.altitude_line, t[:n], position[:n])
+        self.set_series(self.setpoint_line, t[:n], setpoint[:n])
+        self.fit_ylim(self.ax2, error[:n], error_integral[:n], derivative)
+        self.fit_ylim(self.ax3, control_signal[:n], position[:n], setpoint[:n])
+
+        i = current_idx - 1
+        return dict(
+            setpoint=setpoint[i], position=position[i], error=error[i],
+            P=Kp * error[i], I=Ki * error_integral[i],
+            D=Kd * (error[i] - error[max(0, current_idx-2)]),
+            control=control_signal[i],
+        )
+
+
+@register_scene
+class MaglevTrainScene(DerivativeScene):
+    name = "Maglev Train"
+    default_params = MAGLEV_TRAIN_PARAMS
+    simulate = staticmethod(simulate_maglev_train)
+    title = "Understanding Derivatives in Maglev Train"
+    explanation = """
+                <h3>Derivatives in Maglev Train</h3>
+                <p>Watch how derivatives control precise levitation and propulsion:</p>
+                <ul>
+                    <li><b>Gap:</b> Levitation gap</li>
+                    <li><b>Current:</b> Electromagnet current</li>
+                    <li><b>Magnetic Force:</b> Magnetic force</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Electromagnetic levitation</li>
+                    <li>Real-time gap control</li>
+                    <li>Disturbance rejection</li>
+                    <li>Energy efficiency</li>
+                </ul>
+            """
+    analysis_title = "Maglev Control Analysis"
+    analysis_sections = [
+        ("Current State:", [
+            ("Gap", 'gap', "{:.1f} mm"),
+            ("Current", 'current', "{:.0f} A"),
+            ("Force", 'force', "{:.1f} kN")]),
+        ("Derivatives:", [
+            ("dGap/dt", 'dgap_dt', "{:.1f} mm/s"),
+            ("dB/dt", 'dB_dt', "{:.2f} T/s"),
+            ("dI/dt", 'dI_dt', "{:.0f} A/s")]),
+    ]
+
+    magnet_positions = [3.5, 4.0, 4.5, 5.0, 5.5]
+
+    def build(self):
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+
+        # Plot maglev system
+        ax1 = self.figure.add_subplot(gs[0, :])
+        self.track_x = np.linspace(0, 10, 100)
+        self.track, = ax1.plot([], [], 'k-', linewidth=3)
+
+        # Train body, electromagnets and magnetic field lines
+        self.train = ax1.fill([0], [0], alpha=0.8)[0]
+        self.magnets = [ax1.fill([0], [0])[0] for _ in self.magnet_positions]
+        self.field_lines = LineCollection([], colors='b', alpha=0.2)
+        ax1.add_collection(self.field_lines)
+
+        # Passengers (simplified)
+        self.passengers = []
+        for _ in range(3):
+            body, = ax1.plot([], [], 'k-', linewidth=2)
+            arms, = ax1.plot([], [], 'k-', linewidth=2)
+            self.passengers.extend([body, arms])
+
+        ax1.set_xlim(0, 10)
+        ax1.set_ylim(2, 5)
+        ax1.axis('off')
+
+        # Plot gap and current
+        self.ax2 = self.figure.add_subplot(gs[1, 0])
+        self.gap_line, = self.ax2.plot([], [], 'b-', label='Gap (mm)')
+        self.current_line, = self.ax2.plot([], [], 'r-', label='Current (A/100)')
+        self.ax2.axhline(y=self.params['target_gap']*1000, color='g', linestyle='--', label='Target Gap')
+        self.ax2.legend(loc='upper right')
+        self.setup_history_axes(self.ax2, 'Levitation Control')
+
+        # Plot forces and field strength
+        self.ax3 = self.figure.add_subplot(gs[1, 1])
+        self.force_line, = self.ax3.plot([], [], 'r-', label='Force (kN)')
+        self.field_line, = self.ax3.plot([], [], 'b-', label='B-field (T)')
+        self.ax3.legend(loc='upper right')
+        self.setup_history_axes(self.ax3, 'Electromagnetic Effects')
+
+        self.animate(self.track, self.train, *self.magnets, self.field_lines,
+                     *self.passengers, self.gap_line, self.current_line,
+                     self.force_line, self.field_line)
+
+        self.figure.tight_layout()
+
+    def update(self, t_anim):
+        sim = self.trajectory()
+        t, gap, current, force = sim['t'], sim['gap'], sim['current'], sim['force']
+        velocity, B = sim['velocity'], sim['B']
+        track_irregularity = sim['track_irregularity']
+
+        current_t = t_anim % 3
+        current_idx = self.frame_index(t, current_t)
+
+        # Draw track
+        track_y = 3 + track_irregularity[current_idx] * np.sin(2*np.pi*self.track_x/2)
+        self.track.set_data(self.track_x, track_y)
+
+        # Train body with aerodynamic shape
+        train_height = 1
+        gap_current = gap[current_idx]
+        base = track_y[30] + gap_current
+        train_x = np.array([3, 3, 3.5, 5.5, 6, 6])
+        train_y = np.array([base + train_height, base, base - 0.2,
+                            base - 0.2, base, base + train_height])
+        self.train.set_xy(np.column_stack([train_x, train_y]))
+        self.train.set_color(plt.cm.viridis(current_idx/len(t)))
+
+        # Electromagnets and magnetic field lines
+        current_normalized = current[current_idx] / 1000
+        magnet_color = plt.cm.plasma(current_normalized)
+        segments = []
+        for x_pos, magnet in zip(self.magnet_positions, self.magnets):
+            magnet.set_xy([[x_pos-0.1, train_y[2]], [x_pos+0.1, train_y[2]],
+                           [x_pos+0.1, train_y[2]-0.2], [x_pos-0.1, train_y[2]-0.2]])
+            magnet.set_color(magnet_color)
+            for offset in [-0.05, 0, 0.05]:
+                segments.append([(x_pos+offset, train_y[2]-0.2),
+                                 (x_pos+offset, track_y[int(x_pos*10)])])
+        self.field_lines.set_segments(segments)
+        self.field_lines.set_linewidth(current_normalized * 0.3)
+        self.field_lines.set_visible(current[current_idx] > 100)
+
+        # Passengers
+        for i in range(3):
+            x = 4 + i * 0.5
+            y = train_y[0] - 0.3 + 0.1 * np.sin(5*current_t + i)
+            self.passengers[2*i].set_data([x, x], [y-0.2, y])
+            self.passengers[2*i + 1].set_data([x-0.1, x+0.1], [y, y])
+
+        # History plots
+        n = current_idx if current_idx > 1 else 0
+        self.set_series(self.gap_line, t[:n], gap[:n]*1000)
+        self.set_series(self.current_line, t[:n], current[:n]/100)
+        self.set_series(self.force_line, t[:n], force[:n]/1000)
+        self.set_series(self.field_line, t[:n], B[:n])
+        self.fit_ylim(self.ax2, gap[:n]*1000, current[:n]/100)
+        self.fit_ylim(self.ax3, force[:n]/1000, B[:n])
+
+        i = current_idx
+        return dict(
+            gap=gap[i]*1000, current=current[i], force=force[i]/1000,
+            dgap_dt=velocity[i]*1000, dB_dt=sim['dB_dt'][i], dI_dt=sim['dI_dt'][i],
+        )
+
+
+@register_scene
+class VibrationAnalysisScene(DerivativeScene):
+    name = "Vibration Analysis"
+    default_params = dict(VIBRATION_PARAMS, sweep_rate=60)
+    title = "Understanding Derivatives in Vibration Analysis"
+    explanation = """
+                <h3>Derivatives in Vibration Analysis</h3>
+                <p>Watch how derivatives describe the behavior of a multi-degree-of-freedom system:</p>
+                <ul>
+                    <li><b>Mass Positions:</b> Displacements of individual masses</li>
+                    <li><b>Velocities:</b> Rates of change in mass positions</li>
+                    <li><b>Energy Components:</b> Kinetic and potential energy</li>
+                </ul>
+                <p>Key Concepts:</p>
+                <ul>
+                    <li>Derivatives help understand the dynamics of the system</li>
+                    <li>They reveal the rate of change in various quantities</li>
+                    <li>This is crucial for analyzing and controlling complex systems</li>
+                </ul>
+            """
+    analysis_title = "Three-Mass Vibration Analysis"
+    analysis_sections = [
+        ("System Energy:", [
+            ("Kinetic", 'KE', "{:.3f} J"),
+            ("Potential", 'PE', "{:.3f} J"),
+            ("Total", 'E', "{:.3f} J")]),
+        ("Dynamic Parameters:", [
+            ("Forcing", 'forcing', "{:.1f} Hz, {:.1f} N"),
+            ("Natural Freq", 'natural', "{:.1f}, {:.1f}, {:.1f} Hz"),
+            ("Damping", 'zeta', "ζ={:.3f}")]),
+    ]
+
+    y_base = 3
+
+    @staticmethod
+    def simulate(sweep_rate, **params):
+        """Trajectories for the whole forcing-frequency sweep in one batch
+
+        The forcing frequency follows the 3 s animation cycle, so it is
+        sampled ``sweep_rate`` times per second and every sample becomes one
+        batch member of a single simulate_vibration() call.
+        """
+        sweep_t = np.arange(0, 3, 1/sweep_rate)
+        params['forcing_freq'] = 2 * np.pi * (1 + np.sin(sweep_t))  # Varying frequency
+        sim = simulate_vibration(**params)
+        sim['forcing_freq'] = params['forcing_freq']
+        return sim
+
+    def build(self):
+        gs = self.figure.add_gridspec(2, 2, height_ratios=[1.2, 1])
+        params = self.params
+        y_base = self.y_base
+
+        # Plot system visualization
+        ax1 = self.figure.add_subplot(gs[0, :])
+
+        # Base structure
+        ax1.plot([0, 10], [3, 3], 'k-', linewidth=2)
+
+        # Springs with different colors
+        self.springs = [
+            ax1.plot([], [], 'b-', linewidth=1.5, label=f'k₁={params["k1"]} N/m')[0],
+            ax1.plot([], [], 'g-', linewidth=1.5, label=f'k₂={params["k2"]} N/m')[0],
+            ax1.plot([], [], 'g-', linewidth=1.5, label=f'k₃={params["k3"]} N/m')[0],
+            ax1.plot([], [], 'b-', linewidth=1.5, label=f'k₄={params["k4"]} N/m')[0],
+        ]
+
+        # Masses with velocity-based color
+        self.masses = []
+        for i, m in enumerate((params['m1'], params['m2'], params['m3']), 1):
+            mass = plt.Rectangle((0, y_base-0.4), 0.8, 0.8, ec='k', label=f'm{i}={m} kg')
+            ax1.add_patch(mass)
+            self.masses.append(mass)
+
+        # Force arrow
+        self.force_arrow = ax1.arrow(0.5, y_base, 0, 0,
+                                     head_width=0.1, head_length=0.2, fc='r', ec='r',
+                                     label='External Force')
+
+        ax1.legend(loc='upper right', bbox_to_anchor=(1.0, 0.95))
+        ax1.set_xlim(0, 10)
+        ax1.set_ylim(2, 4)
+        ax1.axis('off')
+
+        # Plot displacements
+        self.ax2 = self.figure.add_subplot(gs[1, 0])
+        self.x_lines = [
+            self.ax2.plot([], [], 'r-', label='Mass 1')[0],
+            self.ax2.plot([], [], 'g-', label='Mass 2')[0],
+            self.ax2.plot([], [], 'b-', label='Mass 3')[0],
+        ]
+        self.ax2.legend(loc='upper right')
+        self.setup_history_axes(self.ax2, 'Mass Displacements')
+        self.ax2.set_xlabel('Time (s)')
+        self.ax2.set_ylabel('Position (m)')
+
+        # Plot energy
+        self.ax3 = self.figure.add_subplot(gs[1, 1])
+        self.energy_lines = [
+            self.ax3.plot([], [], 'r-', label='Kinetic')[0],
+            self.ax3.plot([], [], 'b-', label='Potential')[0],
+            self.ax3.plot([], [], 'g-', label='Total')[0],
+        ]
+        self.ax3.legend(loc='upper right')
+        self.setup_history_axes(self.ax3, 'System Energy')
+        self.ax3.set_xlabel('Time (s)')
+        self.ax3.set_ylabel('Energy (J)')
+
+        self.animate(*self.springs, *self.masses, self.force_arrow,
+                     *self.x_lines, *self.energy_lines)
+
+        self.figure.tight_layout()
+
+    @staticmethod
+    def spring_path(x1, x2, y1, y2, turns=12):
+        """Zigzag coordinates of a spring between two points"""
+        dx = x2 - x1
+        dy = y2 - y1
+        phi = np.arctan2(dy, dx)
+
+        t = np.linspace(0, turns*2*np.pi, 100)
+        x = np.linspace(x1, x2, 100)
+        y = y1 + (y2-y1)*(x-x1)/(x2-x1) + 0.15*np.sin(t)*np.cos(phi)
+        return x, y
+
+    def update(self, t_anim):
+        params = self.params
+        m1, k1, k2, k3, k4 = params['m1'], params['k1'], params['k2'], params['k3'], params['k4']
+        m2, m3, c1, F0 = params['m2'], params['m3'], params['c1'], params['F0']
+
+        current_t = t_anim % 3
+
+        # External forcing frequency sweeps with the animation; pick the
+        # sweep sample (batch column) nearest to this frame
+        sim = self.trajectory()
+        sweep = min(int(round(current_t * params['sweep_rate'])), len(sim['forcing_freq'])-1)
+        forcing_freq = sim['forcing_freq'][sweep]
+        t = sim['t']
+        x1, x2, x3, v1, v2, v3 = (sim[key][:, sweep] for key in ('x1', 'x2', 'x3', 'v1', 'v2', 'v3'))
+        KE, PE, F_ext = sim['KE'][:, sweep], sim['PE'][:, sweep], sim['F_ext'][sweep]
+        current_idx = self.frame_index(t, current_t)
+
+        # Current positions
+        y_base = self.y_base
+        positions = [3.0 + x1[current_idx], 5.0 + x2[current_idx], 7.0 + x3[current_idx]]
+        anchors = [1.0] + positions + [9.0]
+        for spring, left, right in zip(self.springs, anchors[:-1], anchors[1:]):
+            spring.set_data(*self.spring_path(left, right, y_base, y_base))
+
+        velocities = [v1[current_idx], v2[current_idx], v3[current_idx]]
+        for mass, v, x in zip(self.masses, velocities, positions):
+            mass.set_x(x-0.4)
+            mass.set_facecolor(plt.cm.RdYlBu(0.5 + v/2))
+
+        # Force arrow
+        self.force_arrow.set_visible(abs(F_ext) > 0.1)
+        self.force_arrow.set_data(dx=0.5*F_ext/F0)
+
+        # History plots
+        n = current_idx if current_idx > 1 else 0
+        for line, x in zip(self.x_lines, (x1, x2, x3)):
+            self.set_series(line, t[:n], x[:n])
+        for line, energy in zip(self.energy_lines, (KE, PE, KE + PE)):
+            self.set_series(line, t[:n], energy[:n])
+        self.fit_ylim(self.ax2, x1[:n], x2[:n], x3[:n])
+        self.fit_ylim(self.ax3, KE[:n], PE[:n], KE[:n] + PE[:n])
+
+        # Calculate approximate natural frequencies
+        wn1 = np.sqrt((k1 + k2)/m1)
+        wn2 = np.sqrt((k2 + k3)/m2)
+        wn3 = np.sqrt((k3 + k4)/m3)
+
+        i = current_idx
+        return dict(
+            KE=KE[i], PE=PE[i], E=KE[i]+PE[i],
+            forcing=(forcing_freq/(2*np.pi), F_ext),
+            natural=(wn1/(2*np.pi), wn2/(2*np.pi), wn3/(2*np.pi)),
+            zeta=c1/(2*np.sqrt(k1*m1)),
+        )
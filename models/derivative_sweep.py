@@ -0,0 +1,201 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from models.derivative_physics import (
+    DRONE_CONTROL_PARAMS, MAGLEV_TRAIN_PARAMS, VIBRATION_PARAMS,
+    simulate_drone_control, simulate_maglev_train, simulate_vibration,
+)
+
+# Headless parameter sweeps over the batched derivative models.
+#
+# A sweep runs one model for many parameter configurations: the swept
+# parameters are 1-D arrays (one entry per configuration) and every other
+# parameter keeps its default. Configurations are split into chunks, each
+# chunk is integrated as one batch by the vectorized model, and chunks are
+# spread over a process pool. Series come back as (configs x timesteps)
+# arrays together with a table of response metrics per configuration.
+#
+#     grid = parameter_grid(Kp=np.linspace(1, 10, 20), Kd=np.linspace(0, 4, 20))
+#     result = run_sweep('drone_control', grid)
+#     print(result.format_table(sort_by='settling_time'))
+
+
+def parameter_grid(**axes):
+    """Cartesian product of parameter values as flat arrays, one per name"""
+    values = [np.atleast_1d(np.asarray(v, dtype=float)) for v in axes.values()]
+    mesh = np.meshgrid(*values, indexing='ij')
+    return {name: m.ravel() for name, m in zip(axes, mesh)}
+
+
+def response_metrics(t, response, target, tolerance):
+    """Overshoot and settling time of responses shaped (configs, timesteps)
+
+    Overshoot is the largest excursion past the target in the direction the
+    response started moving towards it. Settling time is when the error last
+    leaves the ``tolerance`` band (NaN if it is still outside at the end).
+    """
+    error = response - target
+    direction = np.where(error[:, :1] > 0, -1.0, 1.0)
+    overshoot = np.maximum((error * direction).max(axis=1), 0.0)
+
+    outside = np.abs(error) > tolerance
+    last_outside = len(t) - 1 - np.argmax(outside[:, ::-1], axis=1)
+    settling_time = np.where(outside.any(axis=1), t[np.minimum(last_outside + 1, len(t) - 1)], t[0])
+    settling_time[outside[:, -1]] = np.nan
+    return overshoot, settling_time
+
+
+def drone_control_metrics(sim, params, tolerance):
+    t = sim['t']
+    position, setpoint = sim['position'], sim['setpoint']
+    overshoot, settling_time = response_metrics(t, position, setpoint, tolerance)
+    return dict(
+        overshoot=overshoot,
+        settling_time=settling_time,
+        rms_error=np.sqrt(np.mean(sim['error']**2, axis=1)),
+        control_energy=np.trapezoid(sim['control_signal']**2, t, axis=1),  # ∫u² dt
+    )
+
+
+def maglev_train_metrics(sim, params, tolerance):
+    t = sim['t']
+    target_gap = np.reshape(params['target_gap'], (-1, 1))
+    overshoot, settling_time = response_metrics(t, sim['gap'], target_gap, tolerance)
+    return dict(
+        overshoot=overshoot,
+        settling_time=settling_time,
+        min_gap=sim['gap'].min(axis=1),
+        coil_energy=np.trapezoid(sim['current']**2, t, axis=1),  # ∫I² dt (A²s)
+    )
+
+
+def vibration_metrics(sim, params, tolerance):
+    t = sim['t']
+    overshoot, settling_time = response_metrics(t, sim['x1'], 0.0, tolerance)
+    energy = sim['KE'] + sim['PE']
+    return dict(
+        overshoot=overshoot,
+        settling_time=settling_time,
+        peak_displacement=np.max([np.abs(sim[x]).max(axis=1) for x in ('x1', 'x2', 'x3')], axis=0),
+        peak_energy=energy.max(axis=1),
+        final_energy=energy[:, -1],
+    )
+
+
+# name: (simulate, default parameters, metrics, default settling tolerance)
+SWEEP_MODELS = {
+    'drone_control': (simulate_drone_control, DRONE_CONTROL_PARAMS, drone_control_metrics, 0.1),
+    'maglev_train': (simulate_maglev_train, MAGLEV_TRAIN_PARAMS, maglev_train_metrics, 0.002),
+    'vibration': (simulate_vibration, VIBRATION_PARAMS, vibration_metrics, 0.01),
+}
+
+# Model outputs that depend on time only, not on the configuration
+SHARED_SERIES = {'setpoint', 'track_irregularity'}
+
+
+def _run_chunk(model, params, tolerance):
+    """Simulate one batch of configurations (runs in a worker process)"""
+    simulate, _, metrics, _ = SWEEP_MODELS[model]
+    sim = simulate(**params)
+    t = sim.pop('t')
+    n_configs = len(next(v for v in params.values() if np.ndim(v)))
+
+    # Solver output is (timesteps, configs); store configs first. Outputs
+    # without a time axis (e.g. final values) stay one value per config.
+    series = {}
+    for key, value in sim.items():
+        value = np.asarray(value)
+        if key in SHARED_SERIES:
+            value = np.broadcast_to(value, (n_configs, len(t)))
+        elif value.ndim == 2:
+            value = value.T
+        else:
+            value = np.broadcast_to(value, (n_configs,))
+        series[key] = np.ascontiguousarray(value)
+    series['t'] = t
+    return series, metrics(series, params, tolerance)
+
+
+class SweepResult:
+    """Series and metrics of a parameter sweep, one row per configuration"""
+
+    def __init__(self, model, t, params, series, metrics):
+        self.model = model
+        self.t = t
+        self.params = params    # name -> (configs,)
+        self.series = series    # name -> (configs, timesteps)
+        self.metrics = metrics  # name -> (configs,)
+
+    def __len__(self):
+        return len(next(iter(self.params.values())))
+
+    @property
+    def table(self):
+        """Swept parameters and metrics as a NumPy structured array"""
+        columns = dict(self.params, **self.metrics)
+        table = np.empty(len(self), dtype=[(name, float) for name in columns])
+        for name, values in columns.items():
+            table[name] = values
+        return table
+
+    def format_table(self, sort_by=None, limit=20):
+        """Plain-text table, optionally sorted by a column (NaN last)"""
+        table = self.table
+        if sort_by is not None:
+            table = table[np.argsort(table[sort_by])]
+        names = table.dtype.names
+        width = max(12, *(len(name) for name in names))
+        lines = [' '.join(f'{name:>{width}}' for name in names)]
+        for row in table[:limit]:
+            lines.append(' '.join(f'{row[name]:>{width}.4g}' for name in names))
+        if limit is not None and len(table) > limit:
+            lines.append(f'... {len(table) - limit} more rows')
+        return '\n'.join(lines)
+
+
+def run_sweep(model, grid, workers=None, chunk_size=256, tolerance=None, **fixed):
+    """Run ``model`` for every configuration in ``grid``
+
+    ``grid`` maps parameter names to equal-length 1-D arrays (see
+    parameter_grid); ``fixed`` overrides other defaults for all
+    configurations. ``workers`` defaults to all cores; ``workers=1`` runs
+    in this process.
+    """
+    if model not in SWEEP_MODELS:
+        raise ValueError(f"Unknown sweep model: {model}")
+    _, defaults, _, default_tolerance = SWEEP_MODELS[model]
+    tolerance = default_tolerance if tolerance is None else tolerance
+
+    unknown = set(grid) | set(fixed)
+    unknown -= set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {model}: {', '.join(sorted(unknown))}")
+
+    if not grid:
+        raise ValueError("A sweep needs at least one swept parameter")
+    grid = {name: np.asarray(values, dtype=float).ravel() for name, values in grid.items()}
+    n_configs = len(next(iter(grid.values())))
+    if any(len(values) != n_configs for values in grid.values()):
+        raise ValueError("All swept parameters need the same number of values")
+
+    base = dict(defaults, **fixed)
+    chunks = []
+    for start in range(0, n_configs, chunk_size):
+        params = dict(base)
+        params.update({name: values[start:start + chunk_size] for name, values in grid.items()})
+        chunks.append(params)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        results = [_run_chunk(model, params, tolerance) for params in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_run_chunk, [model] * len(chunks), chunks,
+                                    [tolerance] * len(chunks)))
+
+    series = {key: np.concatenate([r[0][key] for r in results])
+              for key in results[0][0] if key != 't'}
+    metrics = {key: np.concatenate([r[1][key] for r in results]) for key in results[0][1]}
+    return SweepResult(model, results[0][0]['t'], grid, series, metrics)
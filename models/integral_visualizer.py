@@ -1,17 +1,48 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QComboBox, QSpinBox, QDoubleSpinBox, QGroupBox, QGridLayout, QSlider)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QFont, QPixmap
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import matplotlib
 matplotlib.use('Qt5Agg')
+from core.decimation import LineDecimator, band_envelope, points_for
+from core.equation_cache import EquationLabel
+from core.expression import ExpressionError, compile_expression
+from core.quadrature import MAX_ACCURACY_LEVEL, QUADRATURE_METHODS, convergence, integrate
+from core.sampling import (DIVERGENT_ORDER, adaptive_sample, break_lines, breakpoints,
+                           excluding, undefined_parts)
+
+METHOD_DESCRIPTIONS = {
+    'Trapezoid': "Trapezoid rule: straight lines between equally spaced points",
+    'Simpson': "Simpson's rule: parabolas through equally spaced points",
+    'Romberg': "Romberg: trapezoid rules with halved steps, extrapolated",
+    'Gauss-Legendre': "Gauss-Legendre: optimally placed points on equal panels",
+    'Adaptive Gauss-Kronrod': "Adaptive Gauss-Kronrod: the interval with the largest "
+                              "error is halved until the tolerance is met",
+}
 
 class IntegralVisualizer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        # Control changes are coalesced into one update per display frame
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(16)
+        self.update_timer.timeout.connect(self.update_graph)
+
+        # The convergence study (60 integrations and a log-log redraw) waits
+        # until the controls have been still for a moment
+        self.convergence_timer = QTimer(self)
+        self.convergence_timer.setSingleShot(True)
+        self.convergence_timer.setInterval(250)
+        self.convergence_timer.timeout.connect(self.update_convergence)
+        self.convergence_args = None
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -167,9 +198,42 @@ class IntegralVisualizer(QWidget):
         self.from_slider.valueChanged.connect(self.update_from_value)
         self.to_slider.valueChanged.connect(self.update_to_value)
         
+        # Method Group
+        method_group = QGroupBox("Integration Method")
+        method_group.setStyleSheet(interval_group.styleSheet())
+        method_layout = QGridLayout()
+
+        self.method_selector = QComboBox()
+        self.method_selector.addItems(QUADRATURE_METHODS)
+        self.method_selector.setCurrentText('Adaptive Gauss-Kronrod')
+        self.method_selector.setStyleSheet("""
+            QComboBox {
+                padding: 8px;
+                border: 2px solid #9b59b6;
+                border-radius: 5px;
+                min-width: 150px;
+                background: white;
+            }
+        """)
+        self.accuracy_level = QSpinBox()
+        self.accuracy_level.setRange(1, MAX_ACCURACY_LEVEL)
+        self.accuracy_level.setValue(8)
+        self.accuracy_level.setToolTip("Intervals, panels or tolerance of the method, "
+                                       "from coarse (1) to fine")
+
+        method_layout.addWidget(QLabel("Method:"), 0, 0)
+        method_layout.addWidget(self.method_selector, 0, 1)
+        method_layout.addWidget(QLabel("Accuracy level:"), 1, 0)
+        method_layout.addWidget(self.accuracy_level, 1, 1)
+        method_group.setLayout(method_layout)
+
+        self.method_selector.currentTextChanged.connect(self.schedule_update)
+        self.accuracy_level.valueChanged.connect(self.schedule_update)
+
         # Add groups to left panel
         left_panel.addWidget(function_group)
         left_panel.addWidget(interval_group)
+        left_panel.addWidget(method_group)
         left_panel.addStretch()
         
         main_layout.addLayout(left_panel)
@@ -215,12 +279,13 @@ class IntegralVisualizer(QWidget):
         right_panel.addWidget(self.steps_display)
 
         # Equation display
-        self.equation_figure = Figure(figsize=(6, 3), dpi=100)
-        self.equation_canvas = FigureCanvas(self.equation_figure)
-        right_panel.addWidget(self.equation_canvas)
+        self.equation_label = EquationLabel(fontsize=12, height=150)
+        self.equation_label.setStyleSheet("background-color: white;")
+        right_panel.addWidget(self.equation_label)
 
         # Final result
         self.result_label = QLabel()
+        self.result_label.setWordWrap(True)
         self.result_label.setStyleSheet("""
             QLabel {
                 font-size: 16px;
@@ -233,6 +298,16 @@ class IntegralVisualizer(QWidget):
         """)
         right_panel.addWidget(self.result_label)
 
+        # Convergence of every method for the chosen functions
+        self.convergence_figure = Figure(figsize=(6, 3), dpi=100)
+        self.convergence_canvas = FigureCanvas(self.convergence_figure)
+        self.convergence_canvas.setMinimumHeight(260)
+        self.convergence_ax = self.convergence_figure.add_subplot(111)
+        self.setup_convergence_plot()
+        self.convergence_canvas.mpl_connect('resize_event',
+                                            lambda event: self.convergence_figure.tight_layout())
+        right_panel.addWidget(self.convergence_canvas)
+
         # Add stretch to push everything up
         right_panel.addStretch()
 
@@ -276,48 +351,29 @@ class IntegralVisualizer(QWidget):
         # Add items and set defaults
         self.upper_function.addItems(upper_functions)
         self.lower_function.addItems(lower_functions)
+
+        # Besides the presets, any expression in x can be typed in
+        for combo in (self.upper_function, self.lower_function):
+            combo.setEditable(True)
+            combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+            combo.setToolTip("Type any expression in x, e.g. 3x² - 2x + 1, sin(2x)/x, |x - 1|, "
+                             "√x, e^-x.\nFunctions: sin cos tan asin acos atan sinh cosh tanh "
+                             "exp ln log sqrt abs; constants pi (π) and e")
         
         # Set default selections
         self.upper_function.setCurrentText("x²")
         self.lower_function.setCurrentText("0")
         
         # Connect signals after setting defaults
-        self.upper_function.currentTextChanged.connect(self.update_graph)
-        self.lower_function.currentTextChanged.connect(self.update_graph)
+        self.upper_function.currentTextChanged.connect(self.schedule_update)
+        self.lower_function.currentTextChanged.connect(self.schedule_update)
 
     def evaluate_function(self, func_str, x):
-        """Evaluate the selected function with error handling"""
+        """Evaluate a function of x typed as text (compiled once and cached)"""
         if not func_str:  # Handle empty string case
             return np.zeros_like(x)
-        
-        function_map = {
-            "x²": lambda x: x**2,
-            "x³/3": lambda x: x**3/3,
-            "2x + 1": lambda x: 2*x + 1,
-            "sin(x) + 2": lambda x: np.sin(x) + 2,
-            "√x + 1": lambda x: np.sqrt(np.abs(x)) + 1,
-            "e^x": lambda x: np.exp(x),
-            "ln(x)": lambda x: np.log(np.abs(x) + 1e-10),
-            "cos(x)": lambda x: np.cos(x),
-            "tan(x)": lambda x: np.tan(x),
-            "x⁴/4": lambda x: x**4/4,
-            "|x|": lambda x: np.abs(x),
-            "1/x": lambda x: 1/(x + 1e-10),
-            "0": lambda x: np.zeros_like(x),
-            "x": lambda x: x,
-            "-x + 1": lambda x: -x + 1,
-            "-x²/2": lambda x: -x**2/2,
-            "-x³/3": lambda x: -x**3/3,
-            "-|x|": lambda x: -np.abs(x),
-            "-e^x": lambda x: -np.exp(x),
-            "-ln(x)": lambda x: -np.log(np.abs(x) + 1e-10),
-            "-cos(x)": lambda x: -np.cos(x),
-            "-1/x": lambda x: -1/(x + 1e-10),
-            "-√x": lambda x: -np.sqrt(np.abs(x))
-        }
-        
-        # Return zeros if function not found
-        return function_map.get(func_str, lambda x: np.zeros_like(x))(x)
+        with np.errstate(all='ignore'):
+            return compile_expression(func_str)(x)
 
     def update_graph(self):
         try:
@@ -332,20 +388,54 @@ class IntegralVisualizer(QWidget):
                 self.result_label.setText("Invalid interval: start must be less than end")
                 return
             
-            x = np.linspace(a, b, 200)
+            try:
+                upper_expression = compile_expression(upper_func)
+                lower_expression = compile_expression(lower_func)
+            except ExpressionError as e:
+                self.result_label.setText(f"Invalid function: {e}")
+                return
             
-            upper = self.evaluate_function(upper_func, x)
-            lower = self.evaluate_function(lower_func, x)
+            def curves(x):
+                return np.array([upper_expression(x), lower_expression(x)])
+
+            def integrand(x):
+                return upper_expression(x) - lower_expression(x)
+
+            # Both curves on one grid, refined where either bends; jumps,
+            # poles and domain edges end up as break points
+            sampling = {}
+            with np.errstate(all='ignore'):
+                x, (upper, lower) = adaptive_sample(curves, a, b, stats=sampling)
+                breaks, orders = breakpoints(integrand, x, (upper, lower), sampling['breaks'], a, b)
+            poles = breaks[orders >= DIVERGENT_ORDER]
+            # Parts of the interval outside either function's domain
+            undefined = undefined_parts(x, (upper, lower), breaks)
             
-            # Calculate area using numerical integration
-            dx = (b - a) / 199
-            area = np.sum((upper - lower) * dx)
+            # Calculate area with the selected quadrature method, piece by
+            # piece between the break points
+            method = self.method_selector.currentText()
+            level = self.accuracy_level.value()
+            integrand = excluding(integrand, breaks)
+
+            stats = {}
+            if undefined:
+                area, error, evaluations = np.nan, np.nan, 0
+            elif poles.size:
+                area, error, evaluations = np.inf, np.inf, 0
+            else:
+                with np.errstate(all='ignore'):
+                    area, error, evaluations = integrate(integrand, a, b, method, level, stats,
+                                                         points=breaks)
             
             # Update graph
-            self.graph.update_data(x, upper, lower, upper_func, lower_func)
+            self.graph.update_data(x, upper, lower, upper_func, lower_func, breaks)
             
             # Update steps and equations
-            self.update_steps_and_equations(upper_func, lower_func, a, b, dx, area)
+            self.update_steps_and_equations(upper_func, lower_func, a, b, method, level,
+                                            area, error, evaluations,
+                                            stats.get('converged', True), poles, undefined)
+            self.convergence_args = (integrand, a, b, method, level, breaks, poles, undefined)
+            self.convergence_timer.start()
             
         except Exception as e:
             print(f"Error updating graph: {e}")
@@ -353,8 +443,18 @@ class IntegralVisualizer(QWidget):
             self.upper_function.setCurrentText("x²")
             self.lower_function.setCurrentText("0")
 
-    def update_steps_and_equations(self, upper_func, lower_func, a, b, dx, area):
+    def update_steps_and_equations(self, upper_func, lower_func, a, b, method, level,
+                                   area, error, evaluations, converged=True, poles=(),
+                                   undefined=()):
         # Update steps display
+        if undefined:
+            result_step = f"<br>• {self.undefined_text(undefined, a, b)}: there is no area"
+        elif len(poles):
+            where = ", ".join(f"{pole:.4g}" for pole in poles)
+            result_step = f"<br>• f(x) - g(x) has a pole at x = {where}: the integral diverges"
+        else:
+            result_step = (f"<br>• Evaluations of f(x) - g(x): {evaluations}"
+                           f"<br>• Estimated error: ± {error:.2e}")
         steps_text = f"""
             <h3>Step-by-Step Solution:</h3>
             <p>1. Identify the functions:
@@ -364,123 +464,235 @@ class IntegralVisualizer(QWidget):
                <br>• Interval: [{a:.1f}, {b:.1f}]
                <br>• Area = ∫[f(x) - g(x)]dx</p>
             <p>3. Numerical Integration:
-               <br>• Divide interval into small segments (Δx = {dx:.4f})
-               <br>• Sum the areas of rectangles</p>
+               <br>• {METHOD_DESCRIPTIONS[method]}
+               <br>• Accuracy level {level} of {MAX_ACCURACY_LEVEL}</p>
             <p>4. Calculate the area:
-               <br>• Using numerical integration
-               <br>• Number of segments: {int((b-a)/dx)}</p>
+               {result_step}</p>
         """
         self.steps_display.setText(steps_text)
         
         # Update equation display
-        self.update_equation_display(upper_func, lower_func, a, b, dx, area)
+        self.update_equation_display(upper_func, lower_func, a, b, method, area, error)
         
         # Update final result
-        self.result_label.setText(f"Final Area = {area:.4f} square units")
+        if undefined:
+            self.result_label.setText(f"Area undefined: {self.undefined_text(undefined, a, b)}")
+        elif len(poles):
+            self.result_label.setText(f"Area diverges: f(x) - g(x) has a pole at x = {where}")
+        elif not (np.isfinite(area) and np.isfinite(error)):
+            self.result_label.setText("Area does not converge: the integrand is "
+                                      "singular on this interval")
+        elif not converged:
+            self.result_label.setText(f"Area ≈ {area:.6g} ± {error:.1e}, tolerance not reached "
+                                      f"after {evaluations} evaluations: the integrand may "
+                                      "be singular on this interval")
+        else:
+            self.result_label.setText(f"Final Area = {area:.6g} ± {error:.1e} square units")
 
-    def update_equation_display(self, upper_func, lower_func, a, b, dx, area):
-        # Clear previous equation
-        self.equation_figure.clear()
-        ax = self.equation_figure.add_subplot(111)
-        ax.axis('off')
-        
+    @staticmethod
+    def domain_edges(undefined, a, b):
+        """'domain edge(s) at x = …' inside (a, b) of undefined_parts, or '' if none"""
+        edges = sorted({end for part in undefined for end in part if a < end < b})
+        if not edges:
+            return ""
+        where = " and ".join(f"{edge:.4g}" for edge in edges)
+        return f"domain edge{'s' if len(edges) > 1 else ''} at x = {where}"
+
+    def undefined_text(self, undefined, a, b):
+        """Where f(x) - g(x) has no value, from undefined_parts"""
+        edges = self.domain_edges(undefined, a, b)
+        return (f"f(x) - g(x) is undefined for part of [{a:.1f}, {b:.1f}]"
+                + (f" ({edges})" if edges else ""))
+
+    def update_equation_display(self, upper_func, lower_func, a, b, method, area, error):
         # Convert function strings to LaTeX
         upper_latex = self.convert_to_latex(upper_func)
         lower_latex = self.convert_to_latex(lower_func)
         
         # Create full equation text with proper LaTeX syntax
+        if np.isnan(area):
+            result = r"$\mathrm{Area}$ undefined"
+        elif np.isinf(area):
+            result = r"$\mathrm{Area} = \infty$ (divergent)"
+        else:
+            result = r"$\mathrm{Area} = " + f"{area:.6g} \\pm {error:.1e}$ square units"
         equation = (
             r"$\int_{" + f"{a:.1f}" + r"}^{" + f"{b:.1f}" + r"} "
             r"[" + upper_latex + r" - (" + lower_latex + r")] dx$"
             "\n"
-            r"$\sum [f(x_i) - g(x_i)]\Delta x, \Delta x = " + f"{dx:.4f}$"
+            + method +
             "\n"
-            r"$\mathrm{Area} = " + f"{area:.4f}$ square units"
+            + result
         )
         
-        # Display equation with proper font size and centering
-        ax.text(0.5, 0.5, equation,
-                horizontalalignment='center',
-                verticalalignment='center',
-                transform=ax.transAxes,
-                fontsize=12)
-        
-        # Update the figure
-        self.equation_canvas.draw()
+        # Rendered once per distinct text, then shown from the shared cache
+        self.equation_label.set_equation(equation)
 
-    def convert_to_latex(self, func_str):
-        # Convert function strings to proper LaTeX notation
-        latex_map = {
-            "x²": "x^2",
-            "2x + 1": "2x + 1",
-            "sin(x) + 2": r"\sin(x) + 2",
-            "x³/3": r"\frac{x^3}{3}",
-            "√x + 1": r"\sqrt{x} + 1",
-            "e^x": "e^x",
-            "0": "0",
-            "x": "x",
-            "-x + 1": "-x + 1",
-            "sin(x)": r"\sin(x)",
-            "-x²/2": r"-\frac{x^2}{2}",
-            "ln(x)": r"\ln(x)"
+    def setup_convergence_plot(self):
+        """Static convergence axes with one line per method"""
+        ax = self.convergence_ax
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Function evaluations')
+        ax.set_ylabel('|Error|')
+        ax.set_title('Convergence for the chosen functions', fontsize=10)
+        ax.grid(True, which='major', alpha=0.3)
+        self.convergence_lines = {
+            method: ax.plot([], [], 'o-', markersize=3, linewidth=1, label=method)[0]
+            for method in QUADRATURE_METHODS
         }
-        return latex_map.get(func_str, func_str)
+        self.convergence_marker, = ax.plot([], [], 'o', markersize=9, markerfacecolor='none',
+                                           markeredgecolor='k', markeredgewidth=1.5)
+        ax.legend(fontsize=7, loc='upper right')
+        self.convergence_figure.tight_layout()
+
+    def update_convergence(self):
+        """Error against evaluations for every method at accuracy levels 1 .. 12
+
+        Errors are measured from the finest adaptive Gauss-Kronrod result
+        (when it converges); the circle marks the selected method and level.
+        """
+        integrand, a, b, method, level, breaks, poles, undefined = self.convergence_args
+        ax = self.convergence_ax
+        if undefined or len(poles):
+            for line in (*self.convergence_lines.values(), self.convergence_marker):
+                line.set_data([], [])
+            if undefined:
+                edges = self.domain_edges(undefined, a, b)
+                ax.set_title(f"No convergence: undefined past the {edges}" if edges
+                             else "No convergence: undefined on the interval", fontsize=10)
+            else:
+                ax.set_title('No convergence: the integral diverges', fontsize=10)
+            self.convergence_canvas.draw_idle()
+            return
+
+        with np.errstate(all='ignore'):
+            stats = {}
+            reference, _, _ = integrate(integrand, a, b, level=MAX_ACCURACY_LEVEL, stats=stats,
+                                        points=breaks)
+            floor = 1e-16 * max(abs(reference), 1.0)
+            points = []
+            for name, line in self.convergence_lines.items():
+                evaluations, values, _ = convergence(integrand, a, b, name, points=breaks)
+                errors = np.maximum(np.abs(values - reference), floor)
+                line.set_data(evaluations, errors)
+                if name == method:
+                    self.convergence_marker.set_data([evaluations[level - 1]], [errors[level - 1]])
+                points.append((evaluations, errors))
+
+        finite = np.concatenate([np.stack(p) for p in points], axis=1)
+        finite = finite[:, np.isfinite(finite).all(axis=0)]
+        if finite.size and stats['converged']:
+            ax.set_xlim(finite[0].min() / 1.5, finite[0].max() * 1.5)
+            ax.set_ylim(finite[1].min() / 10, finite[1].max() * 10)
+            ax.set_title('Convergence for the chosen functions', fontsize=10)
+        else:
+            # Without a converged reference there is no error to measure
+            for line in (*self.convergence_lines.values(), self.convergence_marker):
+                line.set_data([], [])
+            ax.set_title('No convergence: the integrand may be singular on the interval',
+                         fontsize=10)
+        self.convergence_canvas.draw_idle()
+
+    def convert_to_latex(self, func_str):
+        # LaTeX from the same parse tree that is evaluated
+        return compile_expression(func_str).latex
 
     def update_from_value(self, value):
         scaled_value = value / 10.0
         self.from_value.setText(f"{scaled_value:.1f}")
-        self.update_graph()
+        self.schedule_update()
 
     def update_to_value(self, value):
         scaled_value = value / 10.0
         self.to_value.setText(f"{scaled_value:.1f}")
-        self.update_graph()
+        self.schedule_update()
+
+    def schedule_update(self):
+        """Coalesce control changes into one update per display frame"""
+        if not self.update_timer.isActive():
+            self.update_timer.start()
 
 class GraphWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
         layout = QVBoxLayout(self)
+        layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
         
         # Initialize data
         self.x_data = None
         self.upper_data = None
         self.lower_data = None
+        self.y_range = None
         self.upper_func = None
         self.lower_func = None
 
-    def update_data(self, x, upper, lower, upper_func, lower_func):
-        self.x_data = x
-        self.upper_data = upper
-        self.lower_data = lower
+        # Artists are created once and updated in place by plot_data. The
+        # curves and the filled area are drawn decimated to the axes width
+        # and re-decimated on zoom and pan
+        self.ax = self.figure.add_subplot(111)
+        self.upper_line, = self.ax.plot([], [], '-', color='#3498db', label='f(x)')
+        self.lower_line, = self.ax.plot([], [], '-', color='#2ecc71', label='g(x)')
+        self.fill = self.ax.fill_between([], [], [], alpha=0.3, color='#3498db')
+        self.decimators = [LineDecimator(self.upper_line), LineDecimator(self.lower_line)]
+        self.ax.callbacks.connect('xlim_changed', self.refresh_fill)
+        
+        # Customize plot
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+        self.ax.set_xlabel('x', fontsize=12)
+        self.ax.set_ylabel('y', fontsize=12)
+        self.legend = self.ax.legend(fontsize=10)
+        self.ax.set_title('Area Between Curves', fontsize=14)
+        
+        self.figure.tight_layout()
+        self.canvas.mpl_connect('resize_event', lambda event: self.figure.tight_layout())
+
+    def update_data(self, x, upper, lower, upper_func, lower_func, breaks=()):
+        """Show sampled curves; lines and fill are interrupted at ``breaks``"""
+        breaks = np.asarray(breaks, dtype=float)
+        # The y-range leaves out the neighbourhood of each break, where a
+        # pole would otherwise flatten the rest of the plot
+        near = (np.abs(x[:, None] - breaks) < 0.02 * (x[-1] - x[0])).any(axis=1)
+        self.x_data, (self.upper_data, self.lower_data) = break_lines(x, (upper, lower), breaks)
+        self.y_range = np.concatenate([upper[~near], lower[~near]])
         self.upper_func = upper_func
         self.lower_func = lower_func
         self.plot_data()
 
     def plot_data(self):
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # Plot filled area
-        ax.fill_between(self.x_data, self.lower_data, self.upper_data, 
-                       alpha=0.3, color='#3498db')
-        
-        # Plot functions
-        ax.plot(self.x_data, self.upper_data, '-', 
-                color='#3498db', label=f'f(x) = {self.upper_func}')
-        ax.plot(self.x_data, self.lower_data, '-', 
-                color='#2ecc71', label=f'g(x) = {self.lower_func}')
-        
-        # Customize plot
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.legend(fontsize=10)
-        
-        # Use LaTeX for tick labels
-        ax.set_title('Area Between Curves', fontsize=14)
-        
-        self.figure.tight_layout()
-        self.canvas.draw() 
\ No newline at end of file
+        x = self.x_data
+        labels = (f'f(x) = {self.upper_func}', f'g(x) = {self.lower_func}')
+        for line, text, label in zip((self.upper_line, self.lower_line),
+                                     self.legend.get_texts(), labels):
+            line.set_label(label)
+            text.set_text(label)
+
+        finite = self.y_range[np.isfinite(self.y_range)]
+        if not finite.size:
+            finite = np.concatenate([self.lower_data, self.upper_data])
+            finite = finite[np.isfinite(finite)]
+        if finite.size:
+            low, high = finite.min(), finite.max()
+            pad = 0.05 * max(high - low, 1e-9)
+            self.ax.set_ylim(low - pad, high + pad)
+        for decimator, y in zip(self.decimators, (self.upper_data, self.lower_data)):
+            decimator.set_data(x, y)
+        # Re-decimates the curves and fill again only if the limits change
+        self.ax.set_xlim(x[0], x[-1])
+        self.refresh_fill(self.ax)
+
+        # New data: the toolbar's home view is this one
+        self.toolbar.update()
+        self.canvas.draw_idle()
+
+    def refresh_fill(self, ax):
+        """Update the area between the curves for the visible x-range"""
+        if self.x_data is None:
+            return
+        x, lower, upper = band_envelope(self.x_data, self.lower_data, self.upper_data,
+                                        points_for(ax) // 2, ax.get_xlim())
+        self.fill.set_data(x, lower, upper)
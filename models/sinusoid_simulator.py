@@ -2,12 +2,227 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QLabel, QPushButton, QLineEdit, QFrame, QTabWidget,
                             QGridLayout, QSlider, QComboBox, QSpinBox, QDoubleSpinBox,
                             QDialog, QScrollArea)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QPixmap
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from core.blit_manager import BlitManager
+from core.decimation import LineDecimator
+from core.waveform import (HARMONIC_SHAPES, WINDOWS, am_tones, fm_signal,
+                           harmonic_tones, sinusoid_key_points, spectrum, synthesize)
+
+# Signal builder: a harmonic series, an optional AM/FM carrier and noise,
+# one second long so every whole-hertz tone lands on an FFT bin
+SIGNAL_BUILDER_PARAMS = dict(
+    shape='Square', fundamental=50, harmonics=25, amplitude=1.0,
+    carrier='None', carrier_freq=2000, mod_freq=50, mod_depth=0.5,
+    noise=0.05, samples=100_000, window='Hann', seed=0,
+)
+CARRIERS = ('None', 'AM', 'FM')
+SAMPLE_COUNTS = (10_000, 100_000, 1_000_000)
+
+
+def build_signal(shape, fundamental, harmonics, amplitude, carrier, carrier_freq,
+                 mod_freq, mod_depth, noise, samples, seed, **_):
+    """Synthesize the builder signal; returns (t, y, sample_rate)"""
+    sample_rate = samples  # One second of signal
+    tones = [harmonic_tones(fundamental, harmonics, shape, amplitude)]
+    if carrier == 'AM':
+        tones.append(am_tones(amplitude, carrier_freq, mod_freq, mod_depth))
+    amps, freqs, phases = (np.concatenate(parts) for parts in zip(*tones))
+    y = synthesize(samples, sample_rate, amps, freqs, phases)
+
+    t = np.arange(samples) / sample_rate
+    if carrier == 'FM':
+        y += fm_signal(t, amplitude, carrier_freq, mod_freq, mod_depth)
+    if noise > 0:
+        y += noise * np.random.default_rng(seed).standard_normal(samples)
+    return t, y, sample_rate
+
+
+# Real world examples: selector label, plot title, wave over t in [0, 4π]
+# and description. Waves with a noise term draw from ``rng``.
+REAL_WORLD_EXAMPLES = [
+    dict(
+        name="⚡ Electrical: AC Power Signal (60 Hz)",
+        title='⚡ AC Power Signal (60 Hz)',
+        wave=lambda t, rng: 3*np.sin(2*np.pi*60*t/100),
+        description="""
+        <h3 style='color: #2980b9;'>Electrical Engineering: AC Power</h3>
+        <p>Standard household electricity follows this sinusoidal pattern:</p>
+        • Voltage: 120V RMS (170V peak)<br>
+        • Frequency: 60 Hz (US standard)<br>
+        • Complete cycle every 1/60th second<br>
+        • Powers homes and industries worldwide
+        """,
+    ),
+    dict(
+        name="⚡ Electrical: Radio Wave Modulation",
+        title='⚡ AM Radio Wave Modulation',
+        wave=lambda t, rng: (1 + 0.3*np.sin(t)) * np.sin(10*t),
+        description="""
+        <h3 style='color: #2980b9;'>Electrical Engineering: Radio Communication</h3>
+        <p>Amplitude Modulation (AM) combines carrier and signal waves:</p>
+        • Carrier wave: High frequency<br>
+        • Signal wave: Information to transmit<br>
+        • Modulation depth: 30%<br>
+        • Used in broadcasting and communication
+        """,
+    ),
+    dict(
+        name="⚡ Electrical: Power Factor Analysis",
+        title='⚡ Power Factor Analysis',
+        wave=lambda t, rng: np.sin(t) + np.sin(t + np.pi/4),
+        description="""
+        <h3 style='color: #2980b9;'>Electrical Engineering: Power Factor</h3>
+        <p>Phase difference between voltage and current waves:</p>
+        • Voltage and current signals<br>
+        • Phase shift indicates power factor<br>
+        • Critical for power efficiency<br>
+        • Important in industrial applications
+        """,
+    ),
+    dict(
+        name="🔧 Mechanical: Engine Piston Motion",
+        title='🔧 Engine Piston Motion',
+        wave=lambda t, rng: 2*np.cos(t) + 0.2*np.cos(3*t),
+        description="""
+        <h3 style='color: #2980b9;'>Mechanical Engineering: Piston Motion</h3>
+        <p>Piston displacement in an engine cylinder:</p>
+        • Primary motion: Sinusoidal<br>
+        • Harmonics from mechanical linkages<br>
+        • Critical for engine timing<br>
+        • Basis for engine dynamics
+        """,
+    ),
+    dict(
+        name="🔧 Mechanical: Spring-Mass Oscillation",
+        title='🔧 Spring-Mass Oscillation',
+        wave=lambda t, rng: 2*np.sin(2*t)*np.exp(-t/8),
+        description="""
+        <h3 style='color: #2980b9;'>Mechanical Engineering: Spring-Mass System</h3>
+        <p>Natural oscillation with damping:</p>
+        • Natural frequency determined by mass and spring<br>
+        • Damping from friction and air resistance<br>
+        • Amplitude decreases over time<br>
+        • Fundamental mechanical system
+        """,
+    ),
+    dict(
+        name="🔧 Mechanical: Damped Vibration",
+        title='🔧 Damped Mechanical Vibration',
+        wave=lambda t, rng: np.exp(-t/2)*np.sin(4*t),
+        description="""
+        <h3 style='color: #2980b9;'>Mechanical Engineering: Damped Vibration</h3>
+        <p>Vibration analysis in mechanical systems:</p>
+        • Exponential decay envelope<br>
+        • Critical for machine design<br>
+        • Used in shock absorber design<br>
+        • Important for structural safety
+        """,
+    ),
+    dict(
+        name="🏗️ Civil: Bridge Resonance",
+        title='🏗️ Bridge Resonance',
+        wave=lambda t, rng: np.sin(t) + 0.5*np.sin(2*t) + 0.2*np.sin(3*t),
+        description="""
+        <h3 style='color: #2980b9;'>Civil Engineering: Bridge Dynamics</h3>
+        <p>Multiple frequency components in bridge motion:</p>
+        • Fundamental mode and harmonics<br>
+        • Wind and traffic induced vibrations<br>
+        • Critical for bridge design<br>
+        • Safety monitoring parameter
+        """,
+    ),
+    dict(
+        name="🏗️ Civil: Seismic Wave Analysis",
+        title='🏗️ Seismic Wave Analysis',
+        wave=lambda t, rng: np.exp(-t/3)*(np.sin(8*t) + 0.5*np.sin(15*t)),
+        description="""
+        <h3 style='color: #2980b9;'>Civil Engineering: Seismic Analysis</h3>
+        <p>Earthquake ground motion patterns:</p>
+        • Multiple frequency components<br>
+        • Rapid initial motion<br>
+        • Gradual damping<br>
+        • Used in structural design
+        """,
+    ),
+    dict(
+        name="🏗️ Civil: Wind Load Oscillation",
+        title='🏗️ Wind Load Oscillation',
+        wave=lambda t, rng: 2*np.sin(t/2) + 0.5*rng.standard_normal(len(t)),
+        description="""
+        <h3 style='color: #2980b9;'>Civil Engineering: Wind Effects</h3>
+        <p>Wind-induced structural motion:</p>
+        • Base oscillation from wind<br>
+        • Random turbulence components<br>
+        • Critical for tall structures<br>
+        • Used in facade design
+        """,
+    ),
+    dict(
+        name="💻 Computer: Digital Signal Sampling",
+        title='💻 Digital Signal Sampling',
+        wave=lambda t, rng: np.sin(3*t) + np.where(np.mod(t, 0.5) < 0.1, 0.3, 0),
+        description="""
+        <h3 style='color: #2980b9;'>Computer Engineering: Signal Sampling</h3>
+        <p>Analog to digital conversion process:</p>
+        • Continuous signal<br>
+        • Sampling points<br>
+        • Quantization effects<br>
+        • Nyquist sampling theorem
+        """,
+    ),
+    dict(
+        name="💻 Computer: Carrier Wave Modulation",
+        title='💻 Digital Carrier Modulation',
+        wave=lambda t, rng: np.sin(20*t) * np.sign(np.sin(2*t)),
+        description="""
+        <h3 style='color: #2980b9;'>Computer Engineering: Digital Communication</h3>
+        <p>Digital data modulation techniques:</p>
+        • Carrier signal<br>
+        • Digital data encoding<br>
+        • Binary phase shifts<br>
+        • Used in digital communications
+        """,
+    ),
+    dict(
+        name="💻 Computer: Noise Filtering",
+        title='💻 Signal Noise Filtering',
+        wave=lambda t, rng: np.sin(3*t) + 0.3*rng.standard_normal(len(t)),
+        description="""
+        <h3 style='color: #2980b9;'>Computer Engineering: Noise Reduction</h3>
+        <p>Digital signal processing for noise removal:</p>
+        • Original signal with noise<br>
+        • Random noise components<br>
+        • Filtering techniques<br>
+        • Signal recovery methods
+        """,
+    ),
+]
+
+_example_catalog = None
+
+
+def example_catalog():
+    """Every example with its wave sampled once; returns (t, examples)
+
+    The catalog is generated on first use and shared afterwards. Noise
+    comes from a fixed seed, so a noisy example looks the same each time.
+    """
+    global _example_catalog
+    if _example_catalog is None:
+        t = np.linspace(0, 4*np.pi, 1000)
+        rng = np.random.default_rng(0)
+        _example_catalog = (t, [dict(example, wave=example['wave'](t, rng))
+                                for example in REAL_WORLD_EXAMPLES])
+    return _example_catalog
+
 
 class SinusoidSimulator(QWidget):
     def __init__(self):
@@ -47,10 +262,15 @@ class SinusoidSimulator(QWidget):
         self.setup_simulator_tab(simulator_tab)
         self.tab_widget.addTab(simulator_tab, "🌊 Wave Simulator")
         
-        # Create Real World Examples tab
-        examples_tab = QWidget()
-        self.create_examples_tab(examples_tab)
-        self.tab_widget.addTab(examples_tab, "🔬 Real World Examples")
+        # Create Signal Builder tab
+        builder_tab = QWidget()
+        self.setup_builder_tab(builder_tab)
+        self.tab_widget.addTab(builder_tab, "🎛️ Signal Builder")
+        
+        # Real World Examples tab, built the first time it is shown
+        self.examples_tab = QWidget()
+        self.tab_widget.addTab(self.examples_tab, "🔬 Real World Examples")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Add tab widget to main layout
         layout.addWidget(self.tab_widget)
@@ -63,11 +283,19 @@ class SinusoidSimulator(QWidget):
         # Create layout for the tab
         tab_layout = QVBoxLayout(tab)
         
-        # Create matplotlib figure
+        # Create matplotlib figure; axes and wave artists are built once
         self.figure, self.ax = plt.subplots(figsize=(15, 6))
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(300)
         tab_layout.addWidget(self.canvas)
+        self.setup_plot()
+        self.blit_manager = BlitManager(self.canvas, self.create_wave_artists())
+
+        # Slider drags fire many events per frame; redraw at most once per frame
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(16)
+        self.redraw_timer.timeout.connect(self.update_wave)
         
         # Create controls
         controls_layout = QVBoxLayout()
@@ -82,7 +310,7 @@ class SinusoidSimulator(QWidget):
         self.amp_slider.setValue(100)
         self.amp_value_label = QLabel("1.0")
         self.amp_value_label.setMinimumWidth(50)
-        self.amp_slider.valueChanged.connect(self.update_wave)
+        self.amp_slider.valueChanged.connect(self.schedule_update)
         self.amp_slider.valueChanged.connect(
             lambda v: self.amp_value_label.setText(f"{v/100:.1f}")
         )
@@ -100,7 +328,7 @@ class SinusoidSimulator(QWidget):
         self.freq_slider.setValue(100)
         self.freq_value_label = QLabel("1.0")
         self.freq_value_label.setMinimumWidth(50)
-        self.freq_slider.valueChanged.connect(self.update_wave)
+        self.freq_slider.valueChanged.connect(self.schedule_update)
         self.freq_slider.valueChanged.connect(
             lambda v: self.freq_value_label.setText(f"{v/100:.1f}")
         )
@@ -118,7 +346,7 @@ class SinusoidSimulator(QWidget):
         self.phase_slider.setValue(0)
         self.phase_value_label = QLabel("0°")
         self.phase_value_label.setMinimumWidth(50)
-        self.phase_slider.valueChanged.connect(self.update_wave)
+        self.phase_slider.valueChanged.connect(self.schedule_update)
         self.phase_slider.valueChanged.connect(
             lambda v: self.phase_value_label.setText(f"{v}°")
         )
@@ -136,7 +364,7 @@ class SinusoidSimulator(QWidget):
         self.offset_slider.setValue(0)
         self.offset_value_label = QLabel("0.0")
         self.offset_value_label.setMinimumWidth(50)
-        self.offset_slider.valueChanged.connect(self.update_wave)
+        self.offset_slider.valueChanged.connect(self.schedule_update)
         self.offset_slider.valueChanged.connect(
             lambda v: self.offset_value_label.setText(f"{v/100:.1f}")
         )
@@ -197,6 +425,150 @@ class SinusoidSimulator(QWidget):
         # Initial wave update
         self.update_wave()
 
+    def setup_builder_tab(self, tab):
+        """Setup the multi-component signal builder with its spectrum"""
+        tab_layout = QVBoxLayout(tab)
+        self.builder_params = dict(SIGNAL_BUILDER_PARAMS)
+
+        # Time signal on top, FFT amplitude and phase below
+        self.builder_figure = Figure(figsize=(15, 7))
+        self.builder_canvas = FigureCanvas(self.builder_figure)
+        self.builder_canvas.setMinimumHeight(400)
+        tab_layout.addWidget(NavigationToolbar(self.builder_canvas, tab))
+        tab_layout.addWidget(self.builder_canvas)
+        gs = self.builder_figure.add_gridspec(2, 2, height_ratios=[1, 1])
+        self.signal_ax = self.builder_figure.add_subplot(gs[0, :])
+        self.amplitude_ax = self.builder_figure.add_subplot(gs[1, 0])
+        self.phase_ax = self.builder_figure.add_subplot(gs[1, 1])
+
+        self.signal_line, = self.signal_ax.plot([], [], 'b-', linewidth=1)
+        self.signal_ax.set_title('Signal')
+        self.signal_ax.set_xlabel('Time (s)')
+        self.signal_ax.set_ylabel('Amplitude')
+        self.amplitude_line, = self.amplitude_ax.plot([], [], color='#2c3e50', linewidth=1)
+        self.amplitude_ax.set_title('FFT Magnitude')
+        self.amplitude_ax.set_xlabel('Frequency (Hz)')
+        self.amplitude_ax.set_ylabel('Amplitude (dB)')
+        self.phase_markers, = self.phase_ax.plot([], [], 'o', color='purple', markersize=3)
+        self.phase_ax.set_title('FFT Phase (components within 40 dB of the peak)')
+        self.phase_ax.set_xlabel('Frequency (Hz)')
+        self.phase_ax.set_ylabel('Phase (rad)')
+        self.phase_ax.set_ylim(-np.pi * 1.1, np.pi * 1.1)
+        for ax in (self.signal_ax, self.amplitude_ax, self.phase_ax):
+            ax.grid(True, alpha=0.3)
+        self.builder_figure.tight_layout()
+
+        # The long series are decimated to the axes width for the range in view
+        self.signal_decimator = LineDecimator(self.signal_line)
+        self.amplitude_decimator = LineDecimator(self.amplitude_line)
+
+        # Controls; edits are coalesced like the wave sliders
+        self.builder_timer = QTimer(self)
+        self.builder_timer.setSingleShot(True)
+        self.builder_timer.setInterval(16)
+        self.builder_timer.timeout.connect(self.update_signal)
+        controls = QGridLayout()
+        self.builder_controls = {}
+
+        def add_control(row, column, label, widget, name):
+            controls.addWidget(QLabel(label), row, 2 * column)
+            controls.addWidget(widget, row, 2 * column + 1)
+            self.builder_controls[name] = widget
+            if isinstance(widget, QComboBox):
+                value = self.builder_params[name]
+                widget.setCurrentText(f"{value:,}" if name == 'samples' else str(value))
+                widget.currentTextChanged.connect(self.schedule_builder_update)
+            else:
+                widget.setValue(self.builder_params[name])
+                widget.valueChanged.connect(self.schedule_builder_update)
+
+        def spin(low, high, step=None, decimals=None):
+            box = QDoubleSpinBox() if decimals is not None else QSpinBox()
+            box.setRange(low, high)
+            if decimals is not None:
+                box.setDecimals(decimals)
+                box.setSingleStep(step)
+            return box
+
+        def combo(items):
+            box = QComboBox()
+            box.addItems([str(item) for item in items])
+            return box
+
+        add_control(0, 0, "Waveform:", combo(HARMONIC_SHAPES), 'shape')
+        add_control(0, 1, "Fundamental (Hz):", spin(1, 5000), 'fundamental')
+        add_control(0, 2, "Harmonics:", spin(1, 500), 'harmonics')
+        add_control(0, 3, "Amplitude:", spin(0, 10, 0.1, 2), 'amplitude')
+        add_control(1, 0, "Carrier:", combo(CARRIERS), 'carrier')
+        add_control(1, 1, "Carrier (Hz):", spin(1, 400_000), 'carrier_freq')
+        add_control(1, 2, "Modulation (Hz):", spin(1, 10_000), 'mod_freq')
+        add_control(1, 3, "AM depth / FM index:", spin(0, 20, 0.1, 2), 'mod_depth')
+        add_control(2, 0, "Noise (σ):", spin(0, 5, 0.01, 3), 'noise')
+        add_control(2, 1, "Samples (1 s):", combo(f"{n:,}" for n in SAMPLE_COUNTS), 'samples')
+        add_control(2, 2, "FFT window:", combo(WINDOWS), 'window')
+        self.builder_status = QLabel()
+        controls.addWidget(self.builder_status, 2, 6, 1, 2)
+        tab_layout.addLayout(controls)
+        self.update_signal()
+
+    def schedule_builder_update(self):
+        """Coalesce builder control edits into one update per display frame"""
+        if not self.builder_timer.isActive():
+            self.builder_timer.start()
+
+    def read_builder_controls(self):
+        params = dict(self.builder_params)
+        for name, widget in self.builder_controls.items():
+            if isinstance(widget, QComboBox):
+                text = widget.currentText()
+                params[name] = int(text.replace(',', '')) if name == 'samples' else text
+            else:
+                params[name] = widget.value()
+        return params
+
+    def update_signal(self):
+        """Synthesize the builder signal and refresh the time and FFT views"""
+        params = self.read_builder_controls()
+        if params == self.builder_params and hasattr(self, 'signal_y'):
+            return
+        self.builder_params = params
+
+        start = time.perf_counter()
+        self.signal_t, self.signal_y, sample_rate = build_signal(**params)
+        self.spectrum_f, amplitude, phase = spectrum(self.signal_y, sample_rate, params['window'])
+        self.spectrum_db = 20 * np.log10(np.maximum(amplitude, 1e-12))
+        elapsed = time.perf_counter() - start
+
+        # Phase is only meaningful for real components: the strongest bins
+        # within 40 dB of the peak, at most a few thousand
+        significant = np.flatnonzero(self.spectrum_db > self.spectrum_db.max() - 40)
+        if len(significant) > 2000:
+            strongest = np.argsort(self.spectrum_db[significant])[-2000:]
+            significant = np.sort(significant[strongest])
+        self.phase_markers.set_data(self.spectrum_f[significant], phase[significant])
+
+        # New data: show it whole, then decimate to the view
+        low, high = self.signal_y.min(), self.signal_y.max()
+        pad = 0.05 * max(high - low, 1e-9)
+        self.signal_ax.set_ylim(low - pad, high + pad)
+        self.amplitude_ax.set_ylim(max(self.spectrum_db.max() - 120, -240), self.spectrum_db.max() + 10)
+        # Frequency axes end a little past the highest significant component
+        top = min(self.spectrum_f[-1], 1.25 * self.spectrum_f[significant[-1]] + 1)
+        self.phase_ax.set_xlim(0, top)
+        self.signal_ax.set_xlim(0, self.signal_t[-1])
+        self.amplitude_ax.set_xlim(0, top)
+        self.signal_decimator.set_data(self.signal_t, self.signal_y)
+        self.amplitude_decimator.set_data(self.spectrum_f, self.spectrum_db)
+
+        self.builder_status.setText(
+            f"{len(self.signal_y):,} samples, synthesis + FFT {elapsed*1000:.0f} ms")
+        self.builder_canvas.draw_idle()
+
+    def on_tab_changed(self, index):
+        """Build the examples tab on its first visit"""
+        if self.tab_widget.widget(index) is self.examples_tab and self.examples_tab.layout() is None:
+            self.create_examples_tab(self.examples_tab)
+
     def create_examples_tab(self, tab):
         """Create the real world examples tab"""
         layout = QVBoxLayout()
@@ -219,22 +591,8 @@ class SinusoidSimulator(QWidget):
         """)
         
         # Add examples
-        examples = [
-            "⚡ Electrical: AC Power Signal (60 Hz)",
-            "⚡ Electrical: Radio Wave Modulation",
-            "⚡ Electrical: Power Factor Analysis",
-            "🔧 Mechanical: Engine Piston Motion",
-            "🔧 Mechanical: Spring-Mass Oscillation",
-            "🔧 Mechanical: Damped Vibration",
-            "🏗️ Civil: Bridge Resonance",
-            "🏗️ Civil: Seismic Wave Analysis",
-            "🏗️ Civil: Wind Load Oscillation",
-            "💻 Computer: Digital Signal Sampling",
-            "💻 Computer: Carrier Wave Modulation",
-            "💻 Computer: Noise Filtering"
-        ]
-        
-        self.example_selector.addItems(examples)
+        _, examples = example_catalog()
+        self.example_selector.addItems([example['name'] for example in examples])
         self.example_selector.currentIndexChanged.connect(self.update_example)
         
         selector_layout.addWidget(selector_label)
@@ -260,10 +618,17 @@ class SinusoidSimulator(QWidget):
         self.example_figure, self.example_ax = plt.subplots(figsize=(12, 4))
         self.example_canvas = FigureCanvas(self.example_figure)
         content_layout.addWidget(self.example_canvas)
+        self.example_ax.grid(True, alpha=0.3)
+        self.example_ax.set_ylim(-3.5, 3.5)
+        self.example_lines = {}
+        self.example_images = {}
+        self.example_index = 0
+        self.example_canvas.mpl_connect('draw_event', self.cache_example_image)
         
         # Add description
         self.example_description = QLabel()
         self.example_description.setWordWrap(True)
+        self.example_description.setTextFormat(Qt.TextFormat.RichText)
         self.example_description.setStyleSheet("""
             QLabel {
                 font-size: 12pt;
@@ -281,10 +646,53 @@ class SinusoidSimulator(QWidget):
         # Initial example
         self.update_example(0)
 
+    def schedule_update(self):
+        """Coalesce slider events into one wave update per display frame"""
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start()
+
+    def create_wave_artists(self):
+        """Create the wave, markers and annotations once; update_wave moves them
+
+        Returns the artists that change with the sliders, which are blitted
+        over the cached static axes.
+        """
+        ax = self.ax
+        self.wave_x = np.linspace(0, 4*np.pi, 1000)
+
+        self.wave_line, = ax.plot([], [], 'b-', linewidth=2)
+        self.amp_line, = ax.plot([], [], 'r--', alpha=0.5)
+        self.offset_line, = ax.plot([0, 4*np.pi], [0, 0], 'g--', alpha=0.5)
+        self.amp_text = ax.annotate('', xy=(0, 0), xytext=(0.2, 0), fontsize=10, color='red')
+        self.period_text = ax.annotate('', xy=(0, 0), xytext=(0, 0), fontsize=10,
+                                       color='blue', arrowprops=dict(arrowstyle='->'))
+        self.phase_text = ax.annotate('', xy=(0, 0), xytext=(0, -2), fontsize=10,
+                                      color='purple', arrowprops=dict(arrowstyle='->'))
+
+        # Static legend, part of the cached background; the current period
+        # and phase are shown by the annotations they label
+        period_handle = Line2D([], [], color='blue')
+        phase_handle = Line2D([], [], color='purple')
+        ax.legend([self.wave_line, self.amp_line, self.offset_line, period_handle, phase_handle],
+                  ['Wave', 'Amplitude', 'Offset', 'Period (T)', 'Phase (φ)'],
+                  loc='upper right')
+
+        self.zero_markers, = ax.plot([], [], 'go', alpha=0.5, label='Zero Crossings')
+        self.peak_markers, = ax.plot([], [], 'ro', alpha=0.5, label='Peaks')
+        self.trough_markers, = ax.plot([], [], 'mo', alpha=0.5, label='Troughs')
+
+        self.freq_text = ax.text(0.02, 0.98, '',
+                                 transform=ax.transAxes,
+                                 verticalalignment='top',
+                                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+        return [self.wave_line, self.amp_line, self.offset_line,
+                self.amp_text, self.period_text, self.phase_text,
+                self.zero_markers, self.peak_markers, self.trough_markers,
+                self.freq_text]
+
     def update_wave(self):
-        """Update wave with enhanced visualizations"""
-        self.setup_plot()
-        
+        """Update the persistent wave artists in place and blit them"""
         # Get values from sliders
         amp = self.amp_slider.value() / 100
         freq = self.freq_slider.value() / 100
@@ -292,72 +700,44 @@ class SinusoidSimulator(QWidget):
         offset = self.offset_slider.value() / 100
         
         # Generate wave
-        x = np.linspace(0, 4*np.pi, 1000)
+        x = self.wave_x
         y = amp * np.sin(freq * x - np.deg2rad(phase_deg)) + offset
+        self.wave_line.set_data(x, y)
         
-        # Plot main wave
-        wave_line, = self.ax.plot(x, y, 'b-', linewidth=2, label='Sine Wave')
-        
-        # Add amplitude markers
-        max_point = np.max(y)
-        min_point = np.min(y)
+        # Amplitude markers
+        max_point = offset + amp
+        min_point = offset - amp
         mid_point = offset
-        
-        # Draw amplitude lines and markers
-        self.ax.vlines(x[0], mid_point, max_point, colors='r', linestyles='--', alpha=0.5)
-        self.ax.vlines(x[0], mid_point, min_point, colors='r', linestyles='--', alpha=0.5)
-        self.ax.hlines(mid_point, 0, 4*np.pi, colors='g', linestyles='--', alpha=0.5)
-        
-        # Add amplitude annotations
-        self.ax.annotate(f'A = {amp:.2f}', 
-                        xy=(x[0], max_point),
-                        xytext=(x[0] + 0.2, max_point),
-                        fontsize=10,
-                        color='red')
-        
-        # Mark period
-        period = 2*np.pi/freq
-        self.ax.annotate(f'T = {period:.2f}',
-                        xy=(period, offset),
-                        xytext=(period, offset - 0.5),
-                        fontsize=10,
-                        color='blue',
-                        arrowprops=dict(arrowstyle='->'))
+        self.amp_line.set_data([x[0], x[0]], [min_point, max_point])
+        self.offset_line.set_ydata([mid_point, mid_point])
+        self.amp_text.set_text(f'A = {amp:.2f}')
+        self.amp_text.xy = (x[0], max_point)
+        self.amp_text.set_position((x[0] + 0.2, max_point))
+        
+        # Mark period (undefined at zero frequency)
+        period = 2*np.pi/freq if freq > 0 else np.inf
+        self.period_text.set_visible(freq > 0)
+        if freq > 0:
+            self.period_text.set_text(f'T = {period:.2f}')
+            self.period_text.xy = (period, offset)
+            self.period_text.set_position((period, offset - 0.5))
         
         # Show phase shift
-        if phase_deg != 0:
-            phase_shift = np.deg2rad(phase_deg)
-            shift_point = -phase_shift/freq
-            self.ax.annotate(f'φ = {phase_deg}°',
-                            xy=(0, 0),
-                            xytext=(shift_point, -2),
-                            fontsize=10,
-                            color='purple',
-                            arrowprops=dict(arrowstyle='->'))
-        
-        # Add legend for key components
-        self.ax.legend(['Wave',
-                       'Amplitude',
-                       'Offset',
-                       f'Period (T={period:.2f})',
-                       f'Phase (φ={phase_deg}°)'])
-        
-        # Add key points markers
-        zero_crossings = x[np.where(np.abs(y - offset) < 0.01)]
-        peaks = x[np.where(np.abs(y - max_point) < 0.01)]
-        troughs = x[np.where(np.abs(y - min_point) < 0.01)]
-        
-        self.ax.plot(zero_crossings, [offset]*len(zero_crossings), 'go', alpha=0.5, label='Zero Crossings')
-        self.ax.plot(peaks, [max_point]*len(peaks), 'ro', alpha=0.5, label='Peaks')
-        self.ax.plot(troughs, [min_point]*len(troughs), 'mo', alpha=0.5, label='Troughs')
-        
-        # Add frequency information
+        self.phase_text.set_visible(phase_deg != 0 and freq > 0)
+        if phase_deg != 0 and freq > 0:
+            shift_point = -np.deg2rad(phase_deg)/freq
+            self.phase_text.set_text(f'φ = {phase_deg}°')
+            self.phase_text.set_position((shift_point, -2))
+        
+        # Key points markers, solved exactly rather than searched in the samples
+        points = sinusoid_key_points(amp, freq, np.deg2rad(phase_deg), offset, x[0], x[-1])
+        self.zero_markers.set_data(*points['zero_crossings'])
+        self.peak_markers.set_data(*points['peaks'])
+        self.trough_markers.set_data(*points['troughs'])
+        
+        # Frequency information
         angular_freq = freq * 2 * np.pi
-        self.ax.text(0.02, 0.98, 
-                    f'f = {freq:.2f} Hz\nω = {angular_freq:.2f} rad/s', 
-                    transform=self.ax.transAxes,
-                    verticalalignment='top',
-                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        self.freq_text.set_text(f'f = {freq:.2f} Hz\nω = {angular_freq:.2f} rad/s')
         
         # Update parameters display
         self.params_label.setText(
@@ -381,180 +761,48 @@ class SinusoidSimulator(QWidget):
             f"y = {amp:.2f} · sin(2π · {freq:.2f}t - {phase_deg}°) {offset_str}"
         )
         
-        # Refresh canvas
-        self.canvas.draw()
+        # Blit the changed artists; before the first full draw there is no
+        # cached background yet, so let the event loop draw the canvas once
+        if self.canvas.isVisible():
+            self.blit_manager.update()
+        else:
+            self.canvas.draw_idle()
 
     def update_example(self, index):
-        """Update the example display based on selection"""
-        self.example_ax.clear()
-        t = np.linspace(0, 4*np.pi, 1000)
-        
-        examples = {
-            0: {  # AC Power
-                'wave': 3*np.sin(2*np.pi*60*t/100),
-                'title': '⚡ AC Power Signal (60 Hz)',
-                'description': """
-                <h3 style='color: #2980b9;'>Electrical Engineering: AC Power</h3>
-                <p>Standard household electricity follows this sinusoidal pattern:</p>
-                • Voltage: 120V RMS (170V peak)<br>
-                • Frequency: 60 Hz (US standard)<br>
-                • Complete cycle every 1/60th second<br>
-                • Powers homes and industries worldwide
-                """
-            },
-            1: {  # Radio Wave
-                'wave': (1 + 0.3*np.sin(t)) * np.sin(10*t),
-                'title': '⚡ AM Radio Wave Modulation',
-                'description': """
-                <h3 style='color: #2980b9;'>Electrical Engineering: Radio Communication</h3>
-                <p>Amplitude Modulation (AM) combines carrier and signal waves:</p>
-                • Carrier wave: High frequency<br>
-                • Signal wave: Information to transmit<br>
-                • Modulation depth: 30%<br>
-                • Used in broadcasting and communication
-                """
-            },
-            2: {  # Power Factor
-                'wave': np.sin(t) + np.sin(t + np.pi/4),
-                'title': '⚡ Power Factor Analysis',
-                'description': """
-                <h3 style='color: #2980b9;'>Electrical Engineering: Power Factor</h3>
-                <p>Phase difference between voltage and current waves:</p>
-                • Voltage and current signals<br>
-                • Phase shift indicates power factor<br>
-                • Critical for power efficiency<br>
-                • Important in industrial applications
-                """
-            },
-            3: {  # Engine Piston
-                'wave': 2*np.cos(t) + 0.2*np.cos(3*t),
-                'title': '🔧 Engine Piston Motion',
-                'description': """
-                <h3 style='color: #2980b9;'>Mechanical Engineering: Piston Motion</h3>
-                <p>Piston displacement in an engine cylinder:</p>
-                • Primary motion: Sinusoidal<br>
-                • Harmonics from mechanical linkages<br>
-                • Critical for engine timing<br>
-                • Basis for engine dynamics
-                """
-            },
-            4: {  # Spring-Mass
-                'wave': 2*np.sin(2*t)*np.exp(-t/8),
-                'title': '🔧 Spring-Mass Oscillation',
-                'description': """
-                <h3 style='color: #2980b9;'>Mechanical Engineering: Spring-Mass System</h3>
-                <p>Natural oscillation with damping:</p>
-                • Natural frequency determined by mass and spring<br>
-                • Damping from friction and air resistance<br>
-                • Amplitude decreases over time<br>
-                • Fundamental mechanical system
-                """
-            },
-            5: {  # Damped Vibration
-                'wave': np.exp(-t/2)*np.sin(4*t),
-                'title': '🔧 Damped Mechanical Vibration',
-                'description': """
-                <h3 style='color: #2980b9;'>Mechanical Engineering: Damped Vibration</h3>
-                <p>Vibration analysis in mechanical systems:</p>
-                • Exponential decay envelope<br>
-                • Critical for machine design<br>
-                • Used in shock absorber design<br>
-                • Important for structural safety
-                """
-            },
-            6: {  # Bridge Resonance
-                'wave': np.sin(t) + 0.5*np.sin(2*t) + 0.2*np.sin(3*t),
-                'title': '🏗️ Bridge Resonance',
-                'description': """
-                <h3 style='color: #2980b9;'>Civil Engineering: Bridge Dynamics</h3>
-                <p>Multiple frequency components in bridge motion:</p>
-                • Fundamental mode and harmonics<br>
-                • Wind and traffic induced vibrations<br>
-                • Critical for bridge design<br>
-                • Safety monitoring parameter
-                """
-            },
-            7: {  # Seismic Waves
-                'wave': np.exp(-t/3)*(np.sin(8*t) + 0.5*np.sin(15*t)),
-                'title': '🏗️ Seismic Wave Analysis',
-                'description': """
-                <h3 style='color: #2980b9;'>Civil Engineering: Seismic Analysis</h3>
-                <p>Earthquake ground motion patterns:</p>
-                • Multiple frequency components<br>
-                • Rapid initial motion<br>
-                • Gradual damping<br>
-                • Used in structural design
-                """
-            },
-            8: {  # Wind Load
-                'wave': 2*np.sin(t/2) + 0.5*np.random.randn(len(t)),
-                'title': '🏗️ Wind Load Oscillation',
-                'description': """
-                <h3 style='color: #2980b9;'>Civil Engineering: Wind Effects</h3>
-                <p>Wind-induced structural motion:</p>
-                • Base oscillation from wind<br>
-                • Random turbulence components<br>
-                • Critical for tall structures<br>
-                • Used in facade design
-                """
-            },
-            9: {  # Digital Sampling
-                'wave': np.sin(3*t) + np.where(np.mod(t, 0.5) < 0.1, 0.3, 0),
-                'title': '💻 Digital Signal Sampling',
-                'description': """
-                <h3 style='color: #2980b9;'>Computer Engineering: Signal Sampling</h3>
-                <p>Analog to digital conversion process:</p>
-                • Continuous signal<br>
-                • Sampling points<br>
-                • Quantization effects<br>
-                • Nyquist sampling theorem
-                """
-            },
-            10: {  # Carrier Wave
-                'wave': np.sin(20*t) * np.sign(np.sin(2*t)),
-                'title': '💻 Digital Carrier Modulation',
-                'description': """
-                <h3 style='color: #2980b9;'>Computer Engineering: Digital Communication</h3>
-                <p>Digital data modulation techniques:</p>
-                • Carrier signal<br>
-                • Digital data encoding<br>
-                • Binary phase shifts<br>
-                • Used in digital communications
-                """
-            },
-            11: {  # Noise Filtering
-                'wave': np.sin(3*t) + 0.3*np.random.randn(len(t)),
-                'title': '💻 Signal Noise Filtering',
-                'description': """
-                <h3 style='color: #2980b9;'>Computer Engineering: Noise Reduction</h3>
-                <p>Digital signal processing for noise removal:</p>
-                • Original signal with noise<br>
-                • Random noise components<br>
-                • Filtering techniques<br>
-                • Signal recovery methods
-                """
-            }
-        }
-        
-        example = examples.get(index, examples[0])
-        
-        # Plot with consistent styling
-        self.example_ax.plot(t, example['wave'], 'b-', linewidth=2)
+        """Show one example; its figure is rendered once per canvas size"""
+        t, examples = example_catalog()
+        example = examples[index] if 0 <= index < len(examples) else examples[0]
+        self.example_index = index
+
+        # One line per example, created the first time it is shown
+        for line in self.example_lines.values():
+            line.set_visible(False)
+        if index not in self.example_lines:
+            self.example_lines[index], = self.example_ax.plot(t, example['wave'], 'b-', linewidth=2)
+        self.example_lines[index].set_visible(True)
         self.example_ax.set_title(example['title'], fontsize=14, pad=10)
-        self.example_ax.grid(True, alpha=0.3)
-        self.example_ax.set_ylim(-3.5, 3.5)
-        
+
         # Update description
         self.example_description.setText(example['description'])
-        self.example_description.setTextFormat(Qt.TextFormat.RichText)
-        
-        # Refresh canvas
-        self.example_canvas.draw()
+
+        # Restore the cached rendering, or draw (which caches it)
+        image = self.example_images.get((index, self.example_figure.bbox.bounds))
+        if image is None:
+            self.example_canvas.draw()
+        else:
+            self.example_canvas.restore_region(image)
+            self.example_canvas.blit(self.example_figure.bbox)
+
+    def cache_example_image(self, event):
+        """Keep the pixels of the example just drawn, for the current size only"""
+        size = self.example_figure.bbox.bounds
+        self.example_images = {key: image for key, image in self.example_images.items()
+                               if key[1] == size}
+        self.example_images[(self.example_index, size)] = \
+            self.example_canvas.copy_from_bbox(self.example_figure.bbox)
 
     def setup_plot(self):
-        """Enhanced plot setup with better visualization aids"""
-        self.ax.clear()
-        
+        """Static axes setup: grid, π ticks, limits and labels (done once)"""
         # Set up grid with π markings
         self.ax.grid(True, which='major', linestyle='-', alpha=0.3)
         self.ax.grid(True, which='minor', linestyle=':', alpha=0.2)